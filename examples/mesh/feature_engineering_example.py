@@ -112,4 +112,22 @@ array_img = plot_field(
     title="SDF error computation",
     scalar_bar_args={"title": "sdf error"},
     interactive = False
-)
\ No newline at end of file
+)
+
+# %% [markdown]
+# ## Distances to tagged boundaries
+#
+# Exact distances to each tagged part of the boundary, such as the holes or the external boundary, are computed together by `compute_tag_distances`, from a single query of the skin of the mesh labelled by tag.
+
+# %%
+from plaid_ops.mesh.feature_engineering import compute_tag_distances
+
+tag_distances = compute_tag_distances(sample, tags=["Holes", "Ext_bound"])
+
+array_img = plot_field(
+    sample,
+    field=tag_distances["Holes"],
+    title="Distance to the holes",
+    scalar_bar_args={"title": "distance_Holes"},
+    interactive = False
+)
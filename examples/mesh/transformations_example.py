@@ -127,6 +127,20 @@ print(
     f"u1 error norm from projection and inverse projection = {np.linalg.norm(error_1)}"
 )
 
+# %% [markdown]
+# When the same mesh/grid pair is used repeatedly, for instance to map model predictions back onto the initial mesh at inference time, a `RegularGridProjector` assembles the forward operator and a fast multilinear inverse operator once, then only applies sparse matrix products:
+
+# %%
+from plaid_ops.mesh.transformations import RegularGridProjector
+
+projector = RegularGridProjector(dataset[ids[0]], dimensions=dims, bbox=bbox)
+u1 = dataset[ids[0]].get_field("u1")
+error_3 = projector.backward(projector.forward(u1)) - u1
+
+print(
+    f"u1 error norm from projector round trip = {np.linalg.norm(error_3)}"
+)
+
 # %% [markdown]
 # Now, we compare our approach with a more naive one that relies on the value of the field on the nearest node in the input mesh:
 
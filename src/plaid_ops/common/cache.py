@@ -0,0 +1,344 @@
+"""Module implementing caching utilities shared by plaid-ops operations."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Union
+
+import numpy as np
+from plaid.types import Array
+
+
+class LRUCache:
+    """Least-recently-used mapping with a bound on the number of entries.
+
+    When a new entry is added to a full cache, the entry that has not been
+    accessed for the longest time is evicted.
+
+    Args:
+        maxsize (int, optional): Maximum number of entries kept in the cache. Defaults to 128.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        assert maxsize > 0, "`maxsize` should be a positive integer"
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """Return the value stored under `key` and mark it as recently used.
+
+        Args:
+            key (Hashable): The key to look up.
+            default (Optional[Any], optional): Value returned if `key` is not in the cache. Defaults to None.
+
+        Returns:
+            Optional[Any]: The cached value, or `default` if `key` is not in the cache.
+        """
+        if key not in self._data:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store `value` under `key`, evicting the least recently used entries if needed.
+
+        Args:
+            key (Hashable): The key under which to store the value.
+            value (Any): The value to store.
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the hit/miss counters."""
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return whether `key` is in the cache, without marking it as used."""
+        return key in self._data
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache."""
+        return len(self._data)
+
+
+def _checksum(array: np.ndarray) -> str:
+    return hashlib.blake2b(np.ascontiguousarray(array), digest_size=16).hexdigest()
+
+
+class DiskCache:
+    """Persistent on-disk store of named arrays, with integrity checks and size-based eviction.
+
+    Each entry is a directory named after a hash of its key, holding one `.npy` file per
+    array and a `meta.json` file with the key, and the sizes and checksums of the array
+    files computed when writing them. Entries are written atomically, so that several
+    processes can share a cache directory, and arrays are loaded memory-mapped.
+
+    When loading an entry, the sizes of its files are checked against `meta.json`, which
+    detects truncated or partially written files without reading them. Checksums are only
+    verified with `verify=True`, since this reads the whole arrays and defeats memory
+    mapping. Corrupted entries are removed and reported as misses.
+
+    When the total size of the entries exceeds `max_bytes`, the least recently used
+    entries are removed.
+
+    Args:
+        directory (Union[str, Path]): The cache directory, created if needed.
+        max_bytes (Optional[int], optional): Maximum total size of the cache, in bytes. If None, the cache is unbounded.
+        verify (bool, optional): If True, the checksums of the arrays are also verified when loading an entry. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: Optional[int] = None,
+        verify: bool = False,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.verify = verify
+
+    def _entry_path(self, key: Hashable) -> Path:
+        return (
+            self.directory
+            / hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        )
+
+    def get(self, key: Hashable) -> Optional[Dict[str, np.ndarray]]:
+        """Load the arrays stored under `key`.
+
+        Args:
+            key (Hashable): The key to look up. Its `repr` identifies the entry.
+
+        Returns:
+            Optional[Dict[str, np.ndarray]]: The memory-mapped arrays, or None if `key` is not in the cache or its entry is corrupted.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path / "meta.json") as file:
+                meta = json.load(file)
+            if meta["key"] != repr(key):
+                return None
+            corrupted = any(
+                (path / f"{name}.npy").stat().st_size != size
+                for name, size in meta["sizes"].items()
+            )
+            if not corrupted:
+                arrays = {
+                    name: np.load(path / f"{name}.npy", mmap_mode="r")
+                    for name in meta["sizes"]
+                }
+        except (OSError, ValueError, KeyError):
+            return None
+        if corrupted or (
+            self.verify
+            and any(
+                _checksum(arrays[name]) != checksum
+                for name, checksum in meta["checksums"].items()
+            )
+        ):
+            shutil.rmtree(path, ignore_errors=True)
+            return None
+        os.utime(path / "meta.json")
+        return arrays
+
+    def put(self, key: Hashable, arrays: Dict[str, Array]) -> None:
+        """Store arrays under `key`, then evict old entries if the cache is too large.
+
+        Args:
+            key (Hashable): The key under which to store the arrays. Its `repr` identifies the entry.
+            arrays (Dict[str, Array]): The arrays to store, by name.
+        """
+        path = self._entry_path(key)
+        tmp_path = Path(tempfile.mkdtemp(dir=self.directory, prefix=".tmp"))
+        sizes, checksums = {}, {}
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            np.save(tmp_path / f"{name}.npy", array)
+            sizes[name] = (tmp_path / f"{name}.npy").stat().st_size
+            checksums[name] = _checksum(array)
+        with open(tmp_path / "meta.json", "w") as file:
+            json.dump({"key": repr(key), "sizes": sizes, "checksums": checksums}, file)
+        shutil.rmtree(path, ignore_errors=True)
+        try:
+            os.replace(tmp_path, path)
+        except (
+            OSError
+        ):  # pragma: no cover (entry concurrently written by another process)
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        self.evict()
+
+    def _entries(self) -> list:
+        return [
+            path
+            for path in self.directory.iterdir()
+            if path.is_dir() and not path.name.startswith(".tmp")
+        ]
+
+    def size(self) -> int:
+        """Return the total size of the cache entries, in bytes."""
+        return sum(
+            file.stat().st_size for path in self._entries() for file in path.iterdir()
+        )
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits in `max_bytes`."""
+        if self.max_bytes is None:
+            return
+        entries = []
+        for path in self._entries():
+            try:
+                size = sum(file.stat().st_size for file in path.iterdir())
+                last_used = (path / "meta.json").stat().st_mtime
+            except OSError:  # pragma: no cover (entry concurrently removed)
+                continue
+            entries.append((last_used, size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        for path in self._entries():
+            shutil.rmtree(path, ignore_errors=True)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return whether an entry exists for `key`, without loading or verifying it."""
+        return (self._entry_path(key) / "meta.json").is_file()
+
+    def __len__(self) -> int:
+        """Return the number of entries in the cache."""
+        return len(self._entries())
+
+
+class ArrayCache:
+    """Least-recently-used cache of arrays, optionally persisted on disk.
+
+    Arrays are keyed by the caller, typically with fingerprints of the data they are
+    computed from. If `cache_dir` is provided, arrays are also stored there, and loaded
+    memory-mapped (read-only) on later runs; the key should then identify the computation
+    across versions of the libraries involved.
+
+    `hits` counts the lookups served from the cache, among which `disk_hits` were loaded
+    from disk, and `misses` those that required computing the value. Subclasses caching
+    other values made of arrays override `_to_arrays` and `_from_arrays`.
+
+    When pickled, for instance to be sent to worker processes, the cache drops its
+    in-memory arrays but keeps its persistent cache directory.
+
+    Args:
+        maxsize (int, optional): Maximum number of arrays kept in memory. Defaults to 128.
+        cache_dir (Optional[Union[str, Path]], optional): Directory of the persistent cache. If None, arrays are only cached in memory.
+        max_disk_bytes (Optional[int], optional): Maximum size of the persistent cache, in bytes. If None, the persistent cache is unbounded.
+        verify (bool, optional): If True, the checksums of the arrays loaded from disk are verified, see `DiskCache`. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_disk_bytes: Optional[int] = None,
+        verify: bool = False,
+    ):
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._memory = LRUCache(maxsize)
+        self._disk = (
+            DiskCache(cache_dir, max_bytes=max_disk_bytes, verify=verify)
+            if cache_dir is not None
+            else None
+        )
+
+    def _disk_key(self, key: Hashable) -> Hashable:
+        return key
+
+    def _to_arrays(self, value: Any) -> Dict[str, Array]:
+        return {"value": value}
+
+    def _from_arrays(self, arrays: Dict[str, np.ndarray]) -> Any:
+        return arrays["value"]
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the array stored under `key`, in memory or on disk.
+
+        Args:
+            key (Hashable): The key identifying the array.
+
+        Returns:
+            Optional[Any]: The cached array, or None if `key` is not in the cache.
+        """
+        value = self._memory.get(key)
+        if value is None and self._disk is not None:
+            arrays = self._disk.get(self._disk_key(key))
+            if arrays is not None:
+                value = self._from_arrays(arrays)
+                self._memory.put(key, value)
+                self.disk_hits += 1
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store an array under `key`, in memory and on disk.
+
+        Args:
+            key (Hashable): The key identifying the array.
+            value (Any): The array to store.
+        """
+        self._memory.put(key, value)
+        if self._disk is not None:
+            self._disk.put(self._disk_key(key), self._to_arrays(value))
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the array stored under `key`, computing it with `compute` on a miss.
+
+        Args:
+            key (Hashable): The key identifying the array.
+            compute (Callable[[], Any]): Function computing the array.
+
+        Returns:
+            Any: The array.
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def __getstate__(self) -> dict:
+        """Return the state sent to worker processes, without the in-memory arrays."""
+        state = self.__dict__.copy()
+        state["_memory"] = LRUCache(self._memory.maxsize)
+        return state
+
+    def clear(self) -> None:
+        """Remove all cached arrays, in memory and on disk, and reset the hit/miss counters."""
+        self._memory.clear()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if self._disk is not None:
+            self._disk.clear()
+
+    def __len__(self) -> int:
+        """Return the number of arrays in memory."""
+        return len(self._memory)
@@ -0,0 +1,298 @@
+"""Module implementing a memoized conversion of CGNS trees to Muscat meshes."""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from Muscat.Bridges.CGNSBridge import CGNSToMesh
+from Muscat.MeshContainers.Mesh import Mesh
+from plaid.containers.sample import Sample
+from plaid.types import CGNSTree
+
+from plaid_ops.mesh.reader import MeshView, read_node_fields
+
+
+def _is_selected(
+    base: list,
+    zone: list,
+    base_names: Optional[Sequence[str]],
+    zone_names: Optional[Sequence[str]],
+) -> bool:
+    return (
+        base[3] == "CGNSBase_t"
+        and zone[3] == "Zone_t"
+        and (base_names is None or base[0] in base_names)
+        and (zone_names is None or zone[0] in zone_names)
+    )
+
+
+def _geometry_tree(
+    tree: CGNSTree,
+    base_names: Optional[Sequence[str]] = None,
+    zone_names: Optional[Sequence[str]] = None,
+) -> Tuple[CGNSTree, List[np.ndarray]]:
+    # Shallow copy of the tree without the flow solutions of the selected zones, sharing
+    # its arrays, and the arrays of the geometry, connectivity and tags of these zones
+    arrays: List[np.ndarray] = []
+
+    def walk(node: list) -> None:
+        if isinstance(node[1], np.ndarray):
+            arrays.append(node[1])
+        for child in node[2]:
+            walk(child)
+
+    bases = []
+    for base in tree[2]:
+        zones = []
+        for zone in base[2]:
+            if _is_selected(base, zone, base_names, zone_names):
+                children = [child for child in zone[2] if child[3] != "FlowSolution_t"]
+                zone = [zone[0], zone[1], children, zone[3]]
+                walk(zone)
+            zones.append(zone)
+        bases.append([base[0], base[1], zones, base[3]])
+    return [tree[0], tree[1], bases, tree[3]], arrays
+
+
+def _nbytes(mesh: Mesh, arrays: List[np.ndarray]) -> int:
+    # Size of the retained arrays, counting the memory shared by several arrays once
+    arrays = arrays + [mesh.nodes, mesh.originalIDNodes]
+    for elements in mesh.elements.values():
+        arrays += [elements.connectivity, elements.originalIds]
+        arrays += [tag.GetIds() for tag in elements.tags]
+    arrays += [tag.GetIds() for tag in mesh.nodesTags]
+    buffers = {}
+    for array in arrays:
+        if array is None:
+            continue
+        array = np.asarray(array)
+        base = array if array.base is None else array.base
+        buffers[id(base)] = getattr(base, "nbytes", array.nbytes)
+    return sum(buffers.values())
+
+
+class MeshConversionCache:
+    """Least-recently-used cache of the Muscat meshes converted from CGNS trees.
+
+    Conversions are keyed by the identity of the tree, e.g. the tree returned by
+    `sample.get_mesh(time)`, and by the base and zone selection. Only the geometry of the
+    selected zones is converted and cached: a cached mesh is reused as long as these zones
+    hold the very same coordinate, element connectivity and tag arrays as when it was
+    converted, whatever their fields. Replacing a tree, or adding, removing or replacing
+    such an array, triggers a new conversion; arrays modified in place are not detected.
+
+    The nodal fields of the selected zones are read from the tree on each call, with
+    `read_node_fields`, and attached to a shallow copy of the cached mesh; element fields
+    are not converted. Entries are evicted when the cache holds more than `maxsize` meshes,
+    or when the total size of the arrays they retain, i.e. the geometry arrays of the trees
+    and the converted meshes, exceeds `max_bytes`. The meshes returned are shared between
+    callers, and must not be modified; a shallow `copy.copy` can be used to replace their
+    fields.
+
+    Entries retain the geometry arrays they are checked against, so that a tree reusing the
+    `id` of a garbage-collected one cannot match a stale entry unless it shares its arrays.
+    Lookups and updates are guarded by a lock, so that the cache can be shared by threads;
+    the parallel functions of plaid-ops are however only supported with process pools, each
+    worker process then using its own cache.
+
+    Args:
+        maxsize (int, optional): Maximum number of meshes kept in the cache. Defaults to 16.
+        max_bytes (Optional[int], optional): Maximum total size of the arrays retained by the cache, in bytes. If None, only `maxsize` bounds the cache. Defaults to 1 GiB.
+    """
+
+    def __init__(self, maxsize: int = 16, max_bytes: Optional[int] = 2**30):
+        assert maxsize > 0, "`maxsize` should be a positive integer"
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def convert(
+        self,
+        tree: CGNSTree,
+        base_names: Optional[Sequence[str]] = None,
+        zone_names: Optional[Sequence[str]] = None,
+    ) -> Mesh:
+        """Return the Muscat mesh of a CGNS tree, converting it with `CGNSToMesh` on a miss.
+
+        Args:
+            tree (CGNSTree): The CGNS tree to convert.
+            base_names (Optional[Sequence[str]], optional): The base names to convert. If None, uses all bases.
+            zone_names (Optional[Sequence[str]], optional): The zone names to convert. If None, uses all zones.
+
+        Returns:
+            Mesh: The converted mesh, with the current nodal fields of the tree, shared with other callers.
+        """
+        key = (
+            id(tree),
+            tuple(base_names) if base_names is not None else None,
+            tuple(zone_names) if zone_names is not None else None,
+        )
+        geometry_tree, arrays = _geometry_tree(tree, base_names, zone_names)
+        with self._lock:
+            entry = self._data.get(key)
+            if (
+                entry is not None
+                and len(entry[0]) == len(arrays)
+                and all(a is b for a, b in zip(entry[0], arrays))
+            ):
+                self.hits += 1
+                self._data.move_to_end(key)
+                mesh = entry[1]
+            else:
+                self.misses += 1
+                mesh = None
+        if mesh is None:
+            mesh = CGNSToMesh(
+                geometry_tree,
+                baseNames=list(base_names) if base_names is not None else None,
+                zoneNames=list(zone_names) if zone_names is not None else None,
+            )
+            nbytes = _nbytes(mesh, arrays)
+            with self._lock:
+                self._remove(key)
+                self._data[key] = (arrays, mesh, nbytes)
+                self.nbytes += nbytes
+                while len(self._data) > self.maxsize or (
+                    self.max_bytes is not None and self.nbytes > self.max_bytes
+                ):
+                    self._remove(next(iter(self._data)))
+
+        node_fields = read_node_fields(tree, base_names, zone_names)
+        if node_fields:
+            mesh = copy.copy(mesh)
+            mesh.nodeFields = node_fields
+        return mesh
+
+    def _remove(self, key) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def clear(self) -> None:
+        """Remove all meshes and reset the hit/miss counters."""
+        with self._lock:
+            self._data.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __getstate__(self) -> dict:
+        """Return the state sent to worker processes, without the cached meshes."""
+        state = self.__dict__.copy()
+        state["_data"] = OrderedDict()
+        state["nbytes"] = 0
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the state sent to worker processes, with a new lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of meshes in the cache."""
+        return len(self._data)
+
+
+_default_cache = MeshConversionCache()
+
+
+def get_mesh_conversion_cache() -> MeshConversionCache:
+    """Return the conversion cache shared by all plaid-ops operations.
+
+    Its `maxsize` and `max_bytes` attributes can be changed to tune its memory budget,
+    and it can be emptied with `clear`.
+
+    Returns:
+        MeshConversionCache: The shared conversion cache.
+    """
+    return _default_cache
+
+
+def cgns_to_mesh(
+    tree: CGNSTree,
+    base_names: Optional[Sequence[str]] = None,
+    zone_names: Optional[Sequence[str]] = None,
+) -> Mesh:
+    """Convert a CGNS tree to a Muscat mesh through the shared conversion cache.
+
+    Args:
+        tree (CGNSTree): The CGNS tree to convert.
+        base_names (Optional[Sequence[str]], optional): The base names to convert. If None, uses all bases.
+        zone_names (Optional[Sequence[str]], optional): The zone names to convert. If None, uses all zones.
+
+    Returns:
+        Mesh: The converted mesh, which must not be modified.
+    """
+    return _default_cache.convert(tree, base_names, zone_names)
+
+
+def load_mesh(
+    tree: CGNSTree,
+    base_names: Optional[Sequence[str]] = None,
+    zone_names: Optional[Sequence[str]] = None,
+    nodes_only: bool = False,
+) -> Union[Mesh, MeshView]:
+    """Load the mesh of a CGNS tree, without conversion when only its nodes are needed.
+
+    Args:
+        tree (CGNSTree): The CGNS tree to load.
+        base_names (Optional[Sequence[str]], optional): The base names to load. If None, uses all bases.
+        zone_names (Optional[Sequence[str]], optional): The zone names to load. If None, uses all zones.
+        nodes_only (bool, optional): If True, only the node coordinates and nodal fields are needed, as for nearest-neighbour transfers: a `MeshView` is returned when the zones can be read without conversion. Defaults to False.
+
+    Returns:
+        Union[Mesh, MeshView]: The `MeshView` of the selected zones, or their Muscat mesh converted through the shared conversion cache, which must not be modified.
+    """
+    if nodes_only:
+        try:
+            return MeshView(tree, base_names, zone_names)
+        except ValueError:
+            pass
+    return cgns_to_mesh(tree, base_names, zone_names)
+
+
+def tree_to_mesh(
+    tree: CGNSTree,
+    base_name: Optional[str] = None,
+    zone_name: Optional[str] = None,
+) -> Mesh:
+    """Convert a single base and zone of a CGNS tree through the shared conversion cache.
+
+    Args:
+        tree (CGNSTree): The CGNS tree to convert.
+        base_name (Optional[str], optional): Name of the base to convert. If None, all bases are used.
+        zone_name (Optional[str], optional): Name of the zone to convert. If None, all zones are used.
+
+    Returns:
+        Mesh: The converted mesh, which must not be modified.
+    """
+    base_names: Optional[List[str]] = [base_name] if base_name is not None else None
+    zone_names: Optional[List[str]] = [zone_name] if zone_name is not None else None
+    return cgns_to_mesh(tree, base_names, zone_names)
+
+
+def sample_to_mesh(
+    sample: Sample,
+    time: Optional[float] = None,
+    base_name: Optional[str] = None,
+    zone_name: Optional[str] = None,
+) -> Mesh:
+    """Convert the mesh of a Sample to a Muscat mesh through the shared conversion cache.
+
+    Args:
+        sample (Sample): The input Sample containing the mesh.
+        time (Optional[float], optional): Simulation time to extract the mesh. If None, uses default.
+        base_name (Optional[str], optional): Name of the base to convert. If None, all bases are used.
+        zone_name (Optional[str], optional): Name of the zone to convert. If None, all zones are used.
+
+    Returns:
+        Mesh: The converted mesh, which must not be modified.
+    """
+    return tree_to_mesh(sample.get_mesh(time), base_name, zone_name)
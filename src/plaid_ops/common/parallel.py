@@ -0,0 +1,91 @@
+"""Module implementing chunked parallel execution of per-sample operations."""
+
+import math
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+from tqdm import tqdm
+
+
+def _apply_chunk(func: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    return [func(item) for item in chunk]
+
+
+def map_in_chunks(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    total: int,
+    n_workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None,
+    verbose: bool = False,
+) -> Iterator[Any]:
+    """Apply a function to items, possibly in parallel, and yield the results in the order of the items.
+
+    With `n_workers=1` and no `executor`, items are processed serially in the calling process.
+    Otherwise, items are sent in chunks to the executor (a process pool with `n_workers`
+    workers by default). At most two chunks per worker are in flight at any time, so that
+    results are streamed without materializing all of them. In that case, `func` and the
+    items must be picklable. A given `executor` should be a process pool with `n_workers`
+    workers: the caches of plaid-ops are not meant to be shared between threads.
+
+    Args:
+        func (Callable[[Any], Any]): The function to apply to each item.
+        items (Iterable[Any]): The items to process.
+        total (int): The number of items, used for chunking and progress reporting.
+        n_workers (int, optional): Number of worker processes. With an `executor`, it is required, should be its number of workers, and bounds the number of chunks in flight. Defaults to 1.
+        executor (Optional[Executor], optional): Executor used to process the chunks, with `n_workers > 1` workers. If None and `n_workers > 1`, a process pool is created and shut down on completion.
+        chunksize (Optional[int], optional): Number of items per chunk. If None, items are split in about four chunks per worker.
+        verbose (bool, optional): If True, shows progress bar. Defaults to False.
+
+    Yields:
+        Any: The result of `func` for each item, in the order of `items`.
+    """
+    assert executor is None or n_workers > 1, (
+        "`n_workers` should be given with `executor`, as its number of workers"
+    )
+
+    with tqdm(total=total, disable=not verbose) as pbar:
+        if n_workers == 1 and executor is None:
+            for item in items:
+                yield func(item)
+                pbar.update(1)
+            return
+
+        if chunksize is None:
+            chunksize = max(1, math.ceil(total / (4 * n_workers)))
+
+        owned_executor = executor is None
+        if owned_executor:
+            executor = ProcessPoolExecutor(max_workers=n_workers)
+        try:
+            iterator = iter(items)
+            pending = deque()
+            counted = set()
+
+            def submit() -> None:
+                chunk = list(islice(iterator, chunksize))
+                if chunk:
+                    pending.append(
+                        (executor.submit(_apply_chunk, func, chunk), len(chunk))
+                    )
+
+            for _ in range(2 * n_workers):
+                submit()
+
+            while pending:
+                wait([future for future, _ in pending], return_when=FIRST_COMPLETED)
+                for future, size in pending:
+                    if future.done() and future not in counted:
+                        counted.add(future)
+                        pbar.update(size)
+                while pending and pending[0][0].done():
+                    future, _ = pending.popleft()
+                    counted.discard(future)
+                    submit()
+                    yield from future.result()
+        finally:
+            if owned_executor:
+                executor.shutdown(cancel_futures=True)
@@ -2,12 +2,33 @@
 
 from typing import Optional
 
+import numpy as np
 import pyvista as pv
-from Muscat.Bridges.CGNSBridge import CGNSToMesh
 from Muscat.Bridges.PyVistaBridge import MeshToPyVista
 from plaid.containers.sample import Sample
 from plaid.types import Field
 
+from plaid_ops.common.conversion import cgns_to_mesh
+from plaid_ops.mesh.reader import MeshView
+
+# VTK cell types of the CGNS element types whose node ordering is the same in VTK
+_VTK_CELL_TYPES = {
+    "NODE": pv.CellType.VERTEX,
+    "BAR_2": pv.CellType.LINE,
+    "BAR_3": pv.CellType.QUADRATIC_EDGE,
+    "TRI_3": pv.CellType.TRIANGLE,
+    "TRI_6": pv.CellType.QUADRATIC_TRIANGLE,
+    "QUAD_4": pv.CellType.QUAD,
+    "QUAD_8": pv.CellType.QUADRATIC_QUAD,
+    "QUAD_9": pv.CellType.BIQUADRATIC_QUAD,
+    "TETRA_4": pv.CellType.TETRA,
+    "TETRA_10": pv.CellType.QUADRATIC_TETRA,
+    "PYRA_5": pv.CellType.PYRAMID,
+    "PYRA_13": pv.CellType.QUADRATIC_PYRAMID,
+    "PENTA_6": pv.CellType.WEDGE,
+    "HEXA_8": pv.CellType.HEXAHEDRON,
+}
+
 
 def _generate_pyvista_mesh(
     sample: Sample,
@@ -17,6 +38,10 @@ def _generate_pyvista_mesh(
 ) -> pv.PolyData:
     """Generate a PyVista mesh from a Sample.
 
+    Only the geometry is built: the fields of the sample are not attached to the mesh.
+    Zones made of linear and most quadratic elements are read directly from the CGNS
+    tree; other meshes go through a Muscat conversion.
+
     Args:
         sample (Sample): The input Sample containing the mesh data.
         time (Optional[float], optional): The simulation time to extract the mesh. Defaults to None.
@@ -29,11 +54,25 @@ def _generate_pyvista_mesh(
     zoneNames = [zone_name] if zone_name is not None else None
     baseNames = [base_name] if base_name is not None else None
     time = time if time is not None else 0.0
-
-    muscat_mesh = CGNSToMesh(
-        sample.get_mesh(time), baseNames=baseNames, zoneNames=zoneNames
-    )
-    return MeshToPyVista(muscat_mesh)
+    tree = sample.get_mesh(time)
+
+    try:
+        mesh_view = MeshView(tree, baseNames, zoneNames)
+        cells = mesh_view.cells()
+    except ValueError:
+        cells = None
+    if cells is not None and all(name in _VTK_CELL_TYPES for name in cells):
+        nodes = mesh_view.nodes
+        points = np.zeros((len(nodes), 3), dtype=nodes.dtype)
+        points[:, : nodes.shape[1]] = nodes
+        return pv.UnstructuredGrid(
+            {_VTK_CELL_TYPES[name]: cells[name] for name in cells}, points
+        )
+
+    muscat_mesh = cgns_to_mesh(tree, baseNames, zoneNames)
+    pv_mesh = MeshToPyVista(muscat_mesh)
+    pv_mesh.clear_data()
+    return pv_mesh
 
 
 def plot_sample_field(
@@ -105,9 +144,7 @@ def plot_field(
             print("Offscreen rendering is only supported on Linux with vtk-osmesa.")
             return None
 
-    sample_ = sample.copy()
-    sample_.del_all_fields()
-    pv_mesh = _generate_pyvista_mesh(sample_, time, base_name, zone_name)
+    pv_mesh = _generate_pyvista_mesh(sample, time, base_name, zone_name)
 
     plotter = pv.Plotter(off_screen=not interactive)
     plotter.view_xy()
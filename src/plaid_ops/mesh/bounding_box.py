@@ -0,0 +1,322 @@
+"""Module implementing bounding boxes of the meshes of plaid samples."""
+
+import json
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from plaid.containers.dataset import Dataset
+from plaid.containers.sample import Sample
+from plaid.types import Array
+
+from plaid_ops.common.parallel import map_in_chunks
+
+_COORDINATE_NAMES = ("CoordinateX", "CoordinateY", "CoordinateZ")
+
+
+def _iter_zone_coordinates(
+    sample: Sample,
+    times: Optional[Sequence] = None,
+    base_names: Optional[Sequence[str]] = None,
+    zone_names: Optional[Sequence[str]] = None,
+) -> Iterator[Tuple[float, str, str, List[Array]]]:
+    for time in times if times is not None else sample.get_all_mesh_times():
+        tree = sample.get_mesh(time=time)
+        for base in tree[2] if tree is not None else []:
+            if base[3] != "CGNSBase_t" or (base_names and base[0] not in base_names):
+                continue
+            for zone in base[2]:
+                if zone[3] != "Zone_t" or (zone_names and zone[0] not in zone_names):
+                    continue
+                for grid in zone[2]:
+                    if grid[3] != "GridCoordinates_t":
+                        continue
+                    coordinates = {
+                        node[0]: node[1]
+                        for node in grid[2]
+                        if node[0] in _COORDINATE_NAMES and np.size(node[1]) > 0
+                    }
+                    if coordinates:
+                        yield (
+                            time,
+                            base[0],
+                            zone[0],
+                            [
+                                coordinates[name]
+                                for name in _COORDINATE_NAMES
+                                if name in coordinates
+                            ],
+                        )
+
+
+def _list_coordinate_bounds(
+    zones: List[Tuple[float, str, str, List[Array]]],
+) -> List[Tuple[float, str, str, Array, Array]]:
+    return [
+        (
+            time,
+            base_name,
+            zone_name,
+            np.array([np.min(array) for array in coordinates]),
+            np.array([np.max(array) for array in coordinates]),
+        )
+        for time, base_name, zone_name, coordinates in zones
+    ]
+
+
+def iter_zone_bounding_boxes(
+    sample: Sample,
+    times: Optional[Sequence] = None,
+    base_names: Optional[Sequence[str]] = None,
+    zone_names: Optional[Sequence[str]] = None,
+) -> Iterator[Tuple[float, str, str, Array, Array]]:
+    """Iterate over the bounding boxes of the zones of a sample, for each time step.
+
+    Per-axis minima and maxima are computed directly on the coordinate arrays of the
+    CGNS trees, without stacking the nodes of each zone.
+
+    Args:
+        sample (Sample): The sample containing the meshes.
+        times (Optional[Sequence], optional): Specific times to consider. If None, uses all available times.
+        base_names (Optional[Sequence[str]], optional): The base names of the meshes to use. If None, uses all available bases.
+        zone_names (Optional[Sequence[str]], optional): The zone names of the meshes to use. If None, uses all available zones.
+
+    Yields:
+        Tuple[float, str, str, Array, Array]: The time, base name, zone name, minimum and maximum coordinates of each zone.
+    """
+    for zone in _iter_zone_coordinates(sample, times, base_names, zone_names):
+        yield from _list_coordinate_bounds([zone])
+
+
+def map_zone_bounding_boxes(
+    samples: Sequence[Sample],
+    times: Optional[Sequence] = None,
+    base_names: Optional[Sequence[str]] = None,
+    zone_names: Optional[Sequence[str]] = None,
+    verbose: bool = False,
+    n_workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None,
+) -> Iterator[List[Tuple[float, str, str, Array, Array]]]:
+    """Compute the zone bounding boxes of several samples, possibly in parallel.
+
+    Only the coordinate arrays of the selected zones are sent to the worker processes,
+    not the samples with their fields.
+
+    Args:
+        samples (Sequence[Sample]): The samples containing the meshes.
+        times (Optional[Sequence], optional): Specific times to consider. If None, uses all available times.
+        base_names (Optional[Sequence[str]], optional): The base names of the meshes to use. If None, uses all available bases.
+        zone_names (Optional[Sequence[str]], optional): The zone names of the meshes to use. If None, uses all available zones.
+        verbose (bool, optional): If True, shows progress bar. Defaults to False.
+        n_workers (int, optional): Number of worker processes. Defaults to 1 (serial execution).
+        executor (Optional[Executor], optional): Executor used to process the chunks of samples, instead of a process pool with `n_workers` workers; `n_workers` should then be its number of workers.
+        chunksize (Optional[int], optional): Number of samples per chunk sent to a worker. If None, samples are split in about four chunks per worker.
+
+    Yields:
+        List[Tuple[float, str, str, Array, Array]]: The zone bounding boxes of each sample, in order, as yielded by `iter_zone_bounding_boxes`.
+    """
+    yield from map_in_chunks(
+        _list_coordinate_bounds,
+        (
+            list(_iter_zone_coordinates(sample, times, base_names, zone_names))
+            for sample in samples
+        ),
+        total=len(samples),
+        n_workers=n_workers,
+        executor=executor,
+        chunksize=chunksize,
+        verbose=verbose,
+    )
+
+
+def _list_zone_bounding_boxes(
+    sample: Sample,
+) -> List[Tuple[float, str, str, Array, Array]]:
+    return list(iter_zone_bounding_boxes(sample))
+
+
+class BoundingBoxIndex:
+    """Index of the bounding boxes of the zones of each sample, for each time step.
+
+    The bounding boxes are computed once per sample, when it is added to the index, so that
+    global bounding boxes and intersection queries only cost a pass over the indexed
+    boxes instead of a pass over all the mesh nodes. The index can be saved next to a
+    dataset and reloaded, then updated incrementally with the samples added since.
+
+    Samples are identified by their id: an indexed sample whose mesh is later modified
+    should be indexed again with `add_sample`.
+    """
+
+    def __init__(self):
+        self._entries: Dict[int, List[Tuple[float, str, str, Array, Array]]] = {}
+
+    def add_sample(self, id: int, sample: Sample) -> None:
+        """Index the zone bounding boxes of a sample, replacing previous entries for `id`.
+
+        Args:
+            id (int): The sample id.
+            sample (Sample): The sample to index.
+        """
+        self._entries[int(id)] = _list_zone_bounding_boxes(sample)
+
+    def remove_sample(self, id: int) -> None:
+        """Remove the entries of a sample from the index.
+
+        Args:
+            id (int): The sample id.
+        """
+        del self._entries[int(id)]
+
+    def update(
+        self,
+        dataset: Dataset,
+        verbose: bool = False,
+        n_workers: int = 1,
+        executor: Optional[Executor] = None,
+        chunksize: Optional[int] = None,
+    ) -> None:
+        """Index the samples of a dataset that are not indexed yet.
+
+        Args:
+            dataset (Dataset): The dataset whose new samples are indexed.
+            verbose (bool, optional): If True, shows progress bar. Defaults to False.
+            n_workers (int, optional): Number of worker processes. Defaults to 1 (serial execution).
+            executor (Optional[Executor], optional): Executor used to process the chunks of samples, instead of a process pool with `n_workers` workers; `n_workers` should then be its number of workers.
+            chunksize (Optional[int], optional): Number of samples per chunk sent to a worker. If None, samples are split in about four chunks per worker.
+        """
+        new_ids = [id for id in dataset.get_sample_ids() if id not in self]
+        for id, entries in zip(
+            new_ids,
+            map_zone_bounding_boxes(
+                [dataset[id] for id in new_ids],
+                verbose=verbose,
+                n_workers=n_workers,
+                executor=executor,
+                chunksize=chunksize,
+            ),
+        ):
+            self._entries[int(id)] = entries
+
+    def _iter_boxes(
+        self,
+        ids: Optional[Sequence[int]],
+        times: Optional[Sequence],
+        base_names: Optional[Sequence[str]],
+        zone_names: Optional[Sequence[str]],
+    ) -> Iterator[Tuple[int, Array, Array]]:
+        for id in ids if ids is not None else self._entries:
+            for time, base_name, zone_name, mins, maxs in self._entries[int(id)]:
+                if (
+                    (times is not None and time not in times)
+                    or (base_names and base_name not in base_names)
+                    or (zone_names and zone_name not in zone_names)
+                ):
+                    continue
+                yield int(id), mins, maxs
+
+    def get_bounding_box(
+        self,
+        ids: Optional[Sequence[int]] = None,
+        times: Optional[Sequence] = None,
+        base_names: Optional[Sequence[str]] = None,
+        zone_names: Optional[Sequence[str]] = None,
+    ) -> Tuple[Array, Array]:
+        """Return the bounding box of the indexed zones.
+
+        Args:
+            ids (Optional[Sequence[int]], optional): The sample ids to consider. If None, uses all indexed samples.
+            times (Optional[Sequence], optional): Specific times to consider. If None, uses all indexed times.
+            base_names (Optional[Sequence[str]], optional): The base names to consider. If None, uses all indexed bases.
+            zone_names (Optional[Sequence[str]], optional): The zone names to consider. If None, uses all indexed zones.
+
+        Returns:
+            Tuple[Array, Array]: A tuple (mins, maxs) of the minimum and maximum coordinates of the selected zones.
+        """
+        boxes = list(self._iter_boxes(ids, times, base_names, zone_names))
+        assert boxes, "no indexed zone matches the selection"
+        return (
+            np.min([mins for _, mins, _ in boxes], axis=0).astype(np.float64),
+            np.max([maxs for _, _, maxs in boxes], axis=0).astype(np.float64),
+        )
+
+    def query(
+        self,
+        bbox: Sequence[Array],
+        times: Optional[Sequence] = None,
+        base_names: Optional[Sequence[str]] = None,
+        zone_names: Optional[Sequence[str]] = None,
+    ) -> List[int]:
+        """Return the ids of the samples with a zone intersecting a box.
+
+        Args:
+            bbox (Sequence[Array]): The box as (mins, maxs).
+            times (Optional[Sequence], optional): Specific times to consider. If None, uses all indexed times.
+            base_names (Optional[Sequence[str]], optional): The base names to consider. If None, uses all indexed bases.
+            zone_names (Optional[Sequence[str]], optional): The zone names to consider. If None, uses all indexed zones.
+
+        Returns:
+            List[int]: The ids of the matching samples, in indexing order.
+        """
+        ids = []
+        for id, mins, maxs in self._iter_boxes(None, times, base_names, zone_names):
+            if (not ids or ids[-1] != id) and np.all(
+                (mins <= bbox[1]) & (maxs >= bbox[0])
+            ):
+                ids.append(id)
+        return ids
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the index to a JSON file.
+
+        Args:
+            path (Union[str, Path]): Path of the JSON file.
+        """
+        with open(path, "w") as file:
+            json.dump(
+                {
+                    str(id): [
+                        [
+                            float(time),
+                            base_name,
+                            zone_name,
+                            mins.tolist(),
+                            maxs.tolist(),
+                        ]
+                        for time, base_name, zone_name, mins, maxs in entries
+                    ]
+                    for id, entries in self._entries.items()
+                },
+                file,
+            )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BoundingBoxIndex":
+        """Load an index saved with `save`.
+
+        Args:
+            path (Union[str, Path]): Path of the JSON file.
+
+        Returns:
+            BoundingBoxIndex: The loaded index.
+        """
+        with open(path) as file:
+            content = json.load(file)
+        index = cls()
+        index._entries = {
+            int(id): [
+                (time, base_name, zone_name, np.array(mins), np.array(maxs))
+                for time, base_name, zone_name, mins, maxs in entries
+            ]
+            for id, entries in content.items()
+        }
+        return index
+
+    def __contains__(self, id: int) -> bool:
+        """Return whether a sample id is indexed."""
+        return int(id) in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of indexed samples."""
+        return len(self._entries)
@@ -0,0 +1,544 @@
+"""Module implementing exact distance queries to the boundary of a mesh."""
+
+import math
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import Muscat.MeshContainers.ElementsDescription as ED
+import numpy as np
+from Muscat.MeshContainers.Mesh import Mesh
+from plaid.types import Array
+from scipy.spatial import cKDTree
+
+_LEAF_SIZE = 4
+
+_FACE_CORNERS = {
+    ED.GeoSupport.GeoBar: 2,
+    ED.GeoSupport.GeoTri: 3,
+    ED.GeoSupport.GeoQuad: 4,
+}
+
+
+def _simplex_normals(vertices: Array) -> Array:
+    if vertices.shape[2] == 2:
+        edges = vertices[:, 1] - vertices[:, 0]
+        return np.stack([edges[:, 1], -edges[:, 0]], axis=-1)
+    return np.cross(vertices[:, 1] - vertices[:, 0], vertices[:, 2] - vertices[:, 0])
+
+
+def _count_rows(rows: Array) -> Array:
+    order = np.lexsort(rows.T[::-1])
+    sorted_rows = rows[order]
+    groups = np.cumsum(np.r_[True, np.any(np.diff(sorted_rows, axis=0), axis=1)]) - 1
+    counts = np.empty(len(rows), dtype=np.intp)
+    counts[order] = np.bincount(groups)[groups]
+    return counts
+
+
+def _compute_skin(mesh: Mesh) -> Array:
+    nodes = np.asarray(mesh.nodes, dtype=np.float64)
+    dim = nodes.shape[1]
+    faces = {}
+    for element_type, elements in mesh.elements.items():
+        n_elements = elements.GetNumberOfElements()
+        if ED.dimensionality[element_type] != dim or n_elements == 0:
+            continue
+        connectivity = elements.connectivity[:n_elements]
+        centroids = nodes[connectivity].mean(axis=1)
+        for face_type, local in ED.faces1[element_type]:
+            n_corners = _FACE_CORNERS[ED.geoSupport[face_type]]
+            faces.setdefault(n_corners, []).append(
+                (connectivity[:, local[:n_corners]], centroids)
+            )
+    if not faces:
+        raise ValueError(
+            f"the mesh has no elements of dimensionality {dim} to compute the skin of"
+        )
+
+    simplices, parents = [], []
+    for n_corners, groups in faces.items():
+        corners = np.concatenate([corners for corners, _ in groups])
+        centroids = np.concatenate([centroids for _, centroids in groups])
+        boundary = _count_rows(np.sort(corners, axis=1)) == 1
+        corners, centroids = corners[boundary], centroids[boundary]
+        if n_corners == 4:
+            corners = np.concatenate([corners[:, [0, 1, 2]], corners[:, [0, 2, 3]]])
+            centroids = np.concatenate([centroids, centroids])
+        simplices.append(corners)
+        parents.append(centroids)
+    simplices = np.concatenate(simplices)
+    parents = np.concatenate(parents)
+
+    vertices = nodes[simplices]
+    inward = (
+        np.einsum(
+            "ij,ij->i", _simplex_normals(vertices), vertices.mean(axis=1) - parents
+        )
+        < 0
+    )
+    simplices[inward, :2] = simplices[inward, 1::-1]
+    return simplices
+
+
+def _box_distance2(points: Array, lower: Array, upper: Array) -> Array:
+    gaps = lower - points
+    np.maximum(gaps, points - upper, out=gaps)
+    np.maximum(gaps, 0, out=gaps)
+    return np.einsum("ij,ij->i", gaps, gaps)
+
+
+def _closest_point_weights(points: Array, vertices: Array) -> Array:
+    a = vertices[:, 0]
+    ab = vertices[:, 1] - a
+    ap = points - a
+    if vertices.shape[1] == 2:
+        length2 = np.einsum("ij,ij->i", ab, ab)
+        t = np.clip(
+            np.einsum("ij,ij->i", ap, ab) / np.where(length2 > 0, length2, 1), 0, 1
+        )
+        return np.stack([1 - t, t], axis=-1)
+
+    # Closest point on a triangle, from the Voronoi regions of its vertices, edges and face
+    ac = vertices[:, 2] - a
+    bp = points - vertices[:, 1]
+    cp = points - vertices[:, 2]
+    d1, d2 = np.einsum("ij,ij->i", ab, ap), np.einsum("ij,ij->i", ac, ap)
+    d3, d4 = np.einsum("ij,ij->i", ab, bp), np.einsum("ij,ij->i", ac, bp)
+    d5, d6 = np.einsum("ij,ij->i", ab, cp), np.einsum("ij,ij->i", ac, cp)
+    va, vb, vc = d3 * d6 - d5 * d4, d5 * d2 - d1 * d6, d1 * d4 - d3 * d2
+    zeros, ones = np.zeros_like(d1), np.ones_like(d1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v_ab = d1 / (d1 - d3)
+        w_ac = d2 / (d2 - d6)
+        w_bc = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        denom = 1 / (va + vb + vc)
+    v, w = vb * denom, vc * denom
+    candidates = [
+        (d1 <= 0) & (d2 <= 0),
+        (d3 >= 0) & (d4 <= d3),
+        (vc <= 0) & (d1 >= 0) & (d3 <= 0),
+        (d6 >= 0) & (d5 <= d6),
+        (vb <= 0) & (d2 >= 0) & (d6 <= 0),
+        (va <= 0) & (d4 - d3 >= 0) & (d5 - d6 >= 0),
+    ]
+    weights = [
+        (ones, zeros, zeros),
+        (zeros, ones, zeros),
+        (1 - v_ab, v_ab, zeros),
+        (zeros, zeros, ones),
+        (1 - w_ac, zeros, w_ac),
+        (zeros, 1 - w_bc, w_bc),
+    ]
+    return np.stack(
+        [
+            np.select(candidates, [weight[i] for weight in weights], default=face)
+            for i, face in enumerate((1 - v - w, v, w))
+        ],
+        axis=-1,
+    )
+
+
+class BoundaryIndex:
+    """Acceleration structure for exact distance queries to the boundary of a mesh.
+
+    The boundary is a set of segments (2D) or triangles (3D), indexed by a KD-tree over
+    their centroids. Each query point is first compared with the closest few simplices
+    of the tree, then with all the simplices that may still be closer, with vectorized
+    exact point-to-segment and point-to-triangle distances.
+
+    Signed distances are positive inside the boundary and negative outside, as in
+    `compute_sdf`. The side of a point is given by the angle-weighted pseudo-normal of
+    the closest vertex, edge or face, which requires a closed boundary with simplices
+    oriented outward, such as the one built by `from_mesh`.
+
+    Args:
+        nodes (Array): Coordinates of the boundary nodes, of shape (n_nodes, dim) with dim 2 or 3.
+        simplices (Array): Connectivity of the boundary segments (dim 2) or triangles (dim 3), of shape (n_simplices, dim), with outward normals.
+    """
+
+    def __init__(self, nodes: Array, simplices: Array):
+        self.nodes = np.asarray(nodes, dtype=np.float64)
+        dim = self.nodes.shape[1]
+        assert dim in (2, 3), "only 2D and 3D boundaries are supported"
+        simplices = np.asarray(simplices, dtype=np.intp).reshape(-1, dim)
+        normals = _simplex_normals(self.nodes[simplices])
+        lengths = np.linalg.norm(normals, axis=1)
+        simplices, normals = simplices[lengths > 0], normals[lengths > 0]
+        assert len(simplices) > 0, "the boundary should have non-degenerate simplices"
+        self.simplices = simplices
+        self.normals = normals / lengths[lengths > 0, None]
+
+        vertices = self.nodes[simplices]
+        centroids = vertices.mean(axis=1)
+        self._tree = cKDTree(centroids)
+        self._radius = np.linalg.norm(vertices - centroids[:, None], axis=-1).max()
+        self._build_hierarchy(vertices, centroids)
+
+        self.vertex_normals = np.zeros_like(self.nodes)
+        if dim == 2:
+            for i in range(2):
+                np.add.at(self.vertex_normals, simplices[:, i], self.normals)
+            return
+        for i in range(3):
+            u = vertices[:, (i + 1) % 3] - vertices[:, i]
+            v = vertices[:, (i + 2) % 3] - vertices[:, i]
+            cos = np.einsum("ij,ij->i", u, v) / (
+                np.linalg.norm(u, axis=1) * np.linalg.norm(v, axis=1)
+            )
+            angles = np.arccos(np.clip(cos, -1, 1))
+            np.add.at(
+                self.vertex_normals, simplices[:, i], angles[:, None] * self.normals
+            )
+        edges = np.sort(np.stack([simplices, np.roll(simplices, -1, axis=1)], -1), -1)
+        _, self._edge_ids = np.unique(edges.reshape(-1, 2), axis=0, return_inverse=True)
+        self._edge_ids = self._edge_ids.reshape(-1, 3)
+        self.edge_normals = np.zeros((self._edge_ids.max() + 1, 3))
+        np.add.at(
+            self.edge_normals, self._edge_ids.ravel(), np.repeat(self.normals, 3, 0)
+        )
+
+    @classmethod
+    def from_mesh(cls, mesh: Mesh) -> "BoundaryIndex":
+        """Build the index of the skin of a mesh.
+
+        The skin is made of the faces of the elements of highest dimensionality that
+        belong to a single element, oriented away from it. Quadrangle faces are split
+        into two triangles, and only the corner nodes of quadratic faces are used.
+
+        Args:
+            mesh (Mesh): The Muscat mesh, whose elements should have the dimensionality of its nodes.
+
+        Returns:
+            BoundaryIndex: The index of the skin of the mesh.
+        """
+        return cls(mesh.nodes, _compute_skin(mesh))
+
+    def _build_hierarchy(self, vertices: Array, centroids: Array) -> None:
+        # Leaves gather simplices consecutive in the Morton order of their centroids, and
+        # each level halves the number of boxes up to the root; missing simplices have
+        # empty boxes
+        dim = centroids.shape[1]
+        mins = centroids.min(axis=0)
+        extent = centroids.max(axis=0) - mins
+        cells = ((centroids - mins) / np.where(extent > 0, extent, 1) * 1023).astype(
+            np.int64
+        )
+        codes = np.zeros(len(centroids), dtype=np.int64)
+        for bit in range(10):
+            for axis in range(dim):
+                codes |= ((cells[:, axis] >> bit) & 1) << (bit * dim + axis)
+
+        n_leaves = 1 << max(0, math.ceil(math.log2(len(centroids) / _LEAF_SIZE)))
+        leaves = np.full(n_leaves * _LEAF_SIZE, -1, dtype=np.intp)
+        leaves[: len(centroids)] = np.argsort(codes, kind="stable")
+        self._leaves = leaves.reshape(n_leaves, _LEAF_SIZE)
+        self._lower = np.vstack([vertices.min(axis=1), np.full(dim, np.inf)])
+        self._upper = np.vstack([vertices.max(axis=1), np.full(dim, -np.inf)])
+
+        lower = self._lower[self._leaves].min(axis=1)
+        upper = self._upper[self._leaves].max(axis=1)
+        self._boxes = [(lower, upper)]
+        while len(lower) > 1:
+            lower = lower.reshape(-1, 2, dim).min(axis=1)
+            upper = upper.reshape(-1, 2, dim).max(axis=1)
+            self._boxes.insert(0, (lower, upper))
+
+    def _query(
+        self, points: Array, bandwidth: float = np.inf
+    ) -> Tuple[Array, Array, Array]:
+        # The distance to the simplex of the closest centroid bounds the distance to the
+        # boundary, so that only the boxes closer than this bound are visited; points
+        # whose closest centroid is farther than the bandwidth plus the radius of the
+        # simplices are outside the band
+        _, nearest = self._tree.query(
+            points, distance_upper_bound=bandwidth + self._radius
+        )
+        owners = np.flatnonzero(nearest < len(self.simplices))
+        vertices = np.take(
+            self.nodes, np.take(self.simplices, nearest[owners], axis=0), axis=0
+        )
+        owner_points = np.take(points, owners, axis=0)
+        bounds = np.zeros(len(points))
+        bounds[owners] = np.linalg.norm(
+            np.einsum(
+                "pv,pvd->pd", _closest_point_weights(owner_points, vertices), vertices
+            )
+            - owner_points,
+            axis=-1,
+        )
+        bounds = np.minimum(bounds, bandwidth) ** 2 * (1 + 1e-9)
+        nodes = np.zeros(len(owners), dtype=np.intp)
+        for lower, upper in self._boxes[1:]:
+            owners = np.repeat(owners, 2)
+            nodes = (2 * nodes[:, None] + np.arange(2)).ravel()
+            keep = np.take(bounds, owners) >= _box_distance2(
+                np.take(points, owners, axis=0),
+                np.take(lower, nodes, axis=0),
+                np.take(upper, nodes, axis=0),
+            )
+            owners, nodes = owners[keep], nodes[keep]
+
+        simplices = np.take(self._leaves, nodes, axis=0).ravel()
+        owners = np.repeat(owners, _LEAF_SIZE)
+        keep = np.take(bounds, owners) >= _box_distance2(
+            np.take(points, owners, axis=0),
+            np.take(self._lower, simplices, axis=0),
+            np.take(self._upper, simplices, axis=0),
+        )
+        owners, simplices = owners[keep], simplices[keep]
+
+        vertices = np.take(
+            self.nodes, np.take(self.simplices, simplices, axis=0), axis=0
+        )
+        owner_points = np.take(points, owners, axis=0)
+        weights = _closest_point_weights(owner_points, vertices)
+        distances = np.linalg.norm(
+            np.einsum("pv,pvd->pd", weights, vertices) - owner_points, axis=-1
+        )
+
+        # Owners are sorted, so that the closest simplex of each point is the first one
+        # reaching the minimum distance of its segment; points without candidates are
+        # farther than the bandwidth
+        result = (
+            np.full(len(points), np.inf),
+            np.full(len(points), -1, dtype=np.intp),
+            np.zeros((len(points), self.simplices.shape[1])),
+        )
+        if len(owners) == 0:
+            return result
+        starts = np.flatnonzero(np.r_[True, np.diff(owners) > 0])
+        minima = np.minimum.reduceat(distances, starts)
+        reached = np.flatnonzero(
+            distances <= np.repeat(minima, np.diff(np.r_[starts, len(owners)]))
+        )
+        _, first = np.unique(owners[reached], return_index=True)
+        closest = reached[first]
+        for array, values in zip(result, (distances, simplices, weights)):
+            array[owners[closest]] = values[closest]
+        return result
+
+    def _batches(
+        self, points: Array, batch_size: int, query: Optional[Callable] = None, **kwargs
+    ):
+        query = query if query is not None else self._query
+        points = np.asarray(points, dtype=np.float64)
+        assert points.ndim == 2 and points.shape[1] == self.nodes.shape[1], (
+            "`points` should be of shape (n_points, dim) with the dimension of the boundary"
+        )
+        for start in range(0, len(points), batch_size):
+            batch = points[start : start + batch_size]
+            yield batch, query(batch, **kwargs)
+
+    def distance(
+        self,
+        points: Array,
+        batch_size: int = 65536,
+        bandwidth: Optional[float] = None,
+    ) -> Array:
+        """Compute the distance from points to the boundary.
+
+        With a `bandwidth`, the hierarchy is only searched up to that distance, so that
+        points far from the boundary are discarded after visiting a few boxes, and their
+        distance is clamped to `bandwidth`.
+
+        Args:
+            points (Array): Coordinates of the query points, of shape (n_points, dim).
+            batch_size (int, optional): Number of points processed at once, bounding the memory used by the queries. Defaults to 65536.
+            bandwidth (Optional[float], optional): Distance beyond which distances are clamped. If None, all distances are exact.
+
+        Returns:
+            Array: The distances, of shape (n_points,).
+        """
+        if bandwidth is None:
+            bandwidth = np.inf
+        assert bandwidth > 0, "`bandwidth` should be positive"
+        distances = [
+            np.minimum(distances, bandwidth)
+            for _, (distances, _, _) in self._batches(
+                points, batch_size, bandwidth=bandwidth
+            )
+        ]
+        return np.concatenate(distances) if distances else np.zeros(0)
+
+    def signed_distance(self, points: Array, batch_size: int = 65536) -> Array:
+        """Compute the signed distance from points to the boundary, positive inside.
+
+        Args:
+            points (Array): Coordinates of the query points, of shape (n_points, dim).
+            batch_size (int, optional): Number of points processed at once, bounding the memory used by the queries. Defaults to 65536.
+
+        Returns:
+            Array: The signed distances, of shape (n_points,).
+        """
+        result = []
+        for batch, (distances, simplices, weights) in self._batches(points, batch_size):
+            closest, normals = self._closest_features(simplices, weights)
+            outside = np.einsum("pd,pd->p", batch - closest, normals) > 0
+            result.append(np.where(outside, -distances, distances))
+        return np.concatenate(result) if result else np.zeros(0)
+
+    def _closest_features(
+        self, simplices: Array, weights: Array
+    ) -> Tuple[Array, Array]:
+        # Closest points, and the pseudo-normals of the vertices, edges or faces they lie on
+        vertices = self.simplices[simplices]
+        closest = np.einsum("pv,pvd->pd", weights, self.nodes[vertices])
+        n_features = (weights > 0).sum(axis=1)
+        normals = self.normals[simplices]
+
+        # Closest point on a vertex, or on an edge of a triangle
+        corner = n_features == 1
+        normals[corner] = self.vertex_normals[
+            vertices[corner, weights[corner].argmax(axis=1)]
+        ]
+        if self.nodes.shape[1] == 3:
+            edge = n_features == 2
+            local = (weights[edge].argmin(axis=1) + 1) % 3
+            normals[edge] = self.edge_normals[self._edge_ids[simplices[edge], local]]
+        return closest, normals
+
+    def closest_points(
+        self, points: Array, batch_size: int = 65536
+    ) -> Tuple[Array, Array, Array]:
+        """Compute the closest points of the boundary, and the outward normals there.
+
+        The normal at a point lying on a vertex, or on an edge of a triangle, is the
+        normalized angle-weighted pseudo-normal of this vertex or edge.
+
+        Args:
+            points (Array): Coordinates of the query points, of shape (n_points, dim).
+            batch_size (int, optional): Number of points processed at once, bounding the memory used by the queries. Defaults to 65536.
+
+        Returns:
+            Tuple[Array, Array, Array]: The distances to the boundary, of shape (n_points,), the closest boundary points and the unit outward normals, of shape (n_points, dim).
+        """
+        batches = [
+            (distances, *self._closest_features(simplices, weights))
+            for _, (distances, simplices, weights) in self._batches(points, batch_size)
+        ]
+        if not batches:
+            dim = self.nodes.shape[1]
+            return np.zeros(0), np.zeros((0, dim)), np.zeros((0, dim))
+        distances, closest, normals = (
+            np.concatenate(arrays) for arrays in zip(*batches)
+        )
+        normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+        return distances, closest, normals
+
+    def _query_labels(
+        self,
+        points: Array,
+        labels: Array,
+        label_boxes: List[Tuple[Array, Array]],
+        trees: List,
+    ) -> Array:
+        # Each (point, label) pair is an owner, which visits the boxes of the simplices of
+        # its label only: the hierarchy is traversed once, as if each label had its own.
+        # The distance to the closest node of a label bounds the distance to its part of
+        # the boundary, nodes lying on its simplices
+        n_labels = labels.shape[1]
+        bounds = np.stack([tree.query(points)[0] for tree in trees], axis=1).ravel()
+        bounds2 = bounds**2 * (1 + 1e-9)
+        owners = np.arange(len(bounds))
+        nodes = np.zeros(len(bounds), dtype=np.intp)
+        for lower, upper in label_boxes[1:]:
+            owners = np.repeat(owners, 2)
+            nodes = (2 * nodes[:, None] + np.arange(2)).ravel()
+            boxes = nodes * n_labels + owners % n_labels
+            keep = np.take(bounds2, owners) >= _box_distance2(
+                np.take(points, owners // n_labels, axis=0),
+                np.take(lower, boxes, axis=0),
+                np.take(upper, boxes, axis=0),
+            )
+            owners, nodes = owners[keep], nodes[keep]
+
+        simplices = np.take(self._leaves, nodes, axis=0).ravel()
+        owners = np.repeat(owners, _LEAF_SIZE)
+        keep = np.take(labels.ravel(), simplices * n_labels + owners % n_labels)
+        owners, simplices = owners[keep], simplices[keep]
+        owner_points = np.take(points, owners // n_labels, axis=0)
+        keep = np.take(bounds2, owners) >= _box_distance2(
+            owner_points,
+            np.take(self._lower, simplices, axis=0),
+            np.take(self._upper, simplices, axis=0),
+        )
+        owners, simplices, owner_points = (
+            owners[keep],
+            simplices[keep],
+            owner_points[keep],
+        )
+        if len(owners) > 0:
+            vertices = np.take(
+                self.nodes, np.take(self.simplices, simplices, axis=0), axis=0
+            )
+            distances = np.linalg.norm(
+                np.einsum(
+                    "pv,pvd->pd",
+                    _closest_point_weights(owner_points, vertices),
+                    vertices,
+                )
+                - owner_points,
+                axis=-1,
+            )
+            starts = np.flatnonzero(np.r_[True, np.diff(owners) > 0])
+            bounds[owners[starts]] = np.minimum(
+                bounds[owners[starts]], np.minimum.reduceat(distances, starts)
+            )
+        return bounds.reshape(len(points), n_labels)
+
+    def label_distances(
+        self, points: Array, labels: Sequence[Array], batch_size: int = 65536
+    ) -> Array:
+        """Compute the distances from points to several labelled parts of the boundary at once.
+
+        Each label is a set of node ids, whose part of the boundary is made of these nodes
+        and of the simplices whose nodes all belong to it, e.g. the faces of a boundary
+        condition. The hierarchy is shared by all the labels and traversed once per batch
+        of points, each label only visiting the boxes of its own simplices.
+
+        Args:
+            points (Array): Coordinates of the query points, of shape (n_points, dim).
+            labels (Sequence[Array]): Node ids of each label, which should not be empty.
+            batch_size (int, optional): Number of points processed at once, bounding the memory used by the queries. Defaults to 65536.
+
+        Returns:
+            Array: The distances to each label, of shape (n_points, n_labels).
+        """
+        n_labels = len(labels)
+        in_labels = np.zeros((len(self.nodes), n_labels), dtype=bool)
+        for i, ids in enumerate(labels):
+            assert len(ids) > 0, "labels should not be empty"
+            in_labels[np.asarray(ids, dtype=np.intp), i] = True
+
+        # Labels of the simplices, with an empty last row for the padding of the leaves,
+        # and boxes of the simplices of each label at each level of the hierarchy, stored
+        # at index box * n_labels + label
+        simplex_labels = np.vstack(
+            [in_labels[self.simplices].all(axis=1), np.zeros(n_labels, dtype=bool)]
+        )
+        mask = simplex_labels[self._leaves][..., None]
+        lower = np.where(mask, self._lower[self._leaves][:, :, None], np.inf).min(1)
+        upper = np.where(mask, self._upper[self._leaves][:, :, None], -np.inf).max(1)
+        label_boxes = [(lower, upper)]
+        while len(lower) > 1:
+            lower = lower.reshape(-1, 2, *lower.shape[1:]).min(axis=1)
+            upper = upper.reshape(-1, 2, *upper.shape[1:]).max(axis=1)
+            label_boxes.insert(0, (lower, upper))
+        dim = self.nodes.shape[1]
+        label_boxes = [
+            (lower.reshape(-1, dim), upper.reshape(-1, dim))
+            for lower, upper in label_boxes
+        ]
+
+        trees = [cKDTree(self.nodes[in_labels[:, i]]) for i in range(n_labels)]
+        distances = [
+            distances
+            for _, distances in self._batches(
+                points,
+                batch_size,
+                query=self._query_labels,
+                labels=simplex_labels,
+                label_boxes=label_boxes,
+                trees=trees,
+            )
+        ]
+        return np.concatenate(distances) if distances else np.zeros((0, n_labels))
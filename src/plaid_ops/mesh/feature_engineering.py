@@ -1,13 +1,27 @@
 """Module that implements some feature engineering functions on meshes."""
 
-from typing import Optional
+from concurrent.futures import Executor
+from functools import partial
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
-from Muscat.Bridges.CGNSBridge import CGNSToMesh
+import Muscat
+import Muscat.MeshContainers.ElementsDescription as ED
+import numpy as np
+from Muscat.MeshContainers.Mesh import Mesh
 from Muscat.MeshTools.MeshTools import ComputeSignedDistance
 from plaid.containers.dataset import Dataset
 from plaid.containers.sample import Sample
-from plaid.types import Field
-from tqdm import tqdm
+from plaid.types import Array, CGNSTree, Field
+
+from plaid_ops import __version__
+from plaid_ops.common.cache import ArrayCache, LRUCache
+from plaid_ops.common.conversion import tree_to_mesh
+from plaid_ops.common.parallel import map_in_chunks
+from plaid_ops.mesh.distance import BoundaryIndex
+from plaid_ops.mesh.fingerprint import create_mesh_fingerprinter
+
+# Offset subtracted from exact distances by Muscat's `ComputeSignedDistance`
+_MUSCAT_SDF_OFFSET = 1e-3
 
 
 def compute_sdf(
@@ -15,6 +29,7 @@ def compute_sdf(
     base_name: Optional[str] = None,
     zone_name: Optional[str] = None,
     time: Optional[float] = None,
+    bandwidth: Optional[float] = None,
 ) -> Field:
     """Compute the signed distance function (SDF) for a mesh extracted from a Sample.
 
@@ -22,19 +37,131 @@ def compute_sdf(
     base, or zone), converts it to a working Muscat mesh, and computes the signed distance
     function (SDF) at each mesh node.
 
+    With a `bandwidth`, the SDF is only computed exactly for the nodes closer to the
+    boundary than `bandwidth`, using a `BoundaryIndex` of the skin of the mesh, and is
+    clamped to `bandwidth` elsewhere. Far nodes are then discarded after a few bounding
+    box tests, which makes narrow bands much cheaper on large volume meshes. Both paths
+    follow the convention of Muscat, whose SDF is offset by a tolerance of 1e-3, so that
+    the narrow-band SDF is the full SDF clamped to `bandwidth`.
+
     Args:
         sample (Sample): The input Sample containing the mesh and fields.
         base_name (Optional[str]): Name of the base to select. If None, all bases are used.
         zone_name (Optional[str]): Name of the zone to select. If None, all zones are used.
         time (Optional[float]): Simulation time to extract the mesh. If None, uses default.
+        bandwidth (Optional[float]): Distance to the boundary beyond which the SDF is clamped. If None, the SDF is computed at all nodes.
 
     Returns:
         Field: The computed signed distance function values at mesh nodes.
     """
-    baseNames = [base_name] if base_name is not None else None
-    zoneNames = [zone_name] if zone_name is not None else None
-    mesh = CGNSToMesh(sample.get_mesh(time), baseNames=baseNames, zoneNames=zoneNames)
-    return ComputeSignedDistance(mesh, mesh.nodes)
+    return _compute_tree_sdf(sample.get_mesh(time), base_name, zone_name, bandwidth)
+
+
+def _compute_tree_sdf(
+    tree: CGNSTree,
+    base_name: Optional[str],
+    zone_name: Optional[str],
+    bandwidth: Optional[float] = None,
+) -> Field:
+    return compute_mesh_sdf(tree_to_mesh(tree, base_name, zone_name), bandwidth)
+
+
+def compute_mesh_sdf(
+    mesh: Mesh,
+    bandwidth: Optional[float] = None,
+    index: Optional[BoundaryIndex] = None,
+) -> Field:
+    """Compute the signed distance function (SDF) at the nodes of a Muscat mesh.
+
+    Args:
+        mesh (Mesh): The Muscat mesh.
+        bandwidth (Optional[float], optional): Distance to the boundary beyond which the SDF is clamped, see `compute_sdf`. If None, the SDF is computed at all nodes.
+        index (Optional[BoundaryIndex], optional): Boundary index of the skin of `mesh`, used with a `bandwidth`, which can be shared with other computations. If None, it is built on demand.
+
+    Returns:
+        Field: The SDF at each node of `mesh`.
+    """
+    if bandwidth is None:
+        return ComputeSignedDistance(mesh, mesh.nodes)
+    if index is None:
+        index = BoundaryIndex.from_mesh(mesh)
+    # Nodes lie inside the mesh, so that their SDF is their distance to the skin
+    distances = index.distance(mesh.nodes, bandwidth=bandwidth + _MUSCAT_SDF_OFFSET)
+    return np.minimum(distances - _MUSCAT_SDF_OFFSET, bandwidth)
+
+
+def compute_sdf_at_points(
+    sample: Sample,
+    points: Array,
+    base_name: Optional[str] = None,
+    zone_name: Optional[str] = None,
+    time: Optional[float] = None,
+    index_cache: Optional[LRUCache] = None,
+    batch_size: int = 65536,
+) -> Field:
+    """Compute the signed distance function (SDF) of the geometry of a Sample at arbitrary points.
+
+    The skin of the mesh is indexed by a `BoundaryIndex`, which evaluates exact distances
+    to the boundary segments (2D) or triangles (3D) by batches of points, e.g. the nodes of
+    the regular grid used by `project_on_regular_grid`. As with `compute_sdf`, the SDF is
+    positive inside the mesh and offset by Muscat's tolerance, so that it matches
+    `compute_sdf` at the nodes of the mesh.
+
+    Args:
+        sample (Sample): The input Sample containing the mesh.
+        points (Array): Coordinates of the query points, of shape (n_points, dim).
+        base_name (Optional[str]): Name of the base to select. If None, all bases are used.
+        zone_name (Optional[str]): Name of the zone to select. If None, all zones are used.
+        time (Optional[float]): Simulation time to extract the mesh. If None, uses default.
+        index_cache (Optional[LRUCache]): In-memory cache mapping `("boundary_index", fingerprint)` keys to `BoundaryIndex` objects, so that samples sharing a geometry build their index only once. It can be shared with other caches, since its keys do not collide with SDF keys. If None, the index is built for this call only.
+        batch_size (int): Number of points evaluated at once, bounding the memory used by the queries. Defaults to 65536.
+
+    Returns:
+        Field: The signed distance function values at the query points.
+    """
+    tree = sample.get_mesh(time)
+    if index_cache is None:
+        index = _compute_boundary_index(tree, base_name, zone_name)
+    else:
+        key = ("boundary_index", _tree_fingerprint(tree, base_name, zone_name))
+        index = index_cache.get(key)
+        if index is None:
+            index = _compute_boundary_index(tree, base_name, zone_name)
+            index_cache.put(key, index)
+    return index.signed_distance(points, batch_size=batch_size) - _MUSCAT_SDF_OFFSET
+
+
+def _compute_boundary_index(
+    tree: CGNSTree, base_name: Optional[str], zone_name: Optional[str]
+) -> BoundaryIndex:
+    return BoundaryIndex.from_mesh(tree_to_mesh(tree, base_name, zone_name))
+
+
+def _tree_fingerprint(
+    tree: CGNSTree, base_name: Optional[str], zone_name: Optional[str]
+) -> str:
+    return create_mesh_fingerprinter(base_name, zone_name)(tree)
+
+
+def sdf_cache_key(
+    fingerprint: str, bandwidth: Optional[float] = None
+) -> Tuple[Optional[Union[str, float]], ...]:
+    """Return the key of the SDF of a mesh in an SDF cache, see `update_dataset_with_sdf`.
+
+    Args:
+        fingerprint (str): Fingerprint of the mesh, see `compute_mesh_fingerprint`.
+        bandwidth (Optional[float], optional): Bandwidth of the SDF, see `compute_sdf`.
+
+    Returns:
+        Tuple[Optional[Union[str, float]], ...]: The key, which includes the versions of plaid-ops and Muscat.
+    """
+    return (
+        "sdf",
+        fingerprint,
+        bandwidth,
+        __version__,
+        Muscat.__version__,
+    )
 
 
 def update_sample_with_sdf(
@@ -43,11 +170,15 @@ def update_sample_with_sdf(
     zone_name: Optional[str] = None,
     in_place: Optional[bool] = False,
     time: Optional[float] = None,
+    sdf_cache: Optional[ArrayCache] = None,
+    bandwidth: Optional[float] = None,
 ) -> Sample:
     """Update a Sample by computing and adding the signed distance function (SDF) field.
 
     Computes the SDF for the mesh in the given Sample and adds it as a new field named "sdf"
     at the vertex location for the specified base and zone. Optionally operates in-place.
+    With an `sdf_cache`, the SDF of a geometry already seen is copied from the cache instead
+    of being recomputed.
 
     Args:
         sample (Sample): The input Sample to update.
@@ -55,13 +186,24 @@ def update_sample_with_sdf(
         zone_name (Optional[str]): Name of the zone to select. If None, all zones are used.
         in_place (Optional[bool]): If True, modifies the Sample in-place. If False, works on a copy.
         time (Optional[float]): Simulation time to extract the mesh. If None, uses default.
+        sdf_cache (Optional[ArrayCache]): Cache of SDF fields keyed by mesh fingerprint, which can be shared between calls. If None, the SDF is always computed.
+        bandwidth (Optional[float]): Distance to the boundary beyond which the SDF is clamped, see `compute_sdf`. If None, the SDF is computed at all nodes.
 
     Returns:
         Sample: The Sample with the new "sdf" field added.
     """
     if not in_place:
         sample = sample.copy()
-    sdf = compute_sdf(sample, base_name, zone_name, time)
+    if sdf_cache is None:
+        sdf = compute_sdf(sample, base_name, zone_name, time, bandwidth)
+    else:
+        tree = sample.get_mesh(time)
+        sdf = np.array(
+            sdf_cache.get_or_compute(
+                sdf_cache_key(_tree_fingerprint(tree, base_name, zone_name), bandwidth),
+                lambda: _compute_tree_sdf(tree, base_name, zone_name, bandwidth),
+            )
+        )
     sample.add_field(
         "sdf",
         sdf,
@@ -80,27 +222,371 @@ def update_dataset_with_sdf(
     zone_name: Optional[str] = None,
     in_place: Optional[bool] = False,
     verbose: Optional[bool] = False,
+    n_workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None,
+    sdf_cache: Optional[ArrayCache] = None,
+    bandwidth: Optional[float] = None,
 ) -> Dataset:
     """Update a dataset by computing and adding the Signed Distance Function (SDF) field for each sample and mesh time.
 
+    With `n_workers > 1` or an `executor`, the meshes of all (sample, time) pairs are sent in
+    chunks to worker processes, and the resulting SDF fields are added to the samples in order.
+
+    With an `sdf_cache`, SDF fields are keyed by the fingerprint of the mesh they are computed
+    on: the SDF is computed once per distinct geometry missing from the cache, and copied to
+    all the (sample, time) pairs sharing it.
+
     Args:
         dataset (Dataset): The dataset to update. If `in_place` is False, a copy will be modified and returned.
         base_name (Optional[str], optional): The base name to use when computing the SDF. If None, all bases are used. The SDF is computed using the `compute_sdf` function for each sample and mesh time.
         zone_name (Optional[str], optional): The zone name to use when computing the SDF. If None, all zones are used.
         in_place (Optional[bool], optional): If True, modifies the dataset in place. If False, works on a copy. Defaults to False.
         verbose (Optional[bool], optional): If True, displays a progress bar during processing. Defaults to False.
+        n_workers (int, optional): Number of worker processes. Defaults to 1 (serial execution).
+        executor (Optional[Executor], optional): Executor used to process the chunks of (sample, time) pairs, instead of a process pool with `n_workers` workers; `n_workers` should then be its number of workers.
+        chunksize (Optional[int], optional): Number of (sample, time) pairs per chunk sent to a worker. If None, pairs are split in about four chunks per worker.
+        sdf_cache (Optional[ArrayCache], optional): Cache of SDF fields keyed by mesh fingerprint, which can be shared between calls. If None, the SDF is computed for every (sample, time) pair.
+        bandwidth (Optional[float], optional): Distance to the boundary beyond which the SDF is clamped, see `compute_sdf`. If None, the SDF is computed at all nodes.
 
     Returns:
         Dataset: The updated dataset with the SDF field (named "sdf" at the "Vertex" location) added to each sample for each mesh time. Existing fields are not overwritten (`warning_overwrite=False`).
     """
     if not in_place:
         dataset = dataset.copy()
-    for sample in tqdm(dataset, total=len(dataset), disable=not verbose):
-        for time in sample.get_all_mesh_times():
-            sdf = compute_sdf(sample, base_name, zone_name, time)
+    items = [
+        (sample, time) for sample in dataset for time in sample.get_all_mesh_times()
+    ]
+    trees = [sample.get_mesh(time) for sample, time in items]
+    if sdf_cache is not None:
+        keys = [
+            sdf_cache_key(_tree_fingerprint(tree, base_name, zone_name), bandwidth)
+            for tree in trees
+        ]
+    else:
+        keys = list(range(len(items)))
+
+    sdfs, pending = {}, {}
+    for key, tree in zip(keys, trees):
+        if key in sdfs or key in pending:
+            continue
+        sdf = sdf_cache.get(key) if sdf_cache is not None else None
+        if sdf is None:
+            pending[key] = tree
+        else:
+            sdfs[key] = sdf
+
+    for key, sdf in zip(
+        pending,
+        map_in_chunks(
+            partial(
+                _compute_tree_sdf,
+                base_name=base_name,
+                zone_name=zone_name,
+                bandwidth=bandwidth,
+            ),
+            pending.values(),
+            total=len(pending),
+            n_workers=n_workers,
+            executor=executor,
+            chunksize=chunksize,
+            verbose=verbose,
+        ),
+    ):
+        sdfs[key] = sdf
+        if sdf_cache is not None:
+            sdf_cache.put(key, sdf)
+
+    for (sample, time), key in zip(items, keys):
+        sample.add_field(
+            "sdf",
+            np.array(sdfs[key]) if sdf_cache is not None else sdfs[key],
+            zone_name=zone_name,
+            base_name=base_name,
+            location="Vertex",
+            time=time,
+            warning_overwrite=False,
+        )
+
+    return dataset
+
+
+def _get_default_tags(mesh: Mesh) -> List[str]:
+    # Non-empty nodal tags, then tags of the boundary elements, such as boundary conditions
+    tags = [tag.name for tag in mesh.nodesTags if len(tag) > 0]
+    dim = mesh.nodes.shape[1]
+    for element_type, elements in mesh.elements.items():
+        if ED.dimensionality[element_type] != dim - 1:
+            continue
+        for tag in elements.tags:
+            if len(tag) > 0 and tag.name not in tags:
+                tags.append(tag.name)
+    return tags
+
+
+def _get_tag_node_ids(mesh: Mesh, tag: str) -> Array:
+    ids = [mesh.nodesTags[tag].GetIds()] if tag in mesh.nodesTags else []
+    for _, elements in mesh.elements.items():
+        if tag in elements.tags:
+            ids.append(elements.GetNodesIndexFor(elements.tags[tag].GetIds()))
+    ids = np.unique(np.concatenate(ids)) if ids else np.zeros(0, dtype=np.int64)
+    if len(ids) == 0:
+        raise ValueError(f"tag {tag} is empty or missing")
+    return ids
+
+
+def _compute_mesh_tag_distances(
+    mesh: Mesh,
+    tags: Optional[Sequence[str]] = None,
+    index: Optional[BoundaryIndex] = None,
+    batch_size: int = 65536,
+) -> Dict[str, Field]:
+    if tags is None:
+        tags = _get_default_tags(mesh)
+    if len(tags) == 0:
+        return {}
+    if index is None:
+        index = BoundaryIndex.from_mesh(mesh)
+    distances = index.label_distances(
+        np.asarray(mesh.nodes, dtype=np.float64),
+        [_get_tag_node_ids(mesh, tag) for tag in tags],
+        batch_size=batch_size,
+    )
+    return dict(zip(tags, distances.T))
+
+
+def _compute_tree_tag_distances(
+    tree: CGNSTree,
+    base_name: Optional[str],
+    zone_name: Optional[str],
+    tags: Optional[Sequence[str]] = None,
+    batch_size: int = 65536,
+) -> Dict[str, Field]:
+    return _compute_mesh_tag_distances(
+        tree_to_mesh(tree, base_name, zone_name), tags, batch_size=batch_size
+    )
+
+
+def compute_tag_distances(
+    sample: Sample,
+    tags: Optional[Sequence[str]] = None,
+    base_name: Optional[str] = None,
+    zone_name: Optional[str] = None,
+    time: Optional[float] = None,
+    batch_size: int = 65536,
+) -> Dict[str, Field]:
+    """Compute the distance from each node of the mesh of a Sample to tagged parts of its boundary.
+
+    The part of the boundary of a tag is made of its tagged nodes, and of the skin elements
+    whose nodes all belong to the tag, such as the faces of an element tag of boundary
+    conditions (e.g. inlet, walls or holes). A single `BoundaryIndex` of the skin of the
+    mesh, with its elements labelled by tag, is built and queried once per batch of nodes
+    for all the tags, instead of computing a distance function per tag.
+
+    Args:
+        sample (Sample): The input Sample containing the mesh.
+        tags (Optional[Sequence[str]], optional): Names of the nodal or element tags. If None, all the non-empty nodal tags and the tags of the boundary elements of the mesh are used.
+        base_name (Optional[str]): Name of the base to select. If None, all bases are used.
+        zone_name (Optional[str]): Name of the zone to select. If None, all zones are used.
+        time (Optional[float]): Simulation time to extract the mesh. If None, uses default.
+        batch_size (int, optional): Number of nodes queried at once, bounding the memory used by the queries. Defaults to 65536.
+
+    Returns:
+        Dict[str, Field]: The distance to each tag at the nodes of the mesh, by tag name.
+
+    Raises:
+        ValueError: If a requested tag is empty or missing.
+    """
+    return _compute_tree_tag_distances(
+        sample.get_mesh(time), base_name, zone_name, tags, batch_size
+    )
+
+
+GEOMETRIC_FEATURES = ("boundary_normal", "boundary_point", "tag_distance", "mesh_size")
+_AXES = ("x", "y", "z")
+
+
+def _compute_mesh_size(mesh: Mesh) -> Array:
+    nodes = np.asarray(mesh.nodes, dtype=np.float64)
+    n_nodes, dim = nodes.shape
+    edges = []
+    for element_type, elements in mesh.elements.items():
+        n_elements = elements.GetNumberOfElements()
+        if ED.dimensionality[element_type] != dim or n_elements == 0:
+            continue
+        connectivity = elements.connectivity[:n_elements]
+        for _, local in (ED.faces1 if dim == 2 else ED.faces2)[element_type]:
+            edges.append(connectivity[:, local[:2]])
+    if not edges:
+        return np.zeros(n_nodes)
+
+    # Edges shared by several elements are counted once
+    edges = np.sort(np.concatenate(edges), axis=1).astype(np.int64)
+    edges = np.unique(edges[:, 0] * n_nodes + edges[:, 1])
+    edges = np.stack([edges // n_nodes, edges % n_nodes], axis=1)
+    lengths = np.linalg.norm(nodes[edges[:, 0]] - nodes[edges[:, 1]], axis=1)
+    totals = np.bincount(edges.ravel(), np.repeat(lengths, 2), minlength=n_nodes)
+    counts = np.bincount(edges.ravel(), minlength=n_nodes)
+    return np.divide(totals, counts, out=np.zeros(n_nodes), where=counts > 0)
+
+
+def compute_mesh_geometric_features(
+    mesh: Mesh,
+    features: Sequence[str] = GEOMETRIC_FEATURES,
+    tags: Optional[Sequence[str]] = None,
+    index: Optional[BoundaryIndex] = None,
+) -> Dict[str, Field]:
+    """Compute geometric descriptors at the nodes of a Muscat mesh, see `compute_geometric_features`.
+
+    Args:
+        mesh (Mesh): The Muscat mesh.
+        features (Sequence[str], optional): The features to compute. Defaults to all of them.
+        tags (Optional[Sequence[str]], optional): Names of the nodal or element tags of the "tag_distance" feature. If None, all the non-empty nodal tags and the tags of the boundary elements of the mesh are used.
+        index (Optional[BoundaryIndex], optional): Boundary index of the skin of `mesh`, which can be shared with other computations. If None, it is built on demand.
+
+    Returns:
+        Dict[str, Field]: The computed nodal fields, by name.
+
+    Raises:
+        ValueError: If a feature is unknown, or a requested tag is empty or missing.
+    """
+    unknown = set(features) - set(GEOMETRIC_FEATURES)
+    if unknown:
+        raise ValueError(f"unknown geometric features {sorted(unknown)}")
+    nodes = np.asarray(mesh.nodes, dtype=np.float64)
+    axes = _AXES[: nodes.shape[1]]
+    fields = {}
+
+    if "boundary_normal" in features or "boundary_point" in features:
+        if index is None:
+            index = BoundaryIndex.from_mesh(mesh)
+        _, closest, normals = index.closest_points(nodes)
+        for name, values in (("boundary_normal", normals), ("boundary_point", closest)):
+            if name in features:
+                for axis, component in zip(axes, values.T):
+                    fields[f"{name}_{axis}"] = component
+
+    if "tag_distance" in features:
+        if index is None:
+            index = BoundaryIndex.from_mesh(mesh)
+        for tag, field in _compute_mesh_tag_distances(mesh, tags, index).items():
+            fields[f"distance_{tag}"] = field
+
+    if "mesh_size" in features:
+        fields["mesh_size"] = _compute_mesh_size(mesh)
+    return fields
+
+
+def _compute_tree_geometric_features(
+    tree: CGNSTree,
+    base_name: Optional[str],
+    zone_name: Optional[str],
+    features: Sequence[str] = GEOMETRIC_FEATURES,
+    tags: Optional[Sequence[str]] = None,
+) -> Dict[str, Field]:
+    return compute_mesh_geometric_features(
+        tree_to_mesh(tree, base_name, zone_name), features, tags
+    )
+
+
+def compute_geometric_features(
+    sample: Sample,
+    features: Sequence[str] = GEOMETRIC_FEATURES,
+    tags: Optional[Sequence[str]] = None,
+    base_name: Optional[str] = None,
+    zone_name: Optional[str] = None,
+    time: Optional[float] = None,
+) -> Dict[str, Field]:
+    """Compute geometric descriptors at the nodes of the mesh of a Sample.
+
+    All the descriptors are computed from a single conversion of the mesh, and a single
+    `BoundaryIndex` of its skin queried once for all the nodes. The available features,
+    and the nodal fields they produce, are:
+        - "boundary_normal": unit outward normal of the boundary at the closest boundary point, as `boundary_normal_x`, `boundary_normal_y` (and `boundary_normal_z` in 3D).
+        - "boundary_point": coordinates of the closest boundary point, as `boundary_point_x`, `boundary_point_y` (and `boundary_point_z`).
+        - "tag_distance": distance to the part of the boundary of each tag, see `compute_tag_distances`, as `distance_<tag>`.
+        - "mesh_size": local mesh size, the mean length of the edges of the elements incident to each node, as `mesh_size`; its inverse measures the local mesh density.
+
+    Args:
+        sample (Sample): The input Sample containing the mesh.
+        features (Sequence[str], optional): The features to compute. Defaults to all of them.
+        tags (Optional[Sequence[str]], optional): Names of the nodal or element tags of the "tag_distance" feature. If None, all the non-empty nodal tags and the tags of the boundary elements of the mesh are used.
+        base_name (Optional[str]): Name of the base to select. If None, all bases are used.
+        zone_name (Optional[str]): Name of the zone to select. If None, all zones are used.
+        time (Optional[float]): Simulation time to extract the mesh. If None, uses default.
+
+    Returns:
+        Dict[str, Field]: The computed nodal fields, by name.
+
+    Raises:
+        ValueError: If a feature is unknown, or a requested tag is empty or missing.
+    """
+    return _compute_tree_geometric_features(
+        sample.get_mesh(time), base_name, zone_name, features, tags
+    )
+
+
+def update_dataset_with_geometric_features(
+    dataset: Dataset,
+    features: Sequence[str] = GEOMETRIC_FEATURES,
+    tags: Optional[Sequence[str]] = None,
+    base_name: Optional[str] = None,
+    zone_name: Optional[str] = None,
+    in_place: Optional[bool] = False,
+    verbose: Optional[bool] = False,
+    n_workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None,
+) -> Dataset:
+    """Update a dataset by adding geometric descriptors for each sample and mesh time.
+
+    The descriptors of each (sample, time) pair are computed in one pass by
+    `compute_geometric_features`, sharing the converted mesh, its skin and its boundary
+    index. With `n_workers > 1` or an `executor`, the meshes of all (sample, time) pairs
+    are sent in chunks to worker processes.
+
+    Args:
+        dataset (Dataset): The dataset to update. If `in_place` is False, a copy will be modified and returned.
+        features (Sequence[str], optional): The features to compute, see `compute_geometric_features`. Defaults to all of them.
+        tags (Optional[Sequence[str]], optional): Names of the nodal or element tags of the "tag_distance" feature. If None, all the non-empty nodal tags and the tags of the boundary elements of each mesh are used.
+        base_name (Optional[str], optional): The base name to use. If None, all bases are used.
+        zone_name (Optional[str], optional): The zone name to use. If None, all zones are used.
+        in_place (Optional[bool], optional): If True, modifies the dataset in place. If False, works on a copy. Defaults to False.
+        verbose (Optional[bool], optional): If True, displays a progress bar during processing. Defaults to False.
+        n_workers (int, optional): Number of worker processes. Defaults to 1 (serial execution).
+        executor (Optional[Executor], optional): Executor used to process the chunks of (sample, time) pairs, instead of a process pool with `n_workers` workers; `n_workers` should then be its number of workers.
+        chunksize (Optional[int], optional): Number of (sample, time) pairs per chunk sent to a worker. If None, pairs are split in about four chunks per worker.
+
+    Returns:
+        Dataset: The updated dataset, with the descriptors added at the "Vertex" location to each sample for each mesh time. Existing fields are not overwritten (`warning_overwrite=False`).
+    """
+    if not in_place:
+        dataset = dataset.copy()
+    items = [
+        (sample, time) for sample in dataset for time in sample.get_all_mesh_times()
+    ]
+    for (sample, time), fields in zip(
+        items,
+        map_in_chunks(
+            partial(
+                _compute_tree_geometric_features,
+                base_name=base_name,
+                zone_name=zone_name,
+                features=features,
+                tags=tags,
+            ),
+            (sample.get_mesh(time) for sample, time in items),
+            total=len(items),
+            n_workers=n_workers,
+            executor=executor,
+            chunksize=chunksize,
+            verbose=verbose,
+        ),
+    ):
+        for name, field in fields.items():
             sample.add_field(
-                "sdf",
-                sdf,
+                name,
+                field,
                 zone_name=zone_name,
                 base_name=base_name,
                 location="Vertex",
@@ -0,0 +1,157 @@
+"""Module implementing fast fingerprints of CGNS meshes and arrays."""
+
+import hashlib
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from plaid.types import Array, CGNSTree
+
+_ELEMENTS_ARRAYS = ("ElementRange", "ElementConnectivity", "ElementStartOffset")
+
+
+def _update(hasher, name: str, array: Optional[Array]) -> None:
+    hasher.update(name.encode())
+    if array is None:
+        return
+    array = np.ascontiguousarray(array)
+    hasher.update(f"{array.dtype.str}{array.shape}".encode())
+    hasher.update(array)
+
+
+def _children(node: list, label: str) -> Iterator[list]:
+    for child in node[2]:
+        if child[3] == label:
+            yield child
+
+
+def compute_array_fingerprint(*arrays: Array) -> str:
+    """Compute a fingerprint of the content of one or several arrays.
+
+    Args:
+        *arrays (Array): The arrays to fingerprint, in order.
+
+    Returns:
+        str: Hexadecimal digest identifying the dtype, shape and values of the arrays.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for i, array in enumerate(arrays):
+        _update(hasher, str(i), np.asarray(array))
+    return hasher.hexdigest()
+
+
+def _mesh_arrays(
+    tree: CGNSTree,
+    base_names: Optional[Sequence[str]] = None,
+    zone_names: Optional[Sequence[str]] = None,
+) -> Iterator[Tuple[str, Optional[Array]]]:
+    for base in _children(tree, "CGNSBase_t"):
+        if base_names is not None and base[0] not in base_names:
+            continue
+        yield base[0], base[1]
+        for zone in _children(base, "Zone_t"):
+            if zone_names is not None and zone[0] not in zone_names:
+                continue
+            yield zone[0], zone[1]
+            for grid in _children(zone, "GridCoordinates_t"):
+                for coordinate in _children(grid, "DataArray_t"):
+                    yield coordinate[0], coordinate[1]
+            for elements in _children(zone, "Elements_t"):
+                yield elements[0], elements[1]
+                for child in elements[2]:
+                    if child[0] in _ELEMENTS_ARRAYS:
+                        yield child[0], child[1]
+
+
+def compute_mesh_fingerprint(
+    tree: CGNSTree,
+    base_names: Optional[Sequence[str]] = None,
+    zone_names: Optional[Sequence[str]] = None,
+) -> str:
+    """Compute a fingerprint of the geometry and connectivity of a CGNS mesh.
+
+    Only the node coordinates and the element sections of the selected zones are
+    hashed: two trees sharing a mesh but carrying different fields have the same
+    fingerprint. The tree is read in place, without conversion to a Muscat mesh.
+
+    Args:
+        tree (CGNSTree): The CGNS tree containing the mesh.
+        base_names (Optional[Sequence[str]], optional): The base names to consider. If None, uses all bases.
+        zone_names (Optional[Sequence[str]], optional): The zone names to consider. If None, uses all zones.
+
+    Returns:
+        str: Hexadecimal digest identifying the mesh.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for name, array in _mesh_arrays(tree, base_names, zone_names):
+        _update(hasher, name, array)
+    return hasher.hexdigest()
+
+
+class MeshFingerprinter:
+    """Fingerprint the meshes of successive CGNS trees, such as the time steps of a sample.
+
+    The fingerprint of the last tree is kept together with references to its coordinate
+    and connectivity arrays. When the next tree holds the very same array objects, as is
+    the case for time steps sharing a static mesh, the fingerprint is returned without
+    hashing; otherwise it is computed with `compute_mesh_fingerprint`. Arrays modified in
+    place between two calls are therefore not detected.
+
+    Args:
+        base_names (Optional[Sequence[str]], optional): The base names to consider. If None, uses all bases.
+        zone_names (Optional[Sequence[str]], optional): The zone names to consider. If None, uses all zones.
+    """
+
+    def __init__(
+        self,
+        base_names: Optional[Sequence[str]] = None,
+        zone_names: Optional[Sequence[str]] = None,
+    ):
+        self.base_names = base_names
+        self.zone_names = zone_names
+        self._arrays: List[Tuple[str, Optional[Array]]] = []
+        self._fingerprint: Optional[str] = None
+
+    def __call__(self, tree: CGNSTree) -> str:
+        """Return the fingerprint of the mesh of `tree`.
+
+        Args:
+            tree (CGNSTree): The CGNS tree containing the mesh.
+
+        Returns:
+            str: Hexadecimal digest identifying the mesh, as computed by `compute_mesh_fingerprint`.
+        """
+        arrays = list(_mesh_arrays(tree, self.base_names, self.zone_names))
+        if (
+            self._fingerprint is None
+            or len(arrays) != len(self._arrays)
+            or any(
+                name != previous_name or array is not previous_array
+                for (name, array), (previous_name, previous_array) in zip(
+                    arrays, self._arrays
+                )
+            )
+        ):
+            hasher = hashlib.blake2b(digest_size=16)
+            for name, array in arrays:
+                _update(hasher, name, array)
+            self._fingerprint = hasher.hexdigest()
+        self._arrays = arrays
+        return self._fingerprint
+
+
+def create_mesh_fingerprinter(
+    base_name: Optional[str] = None, zone_name: Optional[str] = None
+) -> MeshFingerprinter:
+    """Create a `MeshFingerprinter` of a single base and zone.
+
+    Args:
+        base_name (Optional[str], optional): Name of the base to consider. If None, uses all bases.
+        zone_name (Optional[str], optional): Name of the zone to consider. If None, uses all zones.
+
+    Returns:
+        MeshFingerprinter: The fingerprinter of the selected base and zone.
+    """
+    return MeshFingerprinter(
+        [base_name] if base_name is not None else None,
+        [zone_name] if zone_name is not None else None,
+    )
@@ -0,0 +1,422 @@
+"""Module implementing transfer operators between meshes and point clouds."""
+
+import itertools
+from pathlib import Path
+from typing import Dict, Hashable, Optional, Sequence, Tuple, Union
+
+import Muscat
+import Muscat.MeshContainers.ElementsDescription as ED
+import numpy as np
+from Muscat.FE.FETools import PrepareFEComputation
+from Muscat.FE.Fields.FEField import FEField
+from Muscat.MeshContainers.Filters.FilterObjects import ElementFilter
+from Muscat.MeshContainers.Mesh import Mesh
+from Muscat.MeshTools.MeshFieldOperations import GetFieldTransferOp
+from numpy.typing import DTypeLike
+from plaid.types import Array, Field
+from scipy.sparse import csr_matrix
+from scipy.spatial import cKDTree
+
+from plaid_ops import __version__
+from plaid_ops.common.cache import ArrayCache
+from plaid_ops.mesh.reader import MeshView
+
+_SIMPLICES = {2: ED.ElementType.Triangle_3, 3: ED.ElementType.Tetrahedron_4}
+
+
+def _compact_operator(op: csr_matrix, dtype: DTypeLike) -> csr_matrix:
+    dtype = np.dtype(dtype)
+    assert np.issubdtype(dtype, np.floating), "`dtype` should be a floating-point type"
+    index_dtype = (
+        np.int32 if max(op.nnz, *op.shape) <= np.iinfo(np.int32).max else np.int64
+    )
+    op = op.tocsr()
+    return csr_matrix(
+        (
+            op.data.astype(dtype, copy=False),
+            op.indices.astype(index_dtype, copy=False),
+            op.indptr.astype(index_dtype, copy=False),
+        ),
+        shape=op.shape,
+    )
+
+
+def prepare_transfer_field(mesh: Mesh) -> FEField:
+    """Prepare the nodal finite-element field of a mesh used to assemble transfer operators.
+
+    Args:
+        mesh (Mesh): The source Muscat mesh.
+
+    Returns:
+        FEField: A nodal field of `mesh`, which can be passed to `compute_transfer_operator` to share the finite-element preparation of `mesh` between several operators.
+    """
+    space, numberings, _, _ = PrepareFEComputation(mesh, numberOfComponents=1)
+    return FEField("", mesh=mesh, space=space, numbering=numberings[0])
+
+
+def compute_transfer_operator(
+    mesh: Union[Mesh, MeshView],
+    target_points: Array,
+    method: str = "Interp/Clamp",
+    dtype: DTypeLike = np.float64,
+    field: Optional[FEField] = None,
+) -> csr_matrix:
+    """Assemble the sparse operator transferring nodal fields of a mesh to target points.
+
+    The values of a nodal field `field` of `mesh` at `target_points` are given by `op.dot(field)`.
+    The operator is stored with 32-bit indices whenever its size allows it.
+
+    With the "Nearest/Nearest" method, the nearest node of each target point is found with
+    a KD-tree over the mesh nodes, without finite-element machinery: `mesh` can then be a
+    `MeshView`, read from a CGNS tree without conversion.
+
+    Args:
+        mesh (Union[Mesh, MeshView]): The source Muscat mesh, or a `MeshView` with the "Nearest/Nearest" method.
+        target_points (Array): Coordinates of the target points, of shape (n_points, dim).
+        method (str, optional): Projection method, see `GetFieldTransferOp`. Defaults to "Interp/Clamp".
+        dtype (DTypeLike, optional): Floating-point type of the operator coefficients; `np.float32` halves the memory footprint of the operator. Defaults to `np.float64`.
+        field (Optional[FEField], optional): Nodal field of `mesh` returned by `prepare_transfer_field`. If None, it is prepared on each call.
+
+    Returns:
+        csr_matrix: The transfer operator, of shape (n_points, n_nodes).
+    """
+    if method == "Nearest/Nearest":
+        nodes = np.asarray(mesh.nodes)
+        _, nearest = cKDTree(nodes).query(np.asarray(target_points, dtype=np.float64))
+        n_points = len(nearest)
+        return _compact_operator(
+            csr_matrix(
+                (np.ones(n_points), nearest, np.arange(n_points + 1)),
+                shape=(n_points, len(nodes)),
+            ),
+            dtype,
+        )
+    if field is None:
+        field = prepare_transfer_field(mesh)
+    op, _, _ = GetFieldTransferOp(
+        field,
+        np.ascontiguousarray(target_points, dtype=np.float64),
+        method=method,
+        verbose=False,
+        elementFilter=ElementFilter(),
+    )
+    return _compact_operator(op, dtype)
+
+
+def _grid_points(
+    indices: Array, dimensions: Array, origin: Array, spacing: Array
+) -> Array:
+    return origin + spacing * np.stack(np.unravel_index(indices, dimensions), axis=-1)
+
+
+def _rasterize_simplices(
+    nodes: Array,
+    connectivity: Array,
+    dimensions: Array,
+    origin: Array,
+    spacing: Array,
+    batch_size: int,
+    tol: float = 1e-10,
+) -> Tuple[Array, Array, Array]:
+    dim = len(dimensions)
+    vertices = nodes[connectivity]
+    edges = vertices[:, 1:] - vertices[:, :1]
+
+    scale = np.abs(edges).max(axis=(1, 2)) ** dim
+    valid = np.abs(np.linalg.det(edges)) > tol * scale
+    inverse = np.zeros_like(edges)
+    inverse[valid] = np.linalg.inv(np.swapaxes(edges[valid], 1, 2))
+
+    lo = np.ceil((vertices.min(axis=1) - origin) / spacing - tol).astype(int)
+    hi = np.floor((vertices.max(axis=1) - origin) / spacing + tol).astype(int)
+    extents = (
+        np.maximum(np.minimum(hi, dimensions - 1) - np.maximum(lo, 0) + 1, 0)
+        * valid[:, None]
+    )
+    lo = np.maximum(lo, 0)
+    counts = np.prod(extents, axis=1)
+
+    cumulated_counts = np.cumsum(counts)
+    bounds = np.searchsorted(
+        cumulated_counts,
+        np.arange(batch_size, cumulated_counts[-1], batch_size),
+        side="right",
+    )
+    bounds = np.unique(np.concatenate(([0], bounds, [len(counts)])))
+
+    points, elements, weights = [], [], []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        batch_counts = counts[start:stop]
+        batch_elements = np.repeat(np.arange(start, stop), batch_counts)
+        local = np.arange(len(batch_elements)) - np.repeat(
+            np.cumsum(batch_counts) - batch_counts, batch_counts
+        )
+        indices = np.empty((len(batch_elements), dim), dtype=int)
+        for axis in reversed(range(dim)):
+            extent = extents[batch_elements, axis]
+            indices[:, axis] = local % extent
+            local //= extent
+        indices += lo[batch_elements]
+
+        coordinates = origin + spacing * indices
+        barycentric = np.einsum(
+            "nij,nj->ni",
+            inverse[batch_elements],
+            coordinates - vertices[batch_elements, 0],
+        )
+        barycentric = np.column_stack((1.0 - barycentric.sum(axis=1), barycentric))
+        inside = np.all(barycentric >= -tol, axis=1)
+
+        points.append(np.ravel_multi_index(indices[inside].T, dimensions))
+        elements.append(batch_elements[inside])
+        weights.append(barycentric[inside])
+
+    points = np.concatenate(points)
+    _, first = np.unique(points, return_index=True)
+    return (
+        points[first],
+        np.concatenate(elements)[first],
+        np.concatenate(weights)[first],
+    )
+
+
+def compute_grid_transfer_operator(
+    mesh: Mesh,
+    dimensions: Sequence[int],
+    origin: Array,
+    spacing: Array,
+    method: str = "Interp/Clamp",
+    batch_size: int = 2**20,
+    dtype: DTypeLike = np.float64,
+) -> csr_matrix:
+    """Assemble the sparse operator transferring nodal fields of a mesh to the nodes of a regular grid.
+
+    Specialised version of `compute_transfer_operator` for a `CreateConstantRectilinearMesh`
+    target: each source element is rasterised over the grid nodes covered by its bounding
+    box, which are located with integer arithmetic instead of a tree search, and the
+    interpolation weights are evaluated with vectorised barycentric coordinates. Elements
+    that do not overlap the grid are discarded upfront, so that operators of small grids
+    (e.g., tiles of a larger grid) are cheap to assemble.
+
+    The fast path applies to the "Interp/*" methods on meshes whose elements of maximal
+    dimension are linear simplices (Triangle_3 in 2D, Tetrahedron_4 in 3D). Grid nodes
+    lying outside the mesh are then handled by `compute_transfer_operator`, according to
+    `method`; other configurations fall back entirely to `compute_transfer_operator`.
+    Rows of grid nodes inside the mesh match the ones of the generic path, up to the choice
+    of the element for nodes lying on shared faces.
+
+    Args:
+        mesh (Mesh): The source Muscat mesh.
+        dimensions (Sequence[int]): Number of grid points along each axis (e.g., [nx, ny, nz]).
+        origin (Array): Coordinates of the first grid node.
+        spacing (Array): Grid spacing along each axis.
+        method (str, optional): Projection method, see `GetFieldTransferOp`. Defaults to "Interp/Clamp".
+        batch_size (int, optional): Maximum number of (element, grid node) candidate pairs evaluated at once. Defaults to 2**20.
+        dtype (DTypeLike, optional): Floating-point type of the operator coefficients. Defaults to `np.float64`.
+
+    Returns:
+        csr_matrix: The transfer operator, of shape (n_grid_nodes, n_nodes), with grid nodes ordered as in `CreateConstantRectilinearMesh`.
+    """
+    dimensions = np.asarray(dimensions, dtype=int)
+    origin = np.asarray(origin, dtype=np.float64)
+    spacing = np.asarray(spacing, dtype=np.float64)
+    dim = len(dimensions)
+    n_points = int(np.prod(dimensions))
+
+    containers = [
+        (element_type, data)
+        for element_type, data in mesh.elements.items()
+        if ED.dimensionality[element_type] == dim and data.GetNumberOfElements() > 0
+    ]
+    if (
+        not method.startswith("Interp/")
+        or mesh.nodes.shape[1] != dim
+        or not containers
+        or any(element_type != _SIMPLICES.get(dim) for element_type, _ in containers)
+    ):
+        return compute_transfer_operator(
+            mesh,
+            _grid_points(np.arange(n_points), dimensions, origin, spacing),
+            method,
+            dtype=dtype,
+        )
+
+    connectivity = np.vstack([data.connectivity for _, data in containers])
+    vertices = mesh.nodes[connectivity]
+    margin = 1e-10 * spacing
+    overlapping = np.all(
+        (vertices.max(axis=1) >= origin - margin)
+        & (vertices.min(axis=1) <= origin + spacing * (dimensions - 1) + margin),
+        axis=1,
+    )
+    connectivity = connectivity[overlapping]
+
+    rows, cols, vals = [], [], []
+    found = np.zeros(n_points, dtype=bool)
+    if len(connectivity) > 0:
+        points, elements, weights = _rasterize_simplices(
+            mesh.nodes, connectivity, dimensions, origin, spacing, batch_size
+        )
+        rows.append(np.repeat(points, dim + 1))
+        cols.append(connectivity[elements].ravel())
+        vals.append(weights.ravel())
+        found[points] = True
+
+    missing = np.flatnonzero(~found)
+    if missing.size > 0:
+        fallback = compute_transfer_operator(
+            mesh, _grid_points(missing, dimensions, origin, spacing), method
+        ).tocoo()
+        rows.append(missing[fallback.row])
+        cols.append(fallback.col)
+        vals.append(fallback.data)
+
+    return _compact_operator(
+        csr_matrix(
+            (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n_points, mesh.GetNumberOfNodes()),
+        ),
+        dtype,
+    )
+
+
+def compute_grid_interpolation_operator(
+    points: Array,
+    dimensions: Sequence[int],
+    origin: Array,
+    spacing: Array,
+    dtype: DTypeLike = np.float64,
+) -> csr_matrix:
+    """Assemble the sparse operator interpolating nodal fields of a regular grid at arbitrary points.
+
+    Inverse counterpart of `compute_grid_transfer_operator`: each point is located in its
+    grid cell with integer arithmetic, and the values at the 2**dim cell corners are
+    combined with multilinear (bilinear in 2D, trilinear in 3D) weights. Points lying
+    outside the grid take the values of the closest point of the grid box.
+
+    Args:
+        points (Array): Coordinates of the target points, of shape (n_points, dim).
+        dimensions (Sequence[int]): Number of grid points along each axis (e.g., [nx, ny, nz]), each at least 2.
+        origin (Array): Coordinates of the first grid node.
+        spacing (Array): Grid spacing along each axis.
+        dtype (DTypeLike, optional): Floating-point type of the operator coefficients. Defaults to `np.float64`.
+
+    Returns:
+        csr_matrix: The interpolation operator, of shape (n_points, n_grid_nodes), with grid nodes ordered as in `CreateConstantRectilinearMesh`.
+    """
+    dimensions = np.asarray(dimensions, dtype=int)
+    points = np.asarray(points, dtype=np.float64)
+    dim = len(dimensions)
+    assert points.shape[1] == dim, "`points` should have `len(dimensions)` columns"
+    assert np.all(dimensions >= 2), "`dimensions` should be at least 2 along each axis"
+
+    coordinates = (points - np.asarray(origin)) / np.asarray(spacing)
+    cells = np.clip(np.floor(coordinates).astype(int), 0, dimensions - 2)
+    fractions = np.clip(coordinates - cells, 0.0, 1.0)
+
+    corners = np.array(list(itertools.product((0, 1), repeat=dim)))
+    cols = np.ravel_multi_index(
+        np.moveaxis(cells[:, None, :] + corners[None, :, :], -1, 0), dimensions
+    )
+    vals = np.prod(
+        np.where(
+            corners[None, :, :] == 1, fractions[:, None, :], 1.0 - fractions[:, None, :]
+        ),
+        axis=2,
+    )
+    rows = np.repeat(np.arange(len(points)), len(corners))
+    return _compact_operator(
+        csr_matrix(
+            (vals.ravel(), (rows, cols.ravel())),
+            shape=(len(points), int(np.prod(dimensions))),
+        ),
+        dtype,
+    )
+
+
+def apply_transfer_operator(
+    op: csr_matrix, fields: Dict[str, Field]
+) -> Dict[str, Field]:
+    """Apply a transfer operator to several nodal fields with a single sparse product.
+
+    The fields are stacked column-wise into one contiguous (n_nodes, n_fields) array, so
+    that the operator is traversed once for all fields instead of once per field. Real
+    fields are cast to the type of the operator, so that a float32 operator yields float32
+    fields.
+
+    Args:
+        op (csr_matrix): The transfer operator, of shape (n_points, n_nodes).
+        fields (Dict[str, Field]): The nodal fields to transfer, by name. Each field has n_nodes rows.
+
+    Returns:
+        Dict[str, Field]: The transferred fields, by name, each with n_points rows.
+    """
+    if not fields:
+        return {}
+    columns = [np.reshape(field, (op.shape[1], -1)) for field in fields.values()]
+    stacked = np.empty(
+        (op.shape[1], sum(column.shape[1] for column in columns)),
+        dtype=np.result_type(
+            op.dtype, *(column for column in columns if np.iscomplexobj(column))
+        ),
+    )
+    np.concatenate(columns, axis=1, out=stacked)
+    projected = op @ stacked
+    splits = np.cumsum([column.shape[1] for column in columns])[:-1]
+    return {
+        name: np.ascontiguousarray(column).reshape((op.shape[0],) + np.shape(field)[1:])
+        for (name, field), column in zip(
+            fields.items(), np.split(projected, splits, axis=1)
+        )
+    }
+
+
+class OperatorCache(ArrayCache):
+    """Least-recently-used cache of transfer operators.
+
+    Operators are keyed by the caller, typically with fingerprints of the source
+    mesh and of the target points together with the projection method, so that
+    samples sharing a mesh pay for operator assembly only once.
+
+    If `cache_dir` is provided, operators are also persisted there as CSR arrays,
+    keyed by the plaid-ops and Muscat versions as well, and memory-mapped on later
+    runs: re-running a pipeline on an unchanged dataset skips assembly completely.
+    As for an `ArrayCache`, `hits` counts the lookups served from the cache, among
+    which `disk_hits` were loaded from disk, and `misses` those that required
+    assembling an operator.
+
+    When pickled, for instance to be sent to worker processes, the cache drops its
+    in-memory operators but keeps its persistent cache directory.
+
+    Args:
+        maxsize (int, optional): Maximum number of operators kept in memory. Defaults to 16.
+        cache_dir (Optional[Union[str, Path]], optional): Directory of the persistent cache. If None, operators are only cached in memory.
+        max_disk_bytes (Optional[int], optional): Maximum size of the persistent cache, in bytes. If None, the persistent cache is unbounded.
+        verify (bool, optional): If True, the checksums of the operators loaded from disk are verified, see `DiskCache`. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 16,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_disk_bytes: Optional[int] = None,
+        verify: bool = False,
+    ):
+        super().__init__(maxsize, cache_dir, max_disk_bytes, verify)
+
+    def _disk_key(self, key: Hashable) -> Hashable:
+        return (key, __version__, Muscat.__version__)
+
+    def _to_arrays(self, value: csr_matrix) -> Dict[str, Array]:
+        return {
+            "data": value.data,
+            "indices": value.indices,
+            "indptr": value.indptr,
+            "shape": np.array(value.shape),
+        }
+
+    def _from_arrays(self, arrays: Dict[str, np.ndarray]) -> csr_matrix:
+        return csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=tuple(arrays["shape"]),
+        )
@@ -0,0 +1,566 @@
+"""Module implementing fused pipelines of mesh operations over plaid datasets."""
+
+import copy
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from Muscat.Bridges.CGNSBridge import MeshToCGNS
+from Muscat.MeshContainers.Mesh import Mesh
+from numpy.typing import DTypeLike
+from plaid.containers.dataset import Dataset
+from plaid.containers.sample import Sample
+from plaid.types import Array, CGNSTree, Field
+
+from plaid_ops.common.cache import ArrayCache, LRUCache
+from plaid_ops.common.conversion import cgns_to_mesh, load_mesh
+from plaid_ops.common.parallel import map_in_chunks
+from plaid_ops.mesh.distance import BoundaryIndex
+from plaid_ops.mesh.feature_engineering import (
+    GEOMETRIC_FEATURES,
+    compute_mesh_geometric_features,
+    compute_mesh_sdf,
+    sdf_cache_key,
+)
+from plaid_ops.mesh.fingerprint import MeshFingerprinter, create_mesh_fingerprinter
+from plaid_ops.mesh.operators import (
+    OperatorCache,
+    apply_transfer_operator,
+    compute_transfer_operator,
+)
+from plaid_ops.mesh.reader import read_node_fields
+from plaid_ops.mesh.transformations import (
+    compute_bounding_box,
+    create_regular_grid,
+)
+
+
+class SampleContext:
+    """State of a (sample, time) pair shared by the stages of a `Pipeline`.
+
+    The tree of the sample is left untouched while the stages run: the nodal fields they
+    compute are collected in `fields`, and only written to the output sample once all the
+    stages are applied. The Muscat mesh converted from the tree and its fingerprint are
+    thus computed at most once, and shared by all the stages, as can be any other
+    intermediate through `get_or_compute`.
+
+    A projection stage replaces the support of the context with `set_support`: later
+    stages then work on the projected tree, whose single zone carries the projected fields.
+
+    Args:
+        sample (Sample): The sample being processed.
+        time (float): The time step being processed.
+        base_name (Optional[str], optional): Name of the base to use. If None, uses all bases.
+        zone_name (Optional[str], optional): Name of the zone to use. If None, uses all zones.
+        fingerprinter (Optional[MeshFingerprinter], optional): Fingerprinter of the meshes of the sample, shared by its time steps so that static meshes are hashed once. If None, a new one is used.
+    """
+
+    def __init__(
+        self,
+        sample: Sample,
+        time: float,
+        base_name: Optional[str] = None,
+        zone_name: Optional[str] = None,
+        fingerprinter: Optional[MeshFingerprinter] = None,
+    ):
+        self.sample = sample
+        self.time = time
+        self.base_name = base_name
+        self.zone_name = zone_name
+        self.tree: CGNSTree = sample.get_mesh(time)
+        self.fields: Dict[str, Field] = {}
+        self.projected = False
+        self._fingerprinter = (
+            fingerprinter
+            if fingerprinter is not None
+            else create_mesh_fingerprinter(base_name, zone_name)
+        )
+        self._intermediates: Dict[str, Any] = {}
+
+    @property
+    def base_names(self) -> Optional[List[str]]:
+        """Base selection of the current support, as expected by the conversion functions."""
+        return [self.base_name] if self.base_name is not None else None
+
+    @property
+    def zone_names(self) -> Optional[List[str]]:
+        """Zone selection of the current support, as expected by the conversion functions."""
+        return [self.zone_name] if self.zone_name is not None else None
+
+    def get_or_compute(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Return the intermediate stored under `name`, computing it with `compute` on first access.
+
+        Args:
+            name (str): The name of the intermediate.
+            compute (Callable[[], Any]): Function computing the intermediate.
+
+        Returns:
+            Any: The intermediate, shared by all the stages until the support is replaced.
+        """
+        if name not in self._intermediates:
+            self._intermediates[name] = compute()
+        return self._intermediates[name]
+
+    @property
+    def mesh(self) -> Mesh:
+        """Muscat mesh of the current support, which must not be modified."""
+        return self.get_or_compute(
+            "mesh", lambda: cgns_to_mesh(self.tree, self.base_names, self.zone_names)
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the mesh of the current support."""
+        return self.get_or_compute(
+            "fingerprint", lambda: self._fingerprinter(self.tree)
+        )
+
+    def get_fields(self) -> Dict[str, Field]:
+        """Return the nodal fields of the current support, including those computed by the stages.
+
+        Returns:
+            Dict[str, Field]: The nodal fields, by name.
+        """
+        if self.projected:
+            return dict(self.fields)
+        fields = read_node_fields(self.tree, self.base_names, self.zone_names)
+        fields.update(self.fields)
+        return fields
+
+    def set_support(self, tree: CGNSTree, fields: Dict[str, Field]) -> None:
+        """Replace the support by a projected tree with a single zone.
+
+        Args:
+            tree (CGNSTree): The tree of the projected mesh, without fields.
+            fields (Dict[str, Field]): The nodal fields projected onto the nodes of `tree`.
+        """
+        self.tree = tree
+        self.fields = dict(fields)
+        self.projected = True
+        self.base_name = None
+        self.zone_name = None
+        self._fingerprinter = MeshFingerprinter()
+        self._intermediates.clear()
+
+
+class Stage(ABC):
+    """Base class of the operations registered in a `Pipeline`.
+
+    A stage is applied to each (sample, time) pair by `apply`, which either adds nodal
+    fields to `context.fields`, or projects the fields of the context onto another mesh
+    with `context.set_support`. Stages are sent to the worker processes in parallel
+    execution, and should therefore be picklable.
+    """
+
+    def prepare(
+        self, dataset: Dataset, base_name: Optional[str], zone_name: Optional[str]
+    ) -> None:
+        """Prepare the stage before a pass over `dataset`, e.g. with quantities computed on all its samples.
+
+        Args:
+            dataset (Dataset): The dataset about to be processed.
+            base_name (Optional[str]): Name of the base used by the pipeline.
+            zone_name (Optional[str]): Name of the zone used by the pipeline.
+        """
+
+    @abstractmethod
+    def apply(self, context: SampleContext) -> None:
+        """Apply the stage to a (sample, time) pair.
+
+        Args:
+            context (SampleContext): The state of the pair, updated in place.
+        """
+
+
+def _get_boundary_index(context: SampleContext) -> BoundaryIndex:
+    return context.get_or_compute(
+        "boundary_index", lambda: BoundaryIndex.from_mesh(context.mesh)
+    )
+
+
+class SDFStage(Stage):
+    """Stage adding the signed distance function of the mesh, see `update_dataset_with_sdf`.
+
+    Args:
+        bandwidth (Optional[float], optional): Distance to the boundary beyond which the SDF is clamped, see `compute_sdf`. If None, the SDF is computed at all nodes.
+        sdf_cache (Optional[ArrayCache], optional): Cache of SDF fields keyed by mesh fingerprint, which can be shared with `update_dataset_with_sdf`. If None, the SDF is always computed.
+        name (str, optional): Name of the added field. Defaults to "sdf".
+    """
+
+    def __init__(
+        self,
+        bandwidth: Optional[float] = None,
+        sdf_cache: Optional[ArrayCache] = None,
+        name: str = "sdf",
+    ):
+        self.bandwidth = bandwidth
+        self.sdf_cache = sdf_cache
+        self.name = name
+
+    def apply(self, context: SampleContext) -> None:
+        """Add the SDF of the mesh of `context` to its fields."""
+
+        def compute() -> Field:
+            if self.bandwidth is None:
+                return compute_mesh_sdf(context.mesh)
+            return compute_mesh_sdf(
+                context.mesh, self.bandwidth, _get_boundary_index(context)
+            )
+
+        if self.sdf_cache is None:
+            sdf = compute()
+        else:
+            sdf = np.array(
+                self.sdf_cache.get_or_compute(
+                    sdf_cache_key(context.fingerprint, self.bandwidth), compute
+                )
+            )
+        context.fields[self.name] = sdf
+
+
+class GeometricFeaturesStage(Stage):
+    """Stage adding geometric descriptors of the mesh, see `compute_geometric_features`.
+
+    The boundary index of the skin of the mesh is shared with the other stages of the
+    pipeline that need it, such as an `SDFStage` with a bandwidth.
+
+    Args:
+        features (Sequence[str], optional): The features to compute, see `compute_geometric_features`. Defaults to all of them.
+        tags (Optional[Sequence[str]], optional): Names of the nodal or element tags of the "tag_distance" feature. If None, all the non-empty nodal tags and the tags of the boundary elements of each mesh are used.
+    """
+
+    def __init__(
+        self,
+        features: Sequence[str] = GEOMETRIC_FEATURES,
+        tags: Optional[Sequence[str]] = None,
+    ):
+        self.features = features
+        self.tags = tags
+
+    def apply(self, context: SampleContext) -> None:
+        """Add the geometric descriptors of the mesh of `context` to its fields."""
+        index = None
+        if set(self.features) & {"boundary_normal", "boundary_point", "tag_distance"}:
+            index = _get_boundary_index(context)
+        context.fields.update(
+            compute_mesh_geometric_features(
+                context.mesh, self.features, self.tags, index
+            )
+        )
+
+
+class RegularGridStage(Stage):
+    """Stage projecting the nodal fields onto a regular grid, see `project_on_regular_grid`.
+
+    Args:
+        dimensions (Sequence[int]): Number of grid points along each axis (e.g., [nx, ny, nz]).
+        bbox (Optional[Sequence[Array]], optional): Bounding box as (mins, maxs). If None, the bounding box of the processed dataset is computed by `compute_bounding_box` before the pass, from the node coordinates only.
+        method (str, optional): Projection method, see `project_on_regular_grid`. Defaults to "Interp/Clamp".
+        engine (str, optional): Operator assembly engine, see `project_on_regular_grid`. Defaults to "muscat".
+        dtype (DTypeLike, optional): Floating-point type of the transfer operators and projected fields. Defaults to `np.float64`.
+        operator_cache (Optional[OperatorCache], optional): Cache of transfer operators, which can be shared with `project_on_regular_grid`. If None, a cache local to the stage is used.
+    """
+
+    def __init__(
+        self,
+        dimensions: Sequence[int],
+        bbox: Optional[Sequence[Array]] = None,
+        method: str = "Interp/Clamp",
+        engine: str = "muscat",
+        dtype: DTypeLike = np.float64,
+        operator_cache: Optional[OperatorCache] = None,
+    ):
+        self.dimensions = dimensions
+        self.bbox = bbox
+        self.method = method
+        self.engine = engine
+        self.dtype = dtype
+        self.operator_cache = (
+            operator_cache if operator_cache is not None else OperatorCache()
+        )
+        self._grid = None
+        if bbox is not None:
+            self._grid = create_regular_grid(dimensions, bbox, method, engine, dtype)
+
+    def prepare(
+        self, dataset: Dataset, base_name: Optional[str], zone_name: Optional[str]
+    ) -> None:
+        """Compute the bounding box of `dataset` if none was provided."""
+        if self.bbox is not None:
+            return
+        bbox = compute_bounding_box(
+            dataset,
+            base_names=[base_name] if base_name is not None else None,
+            zone_names=[zone_name] if zone_name is not None else None,
+        )
+        self._grid = create_regular_grid(
+            self.dimensions, bbox, self.method, self.engine, self.dtype
+        )
+
+    def apply(self, context: SampleContext) -> None:
+        """Replace the support of `context` by the grid, carrying the projected fields."""
+        assert self._grid is not None, "`prepare` should be called without a `bbox`"
+        background_mesh, grid_key, compute_operator = self._grid
+        op = self.operator_cache.get_or_compute(
+            (context.fingerprint, *grid_key),
+            lambda: compute_operator(
+                context.tree, context.base_names, context.zone_names
+            ),
+        )
+        context.set_support(
+            MeshToCGNS(background_mesh, exportOriginalIDs=False),
+            apply_transfer_operator(op, context.get_fields()),
+        )
+
+
+class ReferenceSampleStage(Stage):
+    """Stage projecting the nodal fields onto the mesh of a reference sample.
+
+    This is the fused counterpart of `project_on_other_dataset` with `join="broadcast"`:
+    if the reference has a single time step, its mesh is used for all the time steps.
+
+    Args:
+        reference (Sample): The sample providing the target mesh geometry.
+        method (str, optional): Projection method, see `project_on_other_dataset`. Defaults to "Interp/Clamp".
+        dtype (DTypeLike, optional): Floating-point type of the transfer operators and projected fields. Defaults to `np.float64`.
+        operator_cache (Optional[OperatorCache], optional): Cache of transfer operators, which can be shared with `project_on_other_dataset`. If None, a cache local to the stage is used.
+    """
+
+    def __init__(
+        self,
+        reference: Sample,
+        method: str = "Interp/Clamp",
+        dtype: DTypeLike = np.float64,
+        operator_cache: Optional[OperatorCache] = None,
+    ):
+        self.reference = reference
+        self.method = method
+        self.dtype = dtype
+        self.operator_cache = (
+            operator_cache if operator_cache is not None else OperatorCache()
+        )
+        self._targets = LRUCache(maxsize=1)
+        self._fingerprinters: Dict[
+            Tuple[Optional[str], Optional[str]], MeshFingerprinter
+        ] = {}
+
+    def __getstate__(self) -> dict:
+        """Return the state sent to worker processes, without the converted target mesh and its fingerprinters."""
+        state = self.__dict__.copy()
+        state["_targets"] = LRUCache(maxsize=1)
+        state["_fingerprinters"] = {}
+        return state
+
+    def apply(self, context: SampleContext) -> None:
+        """Replace the support of `context` by the reference mesh, carrying the projected fields."""
+        times = self.reference.get_all_mesh_times()
+        tree_target = self.reference.get_mesh(
+            times[0] if len(times) == 1 else context.time
+        )
+        # The fingerprinter reuses the fingerprint of the reference mesh across calls
+        fingerprinter = self._fingerprinters.get((context.base_name, context.zone_name))
+        if fingerprinter is None:
+            fingerprinter = create_mesh_fingerprinter(
+                context.base_name, context.zone_name
+            )
+            self._fingerprinters[(context.base_name, context.zone_name)] = fingerprinter
+        target_fingerprint = fingerprinter(tree_target)
+        mesh_target = self._targets.get(target_fingerprint)
+        if mesh_target is None:
+            mesh_target = copy.copy(
+                cgns_to_mesh(tree_target, context.base_names, context.zone_names)
+            )
+            mesh_target.nodeFields = {}
+            mesh_target.elemFields = {}
+            self._targets.put(target_fingerprint, mesh_target)
+
+        mesh_source = load_mesh(
+            context.tree,
+            context.base_names,
+            context.zone_names,
+            nodes_only=self.method == "Nearest/Nearest",
+        )
+        op = self.operator_cache.get_or_compute(
+            (
+                context.fingerprint,
+                target_fingerprint,
+                self.method,
+                np.dtype(self.dtype).str,
+            ),
+            lambda: compute_transfer_operator(
+                mesh_source, mesh_target.nodes, self.method, dtype=self.dtype
+            ),
+        )
+        context.set_support(
+            MeshToCGNS(mesh_target, exportOriginalIDs=False),
+            apply_transfer_operator(op, context.get_fields()),
+        )
+
+
+def _run_stages(
+    sample: Sample,
+    stages: Sequence[Stage],
+    base_name: Optional[str],
+    zone_name: Optional[str],
+    copy_sample: bool,
+) -> Sample:
+    fingerprinter = create_mesh_fingerprinter(base_name, zone_name)
+    contexts = []
+    for time in sample.get_all_mesh_times():
+        context = SampleContext(sample, time, base_name, zone_name, fingerprinter)
+        for stage in stages:
+            stage.apply(context)
+        contexts.append(context)
+
+    if any(context.projected for context in contexts):
+        output = Sample()
+        for sn in sample.get_scalar_names():
+            output.add_scalar(sn, sample.get_scalar(sn))
+        for context in contexts:
+            output.add_tree(context.tree, time=context.time)
+    else:
+        output = sample.copy() if copy_sample else sample
+
+    for context in contexts:
+        for fn, field in context.fields.items():
+            output.add_field(
+                fn,
+                field,
+                base_name=context.base_name,
+                zone_name=context.zone_name,
+                location="Vertex",
+                time=context.time,
+                warning_overwrite=False,
+            )
+    return output
+
+
+class Pipeline:
+    """Sequence of stages applied to each sample of a dataset in a single pass.
+
+    Chaining `compute_bounding_box`, `update_dataset_with_sdf`, `project_on_regular_grid`
+    or `project_on_other_dataset` walks the dataset once per operation, and copies it for
+    each of them. A pipeline instead applies all its stages to a (sample, time) pair before
+    moving on to the next one: the mesh is read, fingerprinted and converted once, through
+    a `SampleContext` shared by the stages, and each sample is copied at most once.
+
+    Stages are applied in the order they are registered. Feature stages, such as
+    `SDFStage` or `GeometricFeaturesStage`, add nodal fields; projection stages, such as
+    `RegularGridStage` or `ReferenceSampleStage`, project the nodal fields of the sample
+    and those added by the previous stages onto another mesh, which replaces the mesh in
+    the output samples.
+
+    Args:
+        stages (Optional[Sequence[Stage]], optional): The initial stages. More can be registered with `add`.
+        base_name (Optional[str], optional): Name of the mesh base to use. If None, uses all bases.
+        zone_name (Optional[str], optional): Name of the mesh zone to use. If None, uses all zones.
+    """
+
+    def __init__(
+        self,
+        stages: Optional[Sequence[Stage]] = None,
+        base_name: Optional[str] = None,
+        zone_name: Optional[str] = None,
+    ):
+        self.stages: List[Stage] = list(stages) if stages is not None else []
+        self.base_name = base_name
+        self.zone_name = zone_name
+
+    def add(self, stage: Stage) -> "Pipeline":
+        """Register a stage after the current ones.
+
+        Args:
+            stage (Stage): The stage to register.
+
+        Returns:
+            Pipeline: The pipeline itself, so that calls can be chained.
+        """
+        self.stages.append(stage)
+        return self
+
+    def iter_run(
+        self,
+        dataset: Dataset,
+        in_place: bool = False,
+        verbose: bool = False,
+        n_workers: int = 1,
+        executor: Optional[Executor] = None,
+        chunksize: Optional[int] = None,
+    ) -> Iterator[Tuple[int, Sample]]:
+        """Apply the stages to the samples of a dataset, yielding the output samples one at a time.
+
+        Args:
+            dataset (Dataset): The dataset to process.
+            in_place (bool, optional): If True, samples without projection stage are updated in place in serial execution; otherwise, they are copied. Defaults to False.
+            verbose (bool, optional): If True, shows progress bar. Defaults to False.
+            n_workers (int, optional): Number of worker processes. Defaults to 1 (serial execution).
+            executor (Optional[Executor], optional): Executor used to process the chunks of samples, instead of a process pool with `n_workers` workers; `n_workers` should then be its number of workers.
+            chunksize (Optional[int], optional): Number of samples per chunk sent to a worker. If None, samples are split in about four chunks per worker.
+
+        Yields:
+            Tuple[int, Sample]: The sample id and the output sample, in the order of `dataset.get_sample_ids()`.
+        """
+        for stage in self.stages:
+            stage.prepare(dataset, self.base_name, self.zone_name)
+
+        # Samples sent to worker processes are already copies
+        serial = n_workers == 1 and executor is None
+        process = partial(
+            _run_stages,
+            stages=self.stages,
+            base_name=self.base_name,
+            zone_name=self.zone_name,
+            copy_sample=serial and not in_place,
+        )
+        sample_ids = dataset.get_sample_ids()
+        yield from zip(
+            sample_ids,
+            map_in_chunks(
+                process,
+                (dataset[id] for id in sample_ids),
+                total=len(sample_ids),
+                n_workers=n_workers,
+                executor=executor,
+                chunksize=chunksize,
+                verbose=verbose,
+            ),
+        )
+
+    def run(
+        self,
+        dataset: Dataset,
+        in_place: bool = False,
+        verbose: bool = False,
+        n_workers: int = 1,
+        executor: Optional[Executor] = None,
+        chunksize: Optional[int] = None,
+    ) -> Dataset:
+        """Apply the stages to all the samples of a dataset.
+
+        Args:
+            dataset (Dataset): The dataset to process.
+            in_place (bool, optional): If True, the samples of `dataset` are replaced by the output samples, and `dataset` is returned. Defaults to False.
+            verbose (bool, optional): If True, shows progress bar. Defaults to False.
+            n_workers (int, optional): Number of worker processes. Defaults to 1 (serial execution).
+            executor (Optional[Executor], optional): Executor used to process the chunks of samples, instead of a process pool with `n_workers` workers; `n_workers` should then be its number of workers.
+            chunksize (Optional[int], optional): Number of samples per chunk sent to a worker. If None, samples are split in about four chunks per worker.
+
+        Returns:
+            Dataset: The dataset of the output samples, with the sample ids of `dataset`.
+        """
+        output = dataset if in_place else Dataset()
+        for id, sample in self.iter_run(
+            dataset,
+            in_place=in_place,
+            verbose=verbose,
+            n_workers=n_workers,
+            executor=executor,
+            chunksize=chunksize,
+        ):
+            if not in_place:
+                output.add_sample(sample, id)
+            elif sample is not dataset[id]:
+                output.set_sample(id, sample, warning_overwrite=False)
+        return output
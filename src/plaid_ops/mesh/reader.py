@@ -0,0 +1,251 @@
+"""Module implementing a lightweight reader of unstructured CGNS zones, without conversion."""
+
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from plaid.types import Array, CGNSTree
+
+# Name and number of nodes of the CGNS element types, by their CGNS code
+_ELEMENT_NODES = {
+    2: ("NODE", 1),
+    3: ("BAR_2", 2),
+    4: ("BAR_3", 3),
+    5: ("TRI_3", 3),
+    6: ("TRI_6", 6),
+    7: ("QUAD_4", 4),
+    8: ("QUAD_8", 8),
+    9: ("QUAD_9", 9),
+    10: ("TETRA_4", 4),
+    11: ("TETRA_10", 10),
+    12: ("PYRA_5", 5),
+    13: ("PYRA_14", 14),
+    14: ("PENTA_6", 6),
+    15: ("PENTA_15", 15),
+    16: ("PENTA_18", 18),
+    17: ("HEXA_8", 8),
+    18: ("HEXA_20", 20),
+    19: ("HEXA_27", 27),
+    21: ("PYRA_13", 13),
+}
+_MIXED = 20
+_COORDINATES = ("CoordinateX", "CoordinateY", "CoordinateZ")
+
+
+class ZoneView(NamedTuple):
+    """Arrays of an unstructured CGNS zone, as views into the tree.
+
+    Attributes:
+        base_name (str): Name of the base of the zone.
+        zone_name (str): Name of the zone.
+        coordinates (List[Array]): Node coordinates along each axis.
+        sections (List[Tuple[str, Array]]): CGNS element type name and connectivity of each element section, of shape (n_elements, n_nodes_per_element), with 1-based node indices as in CGNS. Mixed sections are split by element type, which copies their connectivity.
+        node_fields (Dict[str, Array]): Nodal fields of the zone, by name.
+    """
+
+    base_name: str
+    zone_name: str
+    coordinates: List[Array]
+    sections: List[Tuple[str, Array]]
+    node_fields: Dict[str, Array]
+
+
+def _child(node: list, name: str) -> Optional[list]:
+    for child in node[2]:
+        if child[0] == name:
+            return child
+    return None
+
+
+def _string(node: Optional[list]) -> Optional[str]:
+    if node is None or node[1] is None:
+        return None
+    return node[1].tobytes().decode().strip()
+
+
+def _read_sections(elements: list) -> Iterator[Tuple[str, Array]]:
+    element_type = int(elements[1][0])
+    connectivity = _child(elements, "ElementConnectivity")[1]
+    if element_type in _ELEMENT_NODES:
+        name, n_nodes = _ELEMENT_NODES[element_type]
+        yield name, connectivity.reshape(-1, n_nodes)
+        return
+    if element_type != _MIXED:
+        raise ValueError(f"unsupported CGNS element type {element_type}")
+
+    offsets = _child(elements, "ElementStartOffset")
+    if offsets is not None:
+        starts = offsets[1][:-1]
+    else:
+        starts, start = [], 0
+        while start < len(connectivity):
+            starts.append(start)
+            start += 1 + _ELEMENT_NODES[int(connectivity[start])][1]
+        starts = np.array(starts, dtype=np.int64)
+    types = connectivity[starts]
+    for element_type in np.unique(types):
+        if int(element_type) not in _ELEMENT_NODES:
+            raise ValueError(f"unsupported CGNS element type {element_type}")
+        name, n_nodes = _ELEMENT_NODES[int(element_type)]
+        first = starts[types == element_type] + 1
+        yield name, connectivity[first[:, None] + np.arange(n_nodes)]
+
+
+def _iter_zones(
+    tree: CGNSTree,
+    base_names: Optional[Sequence[str]] = None,
+    zone_names: Optional[Sequence[str]] = None,
+) -> Iterator[Tuple[list, list]]:
+    for base in tree[2]:
+        if base[3] != "CGNSBase_t":
+            continue
+        if base_names is not None and base[0] not in base_names:
+            continue
+        for zone in base[2]:
+            if zone[3] != "Zone_t":
+                continue
+            if zone_names is not None and zone[0] not in zone_names:
+                continue
+            yield base, zone
+
+
+def _read_node_fields(zone: list) -> Dict[str, Array]:
+    node_fields = {}
+    for child in zone[2]:
+        if child[3] != "FlowSolution_t":
+            continue
+        location = _string(_child(child, "GridLocation"))
+        if location not in (None, "Vertex"):
+            continue
+        for field in child[2]:
+            if field[3] == "DataArray_t" and field[0] != "OriginalIds":
+                node_fields[field[0]] = field[1]
+    return node_fields
+
+
+def _merge_node_fields(zones_fields: List[Dict[str, Array]]) -> Dict[str, Array]:
+    # Zones are concatenated in the order of the tree, keeping the fields of all zones
+    if len(zones_fields) <= 1:
+        return dict(zones_fields[0]) if zones_fields else {}
+    names = [
+        name
+        for name in zones_fields[0]
+        if all(name in fields for fields in zones_fields[1:])
+    ]
+    return {
+        name: np.concatenate([fields[name] for fields in zones_fields])
+        for name in names
+    }
+
+
+def iter_zone_views(
+    tree: CGNSTree,
+    base_names: Optional[Sequence[str]] = None,
+    zone_names: Optional[Sequence[str]] = None,
+) -> Iterator[ZoneView]:
+    """Iterate over the unstructured zones of a CGNS tree, without copying their arrays.
+
+    Only the coordinates, element sections and nodal fields are read: unlike `CGNSToMesh`,
+    no tags, numberings or copies of the arrays are made.
+
+    Args:
+        tree (CGNSTree): The CGNS tree to read.
+        base_names (Optional[Sequence[str]], optional): The base names to read. If None, uses all bases.
+        zone_names (Optional[Sequence[str]], optional): The zone names to read. If None, uses all zones.
+
+    Yields:
+        ZoneView: The arrays of each selected zone.
+
+    Raises:
+        ValueError: If a selected zone is structured, or holds polyhedral (NGON/NFACE) element sections.
+    """
+    for base, zone in _iter_zones(tree, base_names, zone_names):
+        zone_type = _string(_child(zone, "ZoneType"))
+        if zone_type not in (None, "Unstructured"):
+            raise ValueError(f"zone {zone[0]} is not unstructured")
+
+        coordinates, sections = [], []
+        for child in zone[2]:
+            if child[3] == "GridCoordinates_t" and not coordinates:
+                coordinates = [
+                    _child(child, name)[1]
+                    for name in _COORDINATES
+                    if _child(child, name) is not None
+                ]
+            elif child[3] == "Elements_t":
+                sections.extend(_read_sections(child))
+        yield ZoneView(base[0], zone[0], coordinates, sections, _read_node_fields(zone))
+
+
+def read_node_fields(
+    tree: CGNSTree,
+    base_names: Optional[Sequence[str]] = None,
+    zone_names: Optional[Sequence[str]] = None,
+) -> Dict[str, Array]:
+    """Read the nodal fields of the selected zones of a CGNS tree, without reading their elements.
+
+    Args:
+        tree (CGNSTree): The CGNS tree to read.
+        base_names (Optional[Sequence[str]], optional): The base names to read. If None, uses all bases.
+        zone_names (Optional[Sequence[str]], optional): The zone names to read. If None, uses all zones.
+
+    Returns:
+        Dict[str, Array]: Nodal fields defined on all the selected zones, concatenated in the order of the tree as done by `CGNSToMesh`, by name; they are views if there is a single zone.
+    """
+    return _merge_node_fields(
+        [
+            _read_node_fields(zone)
+            for _, zone in _iter_zones(tree, base_names, zone_names)
+        ]
+    )
+
+
+class MeshView:
+    """Minimal unstructured mesh of the selected zones of a CGNS tree.
+
+    The zones are read with `iter_zone_views`, and zones are concatenated in the order of
+    the tree, as done by `CGNSToMesh`. The `nodes` and `nodeFields` attributes mirror those
+    of a Muscat mesh, so that a `MeshView` can stand in for one in operations that only
+    use the node coordinates and nodal fields, such as nearest-neighbour transfers.
+
+    Args:
+        tree (CGNSTree): The CGNS tree to read.
+        base_names (Optional[Sequence[str]], optional): The base names to read. If None, uses all bases.
+        zone_names (Optional[Sequence[str]], optional): The zone names to read. If None, uses all zones.
+    """
+
+    def __init__(
+        self,
+        tree: CGNSTree,
+        base_names: Optional[Sequence[str]] = None,
+        zone_names: Optional[Sequence[str]] = None,
+    ):
+        self.zones = list(iter_zone_views(tree, base_names, zone_names))
+        self._nodes: Optional[Array] = None
+
+    @property
+    def nodes(self) -> Array:
+        """Node coordinates, of shape (n_nodes, dim), stacked on first access."""
+        if self._nodes is None:
+            self._nodes = np.concatenate(
+                [np.stack(zone.coordinates, axis=-1) for zone in self.zones]
+            )
+        return self._nodes
+
+    @property
+    def nodeFields(self) -> Dict[str, Array]:
+        """Nodal fields defined on all zones, by name; they are views if there is a single zone."""
+        return _merge_node_fields([zone.node_fields for zone in self.zones])
+
+    def cells(self) -> Dict[str, Array]:
+        """Return the connectivity of the elements, by CGNS element type name.
+
+        Returns:
+            Dict[str, Array]: Connectivity of the elements of each type, of shape (n_elements, n_nodes_per_element), with 0-based indices into `nodes`.
+        """
+        cells: Dict[str, List[Array]] = {}
+        offset = 0
+        for zone in self.zones:
+            for name, connectivity in zone.sections:
+                cells.setdefault(name, []).append(connectivity + (offset - 1))
+            offset += len(zone.coordinates[0]) if zone.coordinates else 0
+        return {name: np.concatenate(arrays) for name, arrays in cells.items()}
@@ -1,19 +1,43 @@
 """Module implementing standardized transformations on plaid datasets."""
 
-from typing import Optional, Sequence, Tuple
+import contextlib
+import copy
+import itertools
+import json
+import tempfile
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from Muscat.Bridges.CGNSBridge import CGNSToMesh, MeshToCGNS
-from Muscat.FE.FETools import PrepareFEComputation
-from Muscat.FE.Fields.FEField import FEField
-from Muscat.MeshContainers.Filters.FilterObjects import ElementFilter
+from Muscat.Bridges.CGNSBridge import MeshToCGNS
+from Muscat.MeshContainers.Mesh import Mesh
 from Muscat.MeshTools.ConstantRectilinearMeshTools import CreateConstantRectilinearMesh
-from Muscat.MeshTools.MeshFieldOperations import GetFieldTransferOp
+from numpy.typing import DTypeLike
 from plaid.containers.dataset import Dataset
 from plaid.containers.sample import Sample
-from plaid.types import Array
-from plaid.utils.stats import OnlineStatistics
-from tqdm import tqdm
+from plaid.types import Array, CGNSTree, Field
+from scipy.sparse import csr_matrix
+
+from plaid_ops.common.cache import LRUCache
+from plaid_ops.common.conversion import cgns_to_mesh, load_mesh
+from plaid_ops.common.parallel import map_in_chunks
+from plaid_ops.mesh.bounding_box import BoundingBoxIndex, map_zone_bounding_boxes
+from plaid_ops.mesh.fingerprint import (
+    MeshFingerprinter,
+    compute_array_fingerprint,
+    create_mesh_fingerprinter,
+)
+from plaid_ops.mesh.operators import (
+    OperatorCache,
+    apply_transfer_operator,
+    compute_grid_interpolation_operator,
+    compute_grid_transfer_operator,
+    compute_transfer_operator,
+    prepare_transfer_field,
+)
+from plaid_ops.mesh.reader import MeshView
 
 
 def compute_bounding_box(
@@ -21,35 +45,463 @@ def compute_bounding_box(
     times: Optional[Sequence] = None,
     base_names: Optional[Sequence[str]] = None,
     zone_names: Optional[Sequence[str]] = None,
+    verbose: bool = False,
+    n_workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None,
+    index: Optional[BoundingBoxIndex] = None,
 ) -> Tuple[Array, Array]:
     """Compute the axis-aligned bounding box over all nodes in all samples of a dataset.
 
+    Only per-axis minima and maxima are computed, directly on the coordinate arrays of the
+    CGNS trees, without stacking the nodes of each zone. Samples can be reduced in parallel
+    chunks, whose bounding boxes are combined at the end: only their coordinate arrays are
+    sent to the worker processes.
+
+    If an `index` is provided, it is first updated with the samples of `dataset` it does
+    not contain yet, and the bounding box is then computed from the indexed zone bounding
+    boxes: repeated calls, e.g. after adding samples, do not rescan the indexed meshes.
+
     Args:
         dataset (Dataset): The dataset containing samples with mesh nodes.
         times (Optional[Sequence], optional): Specific times to consider. If None, uses all available times.
         base_names (Optional[Sequence[str]], optional): The base names of the meshes to use. If None, uses all available bases.
         zone_names (Optional[Sequence[str]], optional): The zone names of the meshes to use. If None, uses all available zones.
+        verbose (bool, optional): If True, shows progress bar. Defaults to False.
+        n_workers (int, optional): Number of worker processes. Defaults to 1 (serial execution).
+        executor (Optional[Executor], optional): Executor used to process the chunks of samples, instead of a process pool with `n_workers` workers; `n_workers` should then be its number of workers.
+        chunksize (Optional[int], optional): Number of samples per chunk sent to a worker. If None, samples are split in about four chunks per worker.
+        index (Optional[BoundingBoxIndex], optional): Index of zone bounding boxes, updated and used to compute the bounding box. If None, all the meshes are scanned.
 
     Returns:
         Tuple[Array, Array]: A tuple (mins, maxs) where mins is the minimum coordinate values and maxs is the maximum coordinate values across all nodes in the dataset.
     """
-    stats = OnlineStatistics()
-    for sample in dataset:
-        mesh_times = times if times is not None else sample.get_all_mesh_times()
-        for time in mesh_times:
-            base_names_iter = base_names or sample.get_base_names(time=time)
-            for base_name in base_names_iter:
-                zone_names_iter = zone_names or sample.get_zone_names(
-                    time=time, base_name=base_name, unique=True
-                )
-                for zone_name in zone_names_iter:
-                    nodes = sample.get_nodes(
-                        time=time, base_name=base_name, zone_name=zone_name
-                    )
-                    stats.add_samples(nodes)
-    mins = stats.min.squeeze()
-    maxs = stats.max.squeeze()
-    return (mins, maxs)
+    if index is not None:
+        index.update(
+            dataset,
+            verbose=verbose,
+            n_workers=n_workers,
+            executor=executor,
+            chunksize=chunksize,
+        )
+        return index.get_bounding_box(
+            ids=dataset.get_sample_ids(),
+            times=times,
+            base_names=base_names,
+            zone_names=zone_names,
+        )
+
+    mins, maxs = None, None
+    for boxes in map_zone_bounding_boxes(
+        list(dataset),
+        times=times,
+        base_names=base_names,
+        zone_names=zone_names,
+        verbose=verbose,
+        n_workers=n_workers,
+        executor=executor,
+        chunksize=chunksize,
+    ):
+        for _, _, _, zone_mins, zone_maxs in boxes:
+            if mins is None:
+                mins, maxs = zone_mins, zone_maxs
+            else:
+                mins, maxs = np.minimum(mins, zone_mins), np.maximum(maxs, zone_maxs)
+    assert mins is not None, "no mesh nodes found in `dataset`"
+    return (mins.astype(np.float64), maxs.astype(np.float64))
+
+
+def _compute_regular_grid_operator(
+    tree: CGNSTree,
+    base_names: Optional[List[str]],
+    zone_names: Optional[List[str]],
+    dimensions: Tuple[int, ...],
+    origin: Array,
+    spacing: Array,
+    method: str,
+    engine: str,
+    dtype: DTypeLike,
+    source: Optional[Dict[str, Any]] = None,
+) -> csr_matrix:
+    # `source` holds the source mesh and its finite-element field once loaded, so that
+    # the operators of several tiles of a grid share them
+    if source is None:
+        source = {}
+    if "mesh" not in source:
+        source["mesh"] = load_mesh(
+            tree,
+            base_names,
+            zone_names,
+            nodes_only=method == "Nearest/Nearest" and engine == "muscat",
+        )
+    mesh = source["mesh"]
+    if engine == "structured":
+        return compute_grid_transfer_operator(
+            mesh, dimensions, origin, spacing, method=method, dtype=dtype
+        )
+    if method != "Nearest/Nearest" and "field" not in source:
+        source["field"] = prepare_transfer_field(mesh)
+    grid_nodes = CreateConstantRectilinearMesh(
+        dimensions=dimensions, origin=origin, spacing=spacing
+    ).nodes
+    return compute_transfer_operator(
+        mesh, grid_nodes, method=method, dtype=dtype, field=source.get("field")
+    )
+
+
+def _regular_grid_operator(
+    dimensions: Tuple[int, ...],
+    origin: Array,
+    spacing: Array,
+    method: str,
+    engine: str,
+    dtype: DTypeLike,
+) -> Tuple[
+    Tuple[str, ...],
+    Callable[[CGNSTree, Optional[List[str]], Optional[List[str]]], csr_matrix],
+]:
+    grid_key = (
+        compute_array_fingerprint(np.array(dimensions), origin, spacing),
+        method,
+        engine,
+        np.dtype(dtype).str,
+    )
+    compute_operator = partial(
+        _compute_regular_grid_operator,
+        dimensions=dimensions,
+        origin=origin,
+        spacing=spacing,
+        method=method,
+        engine=engine,
+        dtype=dtype,
+    )
+    return grid_key, compute_operator
+
+
+def _regular_grid_spacing(
+    dimensions: Sequence[int], bbox: Sequence[Array], engine: str
+) -> Tuple[Tuple[int, ...], Array, Array]:
+    dims = tuple(dimensions)
+
+    mins = bbox[0]
+    maxs = bbox[1]
+
+    assert len(dims) == len(mins), (
+        "`len(dimensions)` should be the same as the dimension of the bounding box of the dataset"
+    )
+    assert len(dims) == len(maxs), (
+        "`len(dimensions)` should be the same as the dimension of the bounding box of the dataset"
+    )
+    assert engine in ("muscat", "structured"), (
+        "`engine` should be either 'muscat' or 'structured'"
+    )
+
+    spacing = np.divide(maxs - mins, np.array(dims) - 1)
+    return dims, mins, spacing
+
+
+def create_regular_grid(
+    dimensions: Sequence[int],
+    bbox: Sequence[Array],
+    method: str = "Interp/Clamp",
+    engine: str = "muscat",
+    dtype: DTypeLike = np.float64,
+) -> Tuple[
+    Mesh,
+    Tuple[str, ...],
+    Callable[[CGNSTree, Optional[List[str]], Optional[List[str]]], csr_matrix],
+]:
+    """Create a regular rectilinear grid and the assembly of transfer operators onto it.
+
+    This is the grid used by `project_on_regular_grid`, exposed for pipelines that cache
+    the transfer operators themselves.
+
+    Args:
+        dimensions (Sequence[int]): Number of grid points along each axis (e.g., [nx, ny, nz]).
+        bbox (Sequence[Array]): Bounding box as (mins, maxs), where each is an array of coordinates.
+        method (str, optional): Projection method, see `project_on_regular_grid`. Defaults to "Interp/Clamp".
+        engine (str, optional): Operator assembly engine, see `project_on_regular_grid`. Defaults to "muscat".
+        dtype (DTypeLike, optional): Floating-point type of the transfer operators. Defaults to `np.float64`.
+
+    Returns:
+        Tuple[Mesh, Tuple[str, ...], Callable[[CGNSTree, Optional[List[str]], Optional[List[str]]], csr_matrix]]: The Muscat mesh of the grid; the key of the grid, to be combined with the fingerprint of a source mesh into an `OperatorCache` key; and a function assembling the transfer operator from the selected bases and zones of a CGNS tree onto the grid.
+    """
+    dims, mins, spacing = _regular_grid_spacing(dimensions, bbox, engine)
+
+    background_mesh = CreateConstantRectilinearMesh(
+        dimensions=dims, origin=mins, spacing=spacing
+    )
+    grid_key, compute_operator = _regular_grid_operator(
+        dims, mins, spacing, method, engine, dtype
+    )
+
+    return background_mesh, grid_key, compute_operator
+
+
+def _split_regular_grid(
+    dimensions: Sequence[int],
+    bbox: Sequence[Array],
+    tile_shape: Optional[Sequence[int]],
+    method: str,
+    engine: str,
+    dtype: DTypeLike,
+) -> List[
+    Tuple[
+        Tuple[slice, ...],
+        Tuple[int, ...],
+        Tuple[str, ...],
+        Callable[[CGNSTree, Optional[List[str]], Optional[List[str]]], csr_matrix],
+    ]
+]:
+    dims, mins, spacing = _regular_grid_spacing(dimensions, bbox, engine)
+    if tile_shape is None:
+        tile_shape = dims
+    assert len(tile_shape) == len(dims), (
+        "`len(tile_shape)` should be the same as `len(dimensions)`"
+    )
+    assert all(size > 0 for size in tile_shape), (
+        "`tile_shape` should contain positive integers"
+    )
+
+    tiles = []
+    for starts in itertools.product(
+        *(range(0, dim, size) for dim, size in zip(dims, tile_shape))
+    ):
+        slices = tuple(
+            slice(start, min(start + size, dim))
+            for start, size, dim in zip(starts, tile_shape, dims)
+        )
+        tile_dims = tuple(s.stop - s.start for s in slices)
+        grid_key, compute_operator = _regular_grid_operator(
+            tile_dims,
+            mins + spacing * np.array(starts),
+            spacing,
+            method,
+            engine,
+            dtype,
+        )
+        tiles.append((slices, tile_dims, grid_key, compute_operator))
+    return tiles
+
+
+def _project_fields_on_regular_grid(
+    sample: Sample,
+    time: float,
+    grid_key: Tuple[str, ...],
+    compute_operator: Callable[
+        [CGNSTree, Optional[List[str]], Optional[List[str]]], csr_matrix
+    ],
+    base_name: Optional[str],
+    zone_name: Optional[str],
+    operator_cache: OperatorCache,
+    fingerprinter: MeshFingerprinter,
+    field_names: Optional[Sequence[str]] = None,
+) -> Dict[str, Field]:
+    tree = sample.get_mesh(time=time)
+    op = operator_cache.get_or_compute(
+        (fingerprinter(tree), *grid_key),
+        lambda: compute_operator(
+            tree, fingerprinter.base_names, fingerprinter.zone_names
+        ),
+    )
+
+    fields = {}
+    for fn in field_names if field_names is not None else sample.get_field_names():
+        field = sample.get_field(
+            fn, base_name=base_name, zone_name=zone_name, time=time
+        )
+        if field is not None:
+            fields[fn] = field
+
+    return apply_transfer_operator(op, fields)
+
+
+def _project_sample_on_regular_grid(
+    sample: Sample,
+    background_mesh: Mesh,
+    grid_key: Tuple[str, ...],
+    compute_operator: Callable[
+        [CGNSTree, Optional[List[str]], Optional[List[str]]], csr_matrix
+    ],
+    base_name: Optional[str],
+    zone_name: Optional[str],
+    operator_cache: OperatorCache,
+) -> Sample:
+    projected_sample = Sample()
+
+    for sn in sample.get_scalar_names():
+        projected_sample.add_scalar(sn, sample.get_scalar(sn))
+
+    fingerprinter = create_mesh_fingerprinter(base_name, zone_name)
+    for time in sample.get_all_mesh_times():
+        projected_sample.add_tree(
+            MeshToCGNS(background_mesh, exportOriginalIDs=False), time=time
+        )
+
+        projected_fields = _project_fields_on_regular_grid(
+            sample,
+            time,
+            grid_key,
+            compute_operator,
+            base_name,
+            zone_name,
+            operator_cache,
+            fingerprinter,
+        )
+        for fn, projected_field in projected_fields.items():
+            projected_sample.add_field(
+                fn,
+                projected_field,
+                base_name=base_name,
+                zone_name=zone_name,
+                time=time,
+                warning_overwrite=False,
+            )
+
+    return projected_sample
+
+
+def _iter_project_sample_on_regular_grid_to_array(
+    sample: Sample,
+    times: Sequence[float],
+    tiles: List[tuple],
+    field_names: Sequence[str],
+    base_name: Optional[str],
+    zone_name: Optional[str],
+    operator_cache: OperatorCache,
+    dtype: DTypeLike,
+) -> Iterator[Tuple[int, int, Array]]:
+    fingerprinter = create_mesh_fingerprinter(base_name, zone_name)
+    for i, time in enumerate(times):
+        # The mesh of each time is converted and fingerprinted once for all the tiles
+        tree = sample.get_mesh(time=time)
+        fingerprint = fingerprinter(tree)
+        fields = {}
+        for fn in field_names:
+            field = sample.get_field(
+                fn, base_name=base_name, zone_name=zone_name, time=time
+            )
+            if field is not None:
+                fields[fn] = field
+        source = {}
+        for k, (_, tile_dims, grid_key, compute_operator) in enumerate(tiles):
+            op = operator_cache.get_or_compute(
+                (fingerprint, *grid_key),
+                lambda: compute_operator(
+                    tree,
+                    fingerprinter.base_names,
+                    fingerprinter.zone_names,
+                    source=source,
+                ),
+            )
+            projected_fields = apply_transfer_operator(op, fields)
+            block = np.full((len(field_names), *tile_dims), np.nan, dtype=dtype)
+            for j, fn in enumerate(field_names):
+                if fn in projected_fields:
+                    block[j] = projected_fields[fn].reshape(tile_dims)
+            yield k, i, block
+
+
+def _write_sample_on_regular_grid_to_array(
+    item: Tuple[int, Sample],
+    tensor: Optional[Array],
+    path: Optional[Path],
+    tiles: List[tuple],
+    field_names: Sequence[str],
+    base_name: Optional[str],
+    zone_name: Optional[str],
+    operator_cache: OperatorCache,
+    dtype: DTypeLike,
+) -> List[float]:
+    index, sample = item
+    if tensor is None:
+        # Worker processes write into the memory-mapped tensor instead of returning blocks
+        tensor = np.load(path, mmap_mode="r+")
+    times = sample.get_all_mesh_times()
+    for k, i, block in _iter_project_sample_on_regular_grid_to_array(
+        sample, times, tiles, field_names, base_name, zone_name, operator_cache, dtype
+    ):
+        tensor[(index, i, slice(None), *tiles[k][0])] = block
+    tensor[index, len(times) :] = np.nan
+    if isinstance(tensor, np.memmap):
+        tensor.flush()
+    return [float(time) for time in times]
+
+
+def iter_project_on_regular_grid(
+    dataset: Dataset,
+    dimensions: Sequence[int],
+    bbox: Sequence[Array],
+    base_name: Optional[str] = None,
+    zone_name: Optional[str] = None,
+    method: str = "Interp/Clamp",
+    engine: str = "muscat",
+    dtype: DTypeLike = np.float64,
+    verbose: bool = False,
+    operator_cache: Optional[OperatorCache] = None,
+    n_workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None,
+) -> Iterator[Tuple[int, Sample]]:
+    """Project the samples of a dataset onto a regular rectilinear grid, one at a time.
+
+    Streaming variant of `project_on_regular_grid`: projected samples are yielded as soon
+    as they are computed and are not retained, so that callers can write them to disk or
+    feed them to a model and drop them. Peak memory is bounded by one projected sample in
+    serial execution, and by the chunks in flight (two per worker) in parallel execution.
+
+    The available projection methods are:
+        - "Interp/Nearest"
+        - "Nearest/Nearest"
+        - "Interp/Clamp"
+        - "Interp/Extrap"
+        - "Interp/ZeroFill"
+
+    Args:
+        dataset (Dataset): The dataset containing samples to project.
+        dimensions (Sequence[int]): Number of grid points along each axis (e.g., [nx, ny, nz]).
+        bbox (Sequence[Array]): Bounding box as (mins, maxs), where each is an array of coordinates.
+        base_name (Optional[str], optional): Name of the mesh base to use. If None, uses all bases.
+        zone_name (Optional[str], optional): Name of the mesh zone to use. If None, uses all zones.
+        method (Optional[str], optional): Projection method. Defaults to "Interp/Clamp".
+        engine (str, optional): Operator assembly engine: "muscat" for the generic point location of `GetFieldTransferOp`, or "structured" for `compute_grid_transfer_operator`, which exploits the regular grid. Defaults to "muscat".
+        dtype (DTypeLike, optional): Floating-point type of the transfer operators and projected fields; `np.float32` halves the memory footprint of operators and fields, at the cost of a relative error of about 1e-7. Defaults to `np.float64`.
+        verbose (Optional[bool], optional): If True, shows progress bar. Defaults to False.
+        operator_cache (Optional[OperatorCache], optional): Cache of transfer operators, which can be shared between calls. If None, a cache local to this call is used.
+        n_workers (int, optional): Number of worker processes. Defaults to 1 (serial execution).
+        executor (Optional[Executor], optional): Executor used to process the chunks of samples, instead of a process pool with `n_workers` workers; `n_workers` should then be its number of workers.
+        chunksize (Optional[int], optional): Number of samples per chunk sent to a worker. If None, samples are split in about four chunks per worker.
+
+    Yields:
+        Tuple[int, Sample]: The sample id and the projected sample, in the order of `dataset.get_sample_ids()`.
+    """
+    background_mesh, grid_key, compute_operator = create_regular_grid(
+        dimensions, bbox, method, engine, dtype
+    )
+
+    if operator_cache is None:
+        operator_cache = OperatorCache()
+
+    project = partial(
+        _project_sample_on_regular_grid,
+        background_mesh=background_mesh,
+        grid_key=grid_key,
+        compute_operator=compute_operator,
+        base_name=base_name,
+        zone_name=zone_name,
+        operator_cache=operator_cache,
+    )
+    sample_ids = dataset.get_sample_ids()
+    projected_samples = map_in_chunks(
+        project,
+        (dataset[id] for id in sample_ids),
+        total=len(sample_ids),
+        n_workers=n_workers,
+        executor=executor,
+        chunksize=chunksize,
+        verbose=verbose,
+    )
+    yield from zip(sample_ids, projected_samples)
 
 
 def project_on_regular_grid(
@@ -59,12 +511,27 @@ def project_on_regular_grid(
     base_name: Optional[str] = None,
     zone_name: Optional[str] = None,
     method: str = "Interp/Clamp",
+    engine: str = "muscat",
+    dtype: DTypeLike = np.float64,
     verbose: bool = False,
+    operator_cache: Optional[OperatorCache] = None,
+    n_workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None,
 ) -> Dataset:
     """Project all samples of a dataset onto a regular rectilinear grid.
 
     This function creates a regular grid defined by the given dimensions and bounding box,
     and projects all fields from each sample in the dataset onto this grid using the specified method.
+    See `iter_project_on_regular_grid` to stream the projected samples instead of collecting them.
+
+    Transfer operators are cached by fingerprint of the source mesh geometry and connectivity:
+    samples (and times) sharing a mesh pay for operator assembly only once, later ones only cost
+    one sparse matrix-vector product per field.
+
+    Samples are independent and can be projected in parallel, in chunks of samples sent to
+    a process pool. In that case, each chunk uses its own in-memory operator cache, while a
+    persistent cache directory of `operator_cache` is shared by all workers.
 
     The available projection methods are:
         - "Interp/Nearest"
@@ -80,79 +547,352 @@ def project_on_regular_grid(
         base_name (Optional[str], optional): Name of the mesh base to use. If None, uses all bases.
         zone_name (Optional[str], optional): Name of the mesh zone to use. If None, uses all zones.
         method (Optional[str], optional): Projection method. Defaults to "Interp/Clamp".
+        engine (str, optional): Operator assembly engine: "muscat" for the generic point location of `GetFieldTransferOp`, or "structured" for `compute_grid_transfer_operator`, which exploits the regular grid. Defaults to "muscat".
+        dtype (DTypeLike, optional): Floating-point type of the transfer operators and projected fields; `np.float32` halves the memory footprint of operators and fields, at the cost of a relative error of about 1e-7. Defaults to `np.float64`.
         verbose (Optional[bool], optional): If True, shows progress bar. Defaults to False.
+        operator_cache (Optional[OperatorCache], optional): Cache of transfer operators, which can be shared between calls. If None, a cache local to this call is used.
+        n_workers (int, optional): Number of worker processes. Defaults to 1 (serial execution).
+        executor (Optional[Executor], optional): Executor used to process the chunks of samples, instead of a process pool with `n_workers` workers; `n_workers` should then be its number of workers.
+        chunksize (Optional[int], optional): Number of samples per chunk sent to a worker. If None, samples are split in about four chunks per worker.
 
     Returns:
-        Dataset: A new dataset with all samples projected onto the regular grid.
+        Dataset: A new dataset with all samples projected onto the regular grid, in the order of `dataset.get_sample_ids()`.
     """
-    dims = tuple(dimensions)
+    projected_dataset = Dataset()
+    for id, projected_sample in iter_project_on_regular_grid(
+        dataset,
+        dimensions,
+        bbox,
+        base_name=base_name,
+        zone_name=zone_name,
+        method=method,
+        engine=engine,
+        dtype=dtype,
+        verbose=verbose,
+        operator_cache=operator_cache,
+        n_workers=n_workers,
+        executor=executor,
+        chunksize=chunksize,
+    ):
+        projected_dataset.add_sample(projected_sample, id)
 
-    mins = bbox[0]
-    maxs = bbox[1]
+    return projected_dataset
 
-    assert len(dims) == len(mins), (
-        "`len(dimensions)` should be the same as the dimension of the bounding box of the dataset"
-    )
-    assert len(dims) == len(maxs), (
-        "`len(dimensions)` should be the same as the dimension of the bounding box of the dataset"
-    )
 
-    spacing = np.divide(maxs - mins, np.array(dims) - 1)
+def project_on_regular_grid_to_array(
+    dataset: Dataset,
+    dimensions: Sequence[int],
+    bbox: Sequence[Array],
+    path: Optional[Union[str, Path]] = None,
+    field_names: Optional[Sequence[str]] = None,
+    base_name: Optional[str] = None,
+    zone_name: Optional[str] = None,
+    method: str = "Interp/Clamp",
+    engine: str = "muscat",
+    dtype: DTypeLike = np.float64,
+    tile_shape: Optional[Sequence[int]] = None,
+    verbose: bool = False,
+    operator_cache: Optional[OperatorCache] = None,
+    n_workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None,
+) -> Tuple[Array, Dict[str, list]]:
+    """Project all samples of a dataset onto a regular rectilinear grid, directly into a tensor.
 
-    background_mesh = CreateConstantRectilinearMesh(
-        dimensions=dims, origin=mins, spacing=spacing
-    )
+    Instead of building a CGNS tree per projected sample, the projected fields are written
+    into a preallocated array of shape (n_samples, n_times, n_fields, *dimensions), ready to
+    be consumed by machine learning models. Grid values are ordered such that
+    `tensor[i, t, f, ix, iy(, iz)]` is the value at the grid node of indices (ix, iy(, iz)).
+    Missing fields, and missing times of samples with fewer time steps, are filled with NaN.
+
+    If `path` is provided, the tensor is a `numpy.memmap` backed by a `.npy` file, so that
+    datasets larger than memory can be projected, and an index with the sample ids, field
+    names and times is saved next to it (same path with a `.json` suffix). Both can be
+    read back, without copy, with `load_regular_grid_projection`.
 
-    baseNames = [base_name] if base_name is not None else None
-    zoneNames = [zone_name] if zone_name is not None else None
+    If `tile_shape` is provided, the grid is split into blocks of at most `tile_shape`
+    nodes, and one transfer operator is assembled per block and per source mesh, so that
+    the memory of the operators depends on the tile size rather than on the grid size:
+    combined with `path`, this allows projecting onto very large 3D grids. With the
+    "structured" engine, the operator of a tile only involves the source elements
+    overlapping it. Samples are distributed among the workers, and the mesh of each
+    sample and time is converted, fingerprinted and prepared once for all the tiles. Each
+    block of projected values is written into the tensor as soon as it is computed: in
+    parallel execution, workers write directly into the memory-mapped tensor (a temporary
+    file read back at the end if `path` is None), so that their memory is bounded by the
+    tiles rather than the whole grid.
 
-    projected_samples = []
+    The available projection methods are:
+        - "Interp/Nearest"
+        - "Nearest/Nearest"
+        - "Interp/Clamp"
+        - "Interp/Extrap"
+        - "Interp/ZeroFill"
 
-    for sample in tqdm(dataset, total=len(dataset), disable=not verbose):
-        projected_sample = Sample()
+    Args:
+        dataset (Dataset): The dataset containing samples to project.
+        dimensions (Sequence[int]): Number of grid points along each axis (e.g., [nx, ny, nz]).
+        bbox (Sequence[Array]): Bounding box as (mins, maxs), where each is an array of coordinates.
+        path (Optional[Union[str, Path]], optional): Path of the `.npy` file backing the tensor. If None, the tensor is held in memory.
+        field_names (Optional[Sequence[str]], optional): Names of the fields to project. If None, uses all fields of the dataset.
+        base_name (Optional[str], optional): Name of the mesh base to use. If None, uses all bases.
+        zone_name (Optional[str], optional): Name of the mesh zone to use. If None, uses all zones.
+        method (Optional[str], optional): Projection method. Defaults to "Interp/Clamp".
+        engine (str, optional): Operator assembly engine: "muscat" for the generic point location of `GetFieldTransferOp`, or "structured" for `compute_grid_transfer_operator`, which exploits the regular grid. Defaults to "muscat".
+        dtype (DTypeLike, optional): Floating-point type of the transfer operators and projected fields; `np.float32` halves the memory footprint of operators and fields, at the cost of a relative error of about 1e-7. Defaults to `np.float64`.
+        tile_shape (Optional[Sequence[int]], optional): Maximum number of grid points of a tile along each axis. If None, the grid is processed as a single tile.
+        verbose (Optional[bool], optional): If True, shows progress bar. Defaults to False.
+        operator_cache (Optional[OperatorCache], optional): Cache of transfer operators, which can be shared between calls; it should hold at least one operator per tile for operators to be reused across samples. If None, a cache local to this call, sized to the number of tiles, is used.
+        n_workers (int, optional): Number of worker processes. Defaults to 1 (serial execution).
+        executor (Optional[Executor], optional): Executor used to process the chunks of samples, instead of a process pool with `n_workers` workers; `n_workers` should then be its number of workers.
+        chunksize (Optional[int], optional): Number of samples per chunk sent to a worker. If None, samples are split in about four chunks per worker.
 
-        for sn in sample.get_scalar_names():
-            projected_sample.add_scalar(sn, sample.get_scalar(sn))
+    Returns:
+        Tuple[Array, Dict[str, list]]: The tensor of projected fields, and its index with keys "sample_ids", "field_names" and "times" (the list of times of each sample).
+    """
+    tiles = _split_regular_grid(dimensions, bbox, tile_shape, method, engine, dtype)
 
-        for time in sample.get_all_mesh_times():
-            projected_sample.add_tree(
-                MeshToCGNS(background_mesh, exportOriginalIDs=False)
-            )
+    if operator_cache is None:
+        operator_cache = OperatorCache(maxsize=max(16, len(tiles)))
 
-            mesh = CGNSToMesh(
-                sample.get_mesh(time=time), baseNames=baseNames, zoneNames=zoneNames
+    sample_ids = dataset.get_sample_ids()
+    if field_names is None:
+        field_names = dataset.get_field_names(base_name=base_name, zone_name=zone_name)
+    field_names = list(field_names)
+    n_times = max(
+        (len(dataset[id].get_all_mesh_times()) for id in sample_ids), default=0
+    )
+    shape = (len(sample_ids), n_times, len(field_names), *dimensions)
+
+    parallel = n_workers > 1 or executor is not None
+    if path is not None:
+        path = Path(path)
+    # Without `path`, workers write through a temporary file read back at the end
+    with (
+        tempfile.TemporaryDirectory()
+        if path is None and parallel
+        else contextlib.nullcontext()
+    ) as tmp_dir:
+        tensor_path = path if tmp_dir is None else Path(tmp_dir) / "projection.npy"
+        if tensor_path is not None:
+            tensor = np.lib.format.open_memmap(
+                tensor_path, mode="w+", dtype=dtype, shape=shape
             )
+        else:
+            tensor = np.empty(shape, dtype=dtype)
 
-            space, numberings, _, _ = PrepareFEComputation(mesh, numberOfComponents=1)
-            field = FEField("", mesh=mesh, space=space, numbering=numberings[0])
-            op, _, _ = GetFieldTransferOp(
-                field,
-                background_mesh.nodes,
-                method=method,
-                verbose=False,
-                elementFilter=ElementFilter(),
+        write = partial(
+            _write_sample_on_regular_grid_to_array,
+            tensor=None if parallel else tensor,
+            path=tensor_path if parallel else None,
+            tiles=tiles,
+            field_names=field_names,
+            base_name=base_name,
+            zone_name=zone_name,
+            operator_cache=operator_cache,
+            dtype=dtype,
+        )
+        all_times = list(
+            map_in_chunks(
+                write,
+                ((i, dataset[id]) for i, id in enumerate(sample_ids)),
+                total=len(sample_ids),
+                n_workers=n_workers,
+                executor=executor,
+                chunksize=chunksize,
+                verbose=verbose,
             )
+        )
+        if path is None and parallel:
+            tensor = np.array(tensor)
+
+    index = {
+        "sample_ids": [int(id) for id in sample_ids],
+        "field_names": field_names,
+        "times": all_times,
+    }
+    if path is not None:
+        tensor.flush()
+        with open(path.with_suffix(".json"), "w") as file:
+            json.dump(index, file)
+
+    return tensor, index
+
+
+def load_regular_grid_projection(
+    path: Union[str, Path], mmap_mode: Optional[str] = "r"
+) -> Tuple[Array, Dict[str, list]]:
+    """Load a tensor of projected fields written by `project_on_regular_grid_to_array`.
+
+    Args:
+        path (Union[str, Path]): Path of the `.npy` file backing the tensor.
+        mmap_mode (Optional[str], optional): Memory-mapping mode passed to `numpy.load`. If None, the tensor is read in memory. Defaults to "r".
+
+    Returns:
+        Tuple[Array, Dict[str, list]]: The tensor of projected fields, of shape (n_samples, n_times, n_fields, *dimensions), and its index with keys "sample_ids", "field_names" and "times".
+    """
+    path = Path(path)
+    with open(path.with_suffix(".json")) as file:
+        index = json.load(file)
+    return np.load(path, mmap_mode=mmap_mode), index
+
 
-            for fn in sample.get_field_names():
-                field = sample.get_field(
-                    fn, base_name=base_name, zone_name=zone_name, time=time
+def _update_target_fields_in_tree(
+    sample_target: Sample,
+    time: float,
+    mesh_source: Union[Mesh, MeshView],
+    source_fingerprint: str,
+    target_fingerprinters: Dict[Tuple[Optional[str], Optional[str]], MeshFingerprinter],
+    base_name: Optional[str],
+    zone_name: Optional[str],
+    method: str,
+    dtype: DTypeLike,
+    operator_cache: OperatorCache,
+) -> None:
+    tree_target = sample_target.get_mesh(time=time)
+    base_names = (
+        [base_name]
+        if base_name is not None
+        else sample_target.get_base_names(time=time)
+    )
+    for bn in base_names:
+        zone_names = sample_target.get_zone_names(base_name=bn, time=time)
+        if zone_name is not None:
+            zone_names = [zone_name] if zone_name in zone_names else []
+        for zn in zone_names:
+            fingerprinter = target_fingerprinters.setdefault(
+                (bn, zn), MeshFingerprinter([bn], [zn])
+            )
+            nodes = sample_target.get_nodes(zone_name=zn, base_name=bn, time=time)
+            op = operator_cache.get_or_compute(
+                (
+                    source_fingerprint,
+                    fingerprinter(tree_target),
+                    method,
+                    np.dtype(dtype).str,
+                ),
+                lambda: compute_transfer_operator(
+                    mesh_source, nodes, method, dtype=dtype
+                ),
+            )
+            projected_fields = apply_transfer_operator(op, mesh_source.nodeFields)
+            for fn in sample_target.get_field_names(
+                location="Vertex", zone_name=zn, base_name=bn, time=time
+            ):
+                if fn not in projected_fields:
+                    sample_target.del_field(fn, zone_name=zn, base_name=bn, time=time)
+            for fn, projected_field in projected_fields.items():
+                sample_target.add_field(
+                    fn,
+                    projected_field,
+                    zone_name=zn,
+                    base_name=bn,
+                    time=time,
+                    warning_overwrite=False,
                 )
-                if field is not None:
-                    projected_sample.add_field(
-                        fn,
-                        op.dot(field),
-                        base_name=base_name,
-                        zone_name=zone_name,
-                        time=time,
-                        warning_overwrite=False,
-                    )
-
-        projected_samples.append(projected_sample)
 
-    projected_dataset = Dataset()
-    projected_dataset.add_samples(projected_samples, dataset.get_sample_ids())
 
-    return projected_dataset
+def _project_sample_on_other_sample(
+    samples: Tuple[Sample, Sample],
+    base_name: Optional[str],
+    zone_name: Optional[str],
+    method: str,
+    dtype: DTypeLike,
+    keep_trees: bool,
+    operator_cache: OperatorCache,
+    target_meshes: LRUCache,
+    target_fingerprinters: Dict[Tuple[Optional[str], Optional[str]], MeshFingerprinter],
+) -> Sample:
+    sample_source, sample_target = samples
+    assert np.allclose(
+        sample_source.get_all_mesh_times(),
+        sample_target.get_all_mesh_times(),
+    ), "`sample_source` and `sample_target` should have same time steps"
+
+    # Target fingerprinters are shared between samples: a target tree sharing the arrays
+    # of the previous one, such as a broadcast reference, is not hashed again
+    source_fingerprinter = create_mesh_fingerprinter(base_name, zone_name)
+    target_fingerprinter = target_fingerprinters.setdefault(
+        (base_name, zone_name), create_mesh_fingerprinter(base_name, zone_name)
+    )
+    baseNames = source_fingerprinter.base_names
+    zoneNames = source_fingerprinter.zone_names
+
+    for time in sample_source.get_all_mesh_times():
+        tree_source = sample_source.get_mesh(time=time)
+        mesh_source = load_mesh(
+            tree_source,
+            baseNames,
+            zoneNames,
+            nodes_only=method == "Nearest/Nearest",
+        )
+        source_fingerprint = source_fingerprinter(tree_source)
+
+        if keep_trees:
+            _update_target_fields_in_tree(
+                sample_target,
+                time,
+                mesh_source,
+                source_fingerprint,
+                target_fingerprinters,
+                base_name,
+                zone_name,
+                method,
+                dtype,
+                operator_cache,
+            )
+            continue
+
+        tree_target = sample_target.get_mesh(time=time)
+        target_fingerprint = target_fingerprinter(tree_target)
+        mesh_target = target_meshes.get(target_fingerprint)
+        if mesh_target is None:
+            mesh_target = copy.copy(cgns_to_mesh(tree_target, baseNames, zoneNames))
+            mesh_target.elemFields = {}
+            target_meshes.put(target_fingerprint, mesh_target)
+        mesh_target.nodeFields = {}
+
+        key = (
+            source_fingerprint,
+            target_fingerprint,
+            method,
+            np.dtype(dtype).str,
+        )
+        op = operator_cache.get_or_compute(
+            key,
+            lambda: compute_transfer_operator(
+                mesh_source, mesh_target.nodes, method, dtype=dtype
+            ),
+        )
+
+        sample_target.del_tree(time)
+
+        mesh_target.nodeFields = apply_transfer_operator(op, mesh_source.nodeFields)
+
+        sample_target.add_tree(
+            MeshToCGNS(mesh_target, exportOriginalIDs=False), time=time
+        )
+
+    return sample_target
+
+
+def _copy_tree_structure(node: list) -> list:
+    # Copy of the nodes of a tree sharing its arrays: fields can be added, replaced or
+    # removed in the copy without modifying the original tree
+    return [node[0], node[1], [_copy_tree_structure(c) for c in node[2]], node[3]]
+
+
+def _broadcast_sample(reference: Sample, times: Sequence[float]) -> Sample:
+    reference_times = reference.get_all_mesh_times()
+    sample = Sample()
+    for sn in reference.get_scalar_names():
+        sample.add_scalar(sn, reference.get_scalar(sn))
+    if len(reference_times) != 1:
+        times = reference_times
+    for time in times:
+        tree = reference.get_mesh(time if len(reference_times) != 1 else None)
+        sample.add_tree(_copy_tree_structure(tree), time=time)
+    return sample
 
 
 def project_on_other_dataset(
@@ -161,8 +901,15 @@ def project_on_other_dataset(
     base_name: Optional[str] = None,
     zone_name: Optional[str] = None,
     method: str = "Interp/Clamp",
+    dtype: DTypeLike = np.float64,
     verbose: bool = False,
     in_place: bool = False,
+    operator_cache: Optional[OperatorCache] = None,
+    keep_trees: bool = False,
+    join: str = "exact",
+    n_workers: int = 1,
+    executor: Optional[Executor] = None,
+    chunksize: Optional[int] = None,
 ) -> Dataset:
     """Project all samples of a source dataset onto the mesh geometry of a target dataset.
 
@@ -170,6 +917,31 @@ def project_on_other_dataset(
     this function transfers all nodal fields from the source mesh to the target mesh using the specified method.
     The mesh geometry of the target dataset is preserved, but its nodal fields are replaced by the projected fields from the source.
 
+    Source and target samples are paired according to `join`:
+        - "exact": both datasets should have the same sample ids, in the same order.
+        - "inner": samples are paired by id, and only ids present in both datasets are
+          projected. Without `in_place`, the returned dataset only contains these ids.
+        - "broadcast": `dataset_target` contains a single reference sample, onto which
+          every source sample is projected. The returned dataset has the sample ids of
+          `dataset_source`; if the reference has a single time step, its mesh is used for
+          all the time steps of each source sample. The reference mesh is converted and
+          fingerprinted only once, the output trees share its arrays, and for sources
+          sharing a mesh, the transfer operators are computed only once. The returned
+          dataset is always a new one, and `in_place` should be False.
+    Within a sample, consecutive time steps sharing a static mesh reuse the transfer operator
+    and the converted target mesh, detected through `MeshFingerprinter`.
+
+    By default, each target tree is rebuilt from a Muscat mesh carrying the projected fields.
+    With `keep_trees=True`, the target trees are kept as they are, and the projected fields
+    are written, zone by zone, into their vertex FlowSolution nodes, replacing the nodal
+    fields present there: coordinates, connectivity and other nodes (boundary conditions,
+    cell fields) are neither converted nor copied, which spares most of the memory traffic
+    on large target meshes, especially together with `in_place=True`.
+
+    With `n_workers > 1` or an `executor`, pairs of source and target samples are sent in
+    chunks to worker processes, and the projected target samples are written back into the
+    returned dataset (`dataset_target` itself if `in_place=True`).
+
     The available projection methods are:
         - "Interp/Nearest"
         - "Nearest/Nearest"
@@ -183,63 +955,189 @@ def project_on_other_dataset(
         base_name (Optional[str], optional): Name of the mesh base to use. If None, uses all bases.
         zone_name (Optional[str], optional): Name of the mesh zone to use. If None, uses all zones.
         method (Optional[str], optional): Projection method. Defaults to "Interp/Clamp".
+        dtype (DTypeLike, optional): Floating-point type of the transfer operators and projected fields; `np.float32` halves the memory footprint of operators and fields, at the cost of a relative error of about 1e-7. Defaults to `np.float64`.
         verbose (Optional[bool], optional): If True, shows progress bar. Defaults to False.
-        in_place (Optional[bool], optional): If True, modifies `dataset_target` in place. If False, works on a copy.
+        in_place (Optional[bool], optional): If True, modifies `dataset_target` in place. If False, works on a copy. Not supported with `join="broadcast"`.
+        operator_cache (Optional[OperatorCache], optional): Cache of transfer operators, which can be shared between calls. If None, a cache local to this call is used.
+        keep_trees (bool, optional): If True, updates the nodal fields of the existing target trees instead of rebuilding them. Defaults to False.
+        join (str, optional): How source and target samples are paired: "exact", "inner" or "broadcast". Defaults to "exact".
+        n_workers (int, optional): Number of worker processes. Defaults to 1 (serial execution).
+        executor (Optional[Executor], optional): Executor used to process the chunks of sample pairs, instead of a process pool with `n_workers` workers; `n_workers` should then be its number of workers.
+        chunksize (Optional[int], optional): Number of sample pairs per chunk sent to a worker. If None, pairs are split in about four chunks per worker.
 
     Returns:
         Dataset: The target dataset with nodal fields replaced by the projected fields from the source dataset.
     """
-    assert np.allclose(
-        dataset_source.get_sample_ids(), dataset_target.get_sample_ids()
-    ), "`dataset_source` and `dataset_target` should have same sample ids"
+    assert join in ("exact", "inner", "broadcast"), (
+        "`join` should be one of 'exact', 'inner' or 'broadcast'"
+    )
 
-    if not in_place:
-        dataset_target = dataset_target.copy()
+    if join == "broadcast":
+        assert len(dataset_target) == 1, (
+            "`dataset_target` should contain a single sample with `join='broadcast'`"
+        )
+        assert not in_place, "`in_place` is not supported with `join='broadcast'`"
+        reference = dataset_target[dataset_target.get_sample_ids()[0]]
+        sample_ids = dataset_source.get_sample_ids()
+        dataset_target = Dataset()
+        target_samples = (
+            _broadcast_sample(reference, dataset_source[id].get_all_mesh_times())
+            for id in sample_ids
+        )
+    else:
+        if join == "exact":
+            assert np.allclose(
+                dataset_source.get_sample_ids(), dataset_target.get_sample_ids()
+            ), "`dataset_source` and `dataset_target` should have same sample ids"
+            sample_ids = dataset_source.get_sample_ids()
+            if not in_place:
+                dataset_target = dataset_target.copy()
+        else:
+            target_ids = set(dataset_target.get_sample_ids())
+            sample_ids = [
+                id for id in dataset_source.get_sample_ids() if id in target_ids
+            ]
+            if not in_place:
+                subset = Dataset()
+                for id in sample_ids:
+                    subset.add_sample(dataset_target[id].copy(), id)
+                dataset_target = subset
+        target_samples = (dataset_target[id] for id in sample_ids)
 
-    baseNames = [base_name] if base_name is not None else None
-    zoneNames = [zone_name] if zone_name is not None else None
+    if operator_cache is None:
+        operator_cache = OperatorCache()
 
-    for sample_source, sample_target in tqdm(
-        zip(dataset_source, dataset_target),
-        total=len(dataset_source),
-        disable=not verbose,
+    project = partial(
+        _project_sample_on_other_sample,
+        base_name=base_name,
+        zone_name=zone_name,
+        method=method,
+        dtype=dtype,
+        keep_trees=keep_trees,
+        operator_cache=operator_cache,
+        target_meshes=LRUCache(maxsize=1),
+        target_fingerprinters={},
+    )
+    for id, projected_sample in zip(
+        sample_ids,
+        map_in_chunks(
+            project,
+            zip((dataset_source[id] for id in sample_ids), target_samples),
+            total=len(sample_ids),
+            n_workers=n_workers,
+            executor=executor,
+            chunksize=chunksize,
+            verbose=verbose,
+        ),
     ):
-        assert np.allclose(
-            sample_source.get_all_mesh_times(),
-            sample_target.get_all_mesh_times(),
-        ), "`sample_source` and `sample_target` should have same time steps"
-
-        for time in sample_source.get_all_mesh_times():
-            mesh_source = CGNSToMesh(
-                sample_source.get_mesh(time=time),
-                baseNames=baseNames,
-                zoneNames=zoneNames,
-            )
-            mesh_target = CGNSToMesh(
-                sample_target.get_mesh(time=time),
-                baseNames=baseNames,
-                zoneNames=zoneNames,
-            )
-            mesh_target.nodeFields = {}
-            mesh_target.elemFields = {}
+        if join == "broadcast":
+            dataset_target.add_sample(projected_sample, id)
+        elif projected_sample is not dataset_target[id]:
+            dataset_target.set_sample(id, projected_sample, warning_overwrite=False)
+
+    return dataset_target
 
-            sample_target.del_tree(time)
 
-            space, numberings, _, _ = PrepareFEComputation(
-                mesh_source, numberOfComponents=1
-            )
-            field = FEField("", mesh=mesh_source, space=space, numbering=numberings[0])
-            op, _, _ = GetFieldTransferOp(
-                field,
-                mesh_target.nodes,
-                method=method,
-                verbose=False,
-                elementFilter=ElementFilter(),
+class RegularGridProjector:
+    """Round-trip projector between the mesh of a sample and a regular rectilinear grid.
+
+    The forward operator (mesh to grid) is assembled as in `project_on_regular_grid`, and
+    shares its operator cache keys; the backward operator (grid to mesh) is the multilinear
+    interpolation of `compute_grid_interpolation_operator`, evaluated at the mesh nodes.
+    Both are assembled once, at construction, so that projecting fields to the grid and
+    back, e.g. to map model predictions back onto the original mesh at inference time,
+    only costs sparse matrix products.
+
+    Args:
+        sample (Sample): The sample providing the mesh.
+        dimensions (Sequence[int]): Number of grid points along each axis (e.g., [nx, ny, nz]).
+        bbox (Sequence[Array]): Bounding box as (mins, maxs), where each is an array of coordinates.
+        base_name (Optional[str], optional): Name of the mesh base to use. If None, uses all bases.
+        zone_name (Optional[str], optional): Name of the mesh zone to use. If None, uses all zones.
+        time (Optional[float], optional): Time step of the mesh. If None, uses the default time.
+        method (str, optional): Forward projection method, see `project_on_regular_grid`. Defaults to "Interp/Clamp".
+        engine (str, optional): Forward operator assembly engine, see `project_on_regular_grid`. Defaults to "muscat".
+        dtype (DTypeLike, optional): Floating-point type of the operators and projected fields. Defaults to `np.float64`.
+        operator_cache (Optional[OperatorCache], optional): Cache of forward transfer operators, which can be shared with the projection functions. If None, no cache is used.
+    """
+
+    def __init__(
+        self,
+        sample: Sample,
+        dimensions: Sequence[int],
+        bbox: Sequence[Array],
+        base_name: Optional[str] = None,
+        zone_name: Optional[str] = None,
+        time: Optional[float] = None,
+        method: str = "Interp/Clamp",
+        engine: str = "muscat",
+        dtype: DTypeLike = np.float64,
+        operator_cache: Optional[OperatorCache] = None,
+    ):
+        dims, mins, spacing = _regular_grid_spacing(dimensions, bbox, engine)
+        grid_key, compute_operator = _regular_grid_operator(
+            dims, mins, spacing, method, engine, dtype
+        )
+        fingerprinter = create_mesh_fingerprinter(base_name, zone_name)
+        tree = sample.get_mesh(time=time)
+        selection = (tree, fingerprinter.base_names, fingerprinter.zone_names)
+
+        self.dimensions = dims
+        if operator_cache is None:
+            self.forward_operator = compute_operator(*selection)
+        else:
+            self.forward_operator = operator_cache.get_or_compute(
+                (fingerprinter(tree), *grid_key), lambda: compute_operator(*selection)
             )
+        self.backward_operator = compute_grid_interpolation_operator(
+            load_mesh(*selection, nodes_only=True).nodes,
+            dims,
+            mins,
+            spacing,
+            dtype=dtype,
+        )
 
-            for fn, field in mesh_source.nodeFields.items():
-                mesh_target.nodeFields[fn] = op.dot(field)
+    def forward(
+        self, fields: Union[Array, Dict[str, Field]]
+    ) -> Union[Array, Dict[str, Field]]:
+        """Project nodal fields of the mesh onto the grid.
 
-            sample_target.add_tree(MeshToCGNS(mesh_target, exportOriginalIDs=False))
+        Args:
+            fields (Union[Array, Dict[str, Field]]): Either an array of shape (n_nodes, ...), e.g. several fields stacked along the last axis, or nodal fields by name.
 
-    return dataset_target
+        Returns:
+            Union[Array, Dict[str, Field]]: The grid fields, with n_grid_nodes rows ordered as in `project_on_regular_grid`, in the same container as `fields`.
+        """
+        return self._apply(self.forward_operator, fields)
+
+    def backward(
+        self, fields: Union[Array, Dict[str, Field]]
+    ) -> Union[Array, Dict[str, Field]]:
+        """Interpolate grid fields back onto the nodes of the mesh.
+
+        Args:
+            fields (Union[Array, Dict[str, Field]]): Either an array of shape (n_grid_nodes, ...) or (*dimensions, ...), or grid fields by name with the same leading shapes.
+
+        Returns:
+            Union[Array, Dict[str, Field]]: The nodal fields, with n_nodes rows, in the same container as `fields`.
+        """
+        n_dims = len(self.dimensions)
+
+        def flatten(field: Field) -> Field:
+            if np.shape(field)[:n_dims] == self.dimensions:
+                return np.reshape(field, (-1, *np.shape(field)[n_dims:]))
+            return field
+
+        if isinstance(fields, dict):
+            fields = {name: flatten(field) for name, field in fields.items()}
+        else:
+            fields = flatten(fields)
+        return self._apply(self.backward_operator, fields)
+
+    @staticmethod
+    def _apply(
+        op: csr_matrix, fields: Union[Array, Dict[str, Field]]
+    ) -> Union[Array, Dict[str, Field]]:
+        if isinstance(fields, dict):
+            return apply_transfer_operator(op, fields)
+        return apply_transfer_operator(op, {"": fields})[""]
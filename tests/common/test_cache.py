@@ -0,0 +1,94 @@
+import pickle
+
+import numpy as np
+
+from plaid_ops.common.cache import ArrayCache, DiskCache, LRUCache
+
+
+class Test_LRUCache:
+    def test_get_put(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.hits == 1 and cache.misses == 1
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+        cache.clear()
+        assert len(cache) == 0
+
+
+class Test_DiskCache:
+    def test_get_put(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        assert cache.get("a") is None
+        cache.put("a", {"x": np.arange(3), "y": np.ones((2, 2))})
+        assert "a" in cache and len(cache) == 1
+        arrays = DiskCache(tmp_path).get("a")
+        assert isinstance(arrays["x"], np.memmap)
+        assert np.array_equal(arrays["x"], np.arange(3))
+        assert np.array_equal(arrays["y"], np.ones((2, 2)))
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_integrity(self, tmp_path):
+        cache = DiskCache(tmp_path)
+        cache.put("a", {"x": np.arange(3)})
+        (path,) = [p for p in tmp_path.iterdir()]
+        np.save(path / "x.npy", np.arange(2))
+        assert cache.get("a") is None
+        assert "a" not in cache
+
+        cache = DiskCache(tmp_path, verify=True)
+        cache.put("a", {"x": np.arange(3)})
+        np.save(path / "x.npy", np.arange(1, 4))
+        assert DiskCache(tmp_path).get("a") is not None
+        assert cache.get("a") is None
+        assert "a" not in cache
+
+    def test_eviction(self, tmp_path):
+        cache = DiskCache(tmp_path, max_bytes=3000)
+        cache.put("a", {"x": np.zeros(100)})
+        cache.put("b", {"x": np.zeros(100)})
+        assert "a" in cache and "b" in cache
+        cache.put("c", {"x": np.zeros(200)})
+        assert "a" not in cache and "c" in cache
+        assert cache.size() <= 3000
+
+
+class Test_ArrayCache:
+    def test_get_put(self):
+        cache = ArrayCache(maxsize=1)
+        assert cache.get("a") is None
+        cache.put("a", np.arange(3))
+        assert np.array_equal(cache.get("a"), np.arange(3))
+        assert cache.get_or_compute("b", lambda: np.ones(2)).sum() == 2
+        assert len(cache) == 1
+        assert (cache.hits, cache.misses) == (1, 2)
+        cache.clear()
+        assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+    def test_persistence(self, tmp_path):
+        ArrayCache(cache_dir=tmp_path).put("a", np.arange(3))
+        cache = pickle.loads(pickle.dumps(ArrayCache(cache_dir=tmp_path)))
+        array = cache.get("a")
+        assert isinstance(array, np.memmap)
+        assert np.array_equal(array, np.arange(3))
+        assert (cache.hits, cache.disk_hits, cache.misses) == (1, 1, 0)
+
+    def test_integrity(self, tmp_path):
+        ArrayCache(cache_dir=tmp_path).put("a", np.arange(3))
+        (path,) = [p for p in tmp_path.iterdir()]
+        np.save(path / "value.npy", np.arange(1, 4))
+        assert ArrayCache(cache_dir=tmp_path).get("a") is not None
+        cache = ArrayCache(cache_dir=tmp_path, verify=True)
+        assert cache.get("a") is None
+        assert (cache.hits, cache.misses) == (0, 1)
@@ -0,0 +1,61 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from plaid_ops.common.conversion import (
+    MeshConversionCache,
+    get_mesh_conversion_cache,
+    sample_to_mesh,
+)
+from plaid_ops.mesh.feature_engineering import compute_sdf
+
+
+class Test_MeshConversionCache:
+    def test_convert(self, sample_with_tree, nodes):
+        cache = MeshConversionCache()
+        tree = sample_with_tree.get_mesh()
+        mesh = cache.convert(tree)
+        assert np.allclose(mesh.nodes, nodes)
+        assert list(mesh.nodeFields) == ["test"]
+        assert cache.convert(tree).nodes is mesh.nodes
+        assert cache.convert(tree, zone_names=["Zone"]).nodes is not mesh.nodes
+        assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+        sample_with_tree.add_field("new", np.ones(len(nodes)), warning_overwrite=False)
+        new_mesh = cache.convert(sample_with_tree.get_mesh())
+        assert "new" in new_mesh.nodeFields and "new" not in mesh.nodeFields
+        assert new_mesh.nodes is mesh.nodes
+        assert (cache.hits, cache.misses, len(cache)) == (2, 2, 2)
+
+        cache = pickle.loads(pickle.dumps(cache))
+        assert len(cache) == 0 and cache.nbytes == 0
+        cache.clear()
+        assert (cache.hits, cache.misses) == (0, 0)
+
+    def test_eviction(self, sample_with_tree):
+        cache = MeshConversionCache(max_bytes=1)
+        cache.convert(sample_with_tree.get_mesh())
+        assert len(cache) == 0 and cache.nbytes == 0
+        cache = MeshConversionCache(maxsize=1)
+        cache.convert(sample_with_tree.get_mesh())
+        cache.convert(sample_with_tree.copy().get_mesh())
+        assert len(cache) == 1 and cache.nbytes > 0
+
+    def test_threads(self, sample_with_tree, nodes):
+        cache = MeshConversionCache(maxsize=2)
+        trees = [sample_with_tree.copy().get_mesh() for _ in range(4)]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            meshes = list(executor.map(cache.convert, trees * 8))
+        assert all(np.allclose(mesh.nodes, nodes) for mesh in meshes)
+        assert cache.hits + cache.misses == 32 and len(cache) == 2
+
+    def test_shared_cache(self, sample_with_tree):
+        cache = get_mesh_conversion_cache()
+        cache.clear()
+        sdf = compute_sdf(sample_with_tree)
+        sample_with_tree.add_field("sdf", sdf, warning_overwrite=False)
+        mesh = sample_to_mesh(sample_with_tree)
+        assert np.allclose(mesh.nodeFields["sdf"], sdf)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert sample_to_mesh(sample_with_tree, time=0.0).nodes is mesh.nodes
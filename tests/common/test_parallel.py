@@ -0,0 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from plaid_ops.common.parallel import map_in_chunks
+
+
+def square(x):
+    return x * x
+
+
+class Test_Parallel:
+    def test_map_in_chunks_serial(self):
+        assert list(map_in_chunks(square, range(5), total=5)) == [0, 1, 4, 9, 16]
+
+    def test_map_in_chunks_process_pool(self):
+        results = map_in_chunks(
+            square, range(10), total=10, n_workers=2, chunksize=3, verbose=True
+        )
+        assert list(results) == [x * x for x in range(10)]
+
+    def test_map_in_chunks_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = map_in_chunks(
+                lambda x: x + 1, range(10), total=10, n_workers=2, executor=executor
+            )
+            assert list(results) == list(range(1, 11))
+            with pytest.raises(AssertionError):
+                list(map_in_chunks(square, range(10), total=10, executor=executor))
@@ -0,0 +1,49 @@
+import numpy as np
+from plaid.containers.dataset import Dataset
+
+from plaid_ops.mesh.bounding_box import (
+    BoundingBoxIndex,
+    iter_zone_bounding_boxes,
+    map_zone_bounding_boxes,
+)
+from plaid_ops.mesh.transformations import compute_bounding_box
+
+
+class Test_BoundingBox:
+    def test_iter_zone_bounding_boxes(self, sample_with_tree, nodes):
+        boxes = list(iter_zone_bounding_boxes(sample_with_tree))
+        assert len(boxes) == 1
+        time, base_name, zone_name, mins, maxs = boxes[0]
+        assert time == 0.0
+        assert base_name == sample_with_tree.get_base_names()[0]
+        assert np.allclose(mins, nodes.min(axis=0))
+        assert np.allclose(maxs, nodes.max(axis=0))
+        assert list(iter_zone_bounding_boxes(sample_with_tree, zone_names=["no"])) == []
+        (parallel_boxes,) = map_zone_bounding_boxes([sample_with_tree], n_workers=2)
+        assert np.allclose(parallel_boxes[0][3], mins)
+        assert np.allclose(parallel_boxes[0][4], maxs)
+
+    def test_bounding_box_index(self, sample_with_tree, tmp_path):
+        dataset = Dataset(samples=[sample_with_tree.copy(), sample_with_tree.copy()])
+        index = BoundingBoxIndex()
+        bbox = compute_bounding_box(dataset, index=index)
+        assert len(index) == 2
+        assert np.allclose(bbox, compute_bounding_box(dataset))
+
+        sample = sample_with_tree.copy()
+        sample.set_nodes(sample.get_nodes() + 10.0)
+        dataset.add_sample(sample, 2)
+        bbox = compute_bounding_box(dataset, index=index)
+        assert len(index) == 3
+        assert np.allclose(bbox, compute_bounding_box(dataset))
+
+        assert index.query((np.full(2, 10.5), np.full(2, 20.0))) == [2]
+        assert index.query((np.full(2, 0.5), np.full(2, 0.6))) == [0, 1]
+        assert np.allclose(index.get_bounding_box(ids=[0, 1])[1], [1.0, 1.5])
+
+        path = tmp_path / "bbox_index.json"
+        index.save(path)
+        loaded_index = BoundingBoxIndex.load(path)
+        assert np.allclose(loaded_index.get_bounding_box(), index.get_bounding_box())
+        loaded_index.remove_sample(2)
+        assert 2 not in loaded_index
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from Muscat.MeshTools import MeshCreationTools as MCT
+
+from plaid_ops.mesh.distance import BoundaryIndex
+
+
+def unit_box_sdf(points):
+    inside = np.minimum(points, 1 - points).min(axis=1)
+    outside = np.linalg.norm(points - np.clip(points, 0, 1), axis=1)
+    return np.where(outside > 0, -outside, inside)
+
+
+class Test_BoundaryIndex:
+    def test_square(self):
+        mesh = MCT.CreateSquare(
+            dimensions=[5, 5], origin=[0, 0], spacing=[0.25, 0.25], ofTriangles=True
+        )
+        index = BoundaryIndex.from_mesh(mesh)
+        assert len(index.simplices) == 16
+        points = np.random.default_rng(0).uniform(-0.5, 1.5, (1000, 2))
+        assert np.allclose(
+            index.signed_distance(points, batch_size=128), unit_box_sdf(points)
+        )
+        assert np.allclose(index.distance(points), np.abs(unit_box_sdf(points)))
+        assert np.allclose(
+            index.distance(points, bandwidth=0.1),
+            np.minimum(np.abs(unit_box_sdf(points)), 0.1),
+        )
+
+        distances, closest, normals = index.closest_points(points)
+        assert np.allclose(distances, np.abs(unit_box_sdf(points)))
+        assert np.allclose(np.linalg.norm(closest - points, axis=1), distances)
+        assert np.allclose(np.linalg.norm(normals, axis=1), 1)
+        _, closest, normals = index.closest_points(np.array([[0.5, 0.1], [2, 0.5]]))
+        assert np.allclose(closest, [[0.5, 0], [1, 0.5]])
+        assert np.allclose(normals, [[0, -1], [1, 0]])
+
+    @pytest.mark.parametrize("ofTetras", [True, False])
+    def test_cube(self, ofTetras):
+        mesh = MCT.CreateCube(
+            dimensions=[5, 5, 5],
+            origin=[0, 0, 0],
+            spacing=[0.25] * 3,
+            ofTetras=ofTetras,
+        )
+        index = BoundaryIndex.from_mesh(mesh)
+        points = np.random.default_rng(0).uniform(-0.5, 1.5, (1000, 3))
+        assert np.allclose(index.signed_distance(points), unit_box_sdf(points))
+
+        nodes = mesh.nodes
+        labels = [
+            np.flatnonzero(nodes[:, 0] == 0),
+            np.flatnonzero(nodes[:, 2] == 1),
+            [0],
+        ]
+        distances = index.label_distances(points, labels, batch_size=128)
+        assert distances.shape == (1000, 3)
+        assert np.allclose(
+            distances[:, 0],
+            np.linalg.norm(points - np.clip(points, 0, [0, 1, 1]), axis=1),
+        )
+        assert np.allclose(
+            distances[:, 1],
+            np.linalg.norm(points - np.clip(points, [0, 0, 1], 1), axis=1),
+        )
+        assert np.allclose(distances[:, 2], np.linalg.norm(points, axis=1))
+
+    def test_orientation(self, nodes):
+        mesh = MCT.CreateMeshOfTriangles(nodes, np.array([[0, 1, 2], [0, 3, 2]]))
+        index = BoundaryIndex.from_mesh(mesh)
+        points = np.random.default_rng(0).uniform(-0.5, 1.5, (1000, 2))
+        assert np.allclose(index.signed_distance(points), unit_box_sdf(points))
+        assert index.signed_distance(np.zeros((0, 2))).shape == (0,)
@@ -1,16 +1,139 @@
+import numpy as np
+import pytest
+from Muscat.Bridges.CGNSBridge import MeshToCGNS
+from Muscat.MeshTools import MeshCreationTools as MCT
+from plaid.containers.dataset import Dataset
+from plaid.containers.sample import Sample
+
+from plaid_ops.common.cache import ArrayCache, LRUCache
 from plaid_ops.mesh.feature_engineering import (
+    compute_geometric_features,
     compute_sdf,
+    compute_sdf_at_points,
+    compute_tag_distances,
+    update_dataset_with_geometric_features,
     update_dataset_with_sdf,
     update_sample_with_sdf,
 )
+from plaid_ops.mesh.fingerprint import create_mesh_fingerprinter
+
+
+def square_sample():
+    mesh = MCT.CreateSquare(
+        dimensions=[5, 5], origin=[0, 0], spacing=[0.25, 0.25], ofTriangles=True
+    )
+    sample = Sample()
+    sample.add_tree(MeshToCGNS(mesh))
+    return sample
 
 
 class Test_Feature_Engineering:
     def test_compute_sdf(self, sample_with_tree):
         compute_sdf(sample_with_tree)
 
+    def test_compute_sdf_bandwidth(self):
+        mesh = MCT.CreateSquare(
+            dimensions=[11, 11], origin=[0, 0], spacing=[0.1, 0.1], ofTriangles=True
+        )
+        sample = Sample()
+        sample.add_tree(MeshToCGNS(mesh))
+        sdf = compute_sdf(sample, bandwidth=0.25)
+        assert np.allclose(sdf, np.minimum(compute_sdf(sample), 0.25))
+        assert np.isclose(sdf.max(), 0.25)
+
+    def test_compute_sdf_at_points(self, sample_with_tree, nodes):
+        index_cache = LRUCache()
+        sdf = compute_sdf_at_points(sample_with_tree, nodes, index_cache=index_cache)
+        assert np.allclose(sdf, compute_sdf(sample_with_tree))
+        points = np.array([[0.5, 0.5], [0.5, -1.0]])
+        sdf = compute_sdf_at_points(sample_with_tree, points, index_cache=index_cache)
+        assert np.allclose(sdf, [0.499, -1.001])
+        assert index_cache.hits == 1 and len(index_cache) == 1
+        fingerprint = create_mesh_fingerprinter()(sample_with_tree.get_mesh())
+        assert ("boundary_index", fingerprint) in index_cache
+
     def test_update_sample_with_sdf(self, sample_with_tree):
         update_sample_with_sdf(sample_with_tree)
 
     def test_update_dataset_with_sdf(self, dataset):
         update_dataset_with_sdf(dataset)
+
+    def test_update_dataset_with_sdf_parallel(self, sample_with_tree):
+        dataset = Dataset(samples=[sample_with_tree.copy(), sample_with_tree.copy()])
+        updated_dataset = update_dataset_with_sdf(dataset)
+        parallel_updated_dataset = update_dataset_with_sdf(
+            dataset, n_workers=2, chunksize=1
+        )
+        for id in dataset.get_sample_ids():
+            assert np.allclose(
+                parallel_updated_dataset[id].get_field("sdf"),
+                updated_dataset[id].get_field("sdf"),
+            )
+
+    def test_update_dataset_with_sdf_cache(self, sample_with_tree):
+        dataset = Dataset(samples=[sample_with_tree.copy(), sample_with_tree.copy()])
+        reference = update_sample_with_sdf(sample_with_tree).get_field("sdf")
+        sdf_cache = ArrayCache()
+        update_dataset_with_sdf(dataset, in_place=True, sdf_cache=sdf_cache)
+        assert sdf_cache.misses == 1 and len(sdf_cache) == 1
+        for sample in dataset:
+            assert np.allclose(sample.get_field("sdf"), reference)
+        sample = update_sample_with_sdf(sample_with_tree, sdf_cache=sdf_cache)
+        assert sdf_cache.hits == 1
+        assert np.allclose(sample.get_field("sdf"), reference)
+
+    def test_compute_geometric_features(self):
+        sample = square_sample()
+        nodes = sample.get_nodes()
+        fields = compute_geometric_features(sample, tags=["x0y0"])
+        assert set(fields) == {
+            "boundary_normal_x",
+            "boundary_normal_y",
+            "boundary_point_x",
+            "boundary_point_y",
+            "distance_x0y0",
+            "mesh_size",
+        }
+        closest = np.stack([fields["boundary_point_x"], fields["boundary_point_y"]], 1)
+        assert np.allclose(
+            np.linalg.norm(closest - nodes, axis=1),
+            np.minimum(nodes, 1 - nodes).min(axis=1),
+        )
+        left = np.isclose(nodes[:, 0], 0) & (nodes[:, 1] > 0) & (nodes[:, 1] < 1)
+        assert np.allclose(fields["boundary_normal_x"][left], -1)
+        assert np.allclose(fields["distance_x0y0"], np.linalg.norm(nodes, axis=1))
+        assert np.all(fields["mesh_size"] >= 0.25)
+        assert np.all(fields["mesh_size"] <= 0.25 * np.sqrt(2))
+
+        fields = compute_geometric_features(sample, features=["tag_distance"])
+        assert len(fields) == 9
+        with pytest.raises(ValueError):
+            compute_geometric_features(sample, features=["unknown"])
+        with pytest.raises(ValueError):
+            compute_geometric_features(sample, tags=["missing"])
+
+    def test_compute_tag_distances(self):
+        sample = square_sample()
+        nodes = sample.get_nodes()
+        distances = compute_tag_distances(sample, tags=["X0", "Y1", "x1y0"])
+        assert list(distances) == ["X0", "Y1", "x1y0"]
+        assert np.allclose(distances["X0"], nodes[:, 0])
+        assert np.allclose(distances["Y1"], 1 - nodes[:, 1])
+        assert np.allclose(distances["x1y0"], np.linalg.norm(nodes - [1, 0], axis=1))
+        assert np.allclose(
+            compute_tag_distances(sample)["Skin"],
+            np.minimum(nodes, 1 - nodes).min(axis=1),
+        )
+        with pytest.raises(ValueError):
+            compute_tag_distances(sample, tags=["missing"])
+
+    def test_update_dataset_with_geometric_features(self):
+        dataset = Dataset(samples=[square_sample(), square_sample()])
+        reference = compute_geometric_features(dataset[0], features=["mesh_size"])
+        updated_dataset = update_dataset_with_geometric_features(
+            dataset, features=["mesh_size", "boundary_normal"], n_workers=2
+        )
+        for sample in updated_dataset:
+            assert np.allclose(sample.get_field("mesh_size"), reference["mesh_size"])
+            assert "boundary_normal_y" in sample.get_field_names()
+        assert "mesh_size" not in dataset[0].get_field_names()
@@ -0,0 +1,40 @@
+import numpy as np
+
+from plaid_ops.mesh.fingerprint import (
+    MeshFingerprinter,
+    compute_array_fingerprint,
+    compute_mesh_fingerprint,
+)
+
+
+class Test_Fingerprint:
+    def test_compute_array_fingerprint(self):
+        assert compute_array_fingerprint(np.arange(3)) == compute_array_fingerprint(
+            np.arange(3)
+        )
+        assert compute_array_fingerprint(np.arange(3)) != compute_array_fingerprint(
+            np.arange(3.0)
+        )
+
+    def test_compute_mesh_fingerprint(self, sample_with_tree):
+        tree = sample_with_tree.get_mesh()
+        fingerprint = compute_mesh_fingerprint(tree)
+        sample = sample_with_tree.copy()
+        sample.add_field("other", np.ones(5))
+        assert compute_mesh_fingerprint(sample.get_mesh()) == fingerprint
+        sample.set_nodes(2.0 * sample.get_nodes())
+        assert compute_mesh_fingerprint(sample.get_mesh()) != fingerprint
+        assert compute_mesh_fingerprint(tree, base_names=["unknown"]) != fingerprint
+
+    def test_mesh_fingerprinter(self, sample_with_tree):
+        tree = sample_with_tree.get_mesh()
+        fingerprinter = MeshFingerprinter()
+        fingerprint = fingerprinter(tree)
+        assert fingerprint == compute_mesh_fingerprint(tree)
+        sample = sample_with_tree.copy()
+        assert fingerprinter(sample.get_mesh()) == fingerprint
+        # unchanged arrays are not hashed again, so in-place changes go unnoticed
+        sample.get_nodes()[:] *= 2.0
+        assert fingerprinter(sample.get_mesh()) == fingerprint
+        sample.set_nodes(3.0 * sample.get_nodes())
+        assert fingerprinter(sample.get_mesh()) != fingerprint
@@ -0,0 +1,121 @@
+import numpy as np
+from Muscat.MeshTools import MeshCreationTools as MCT
+from Muscat.MeshTools.ConstantRectilinearMeshTools import (
+    CreateConstantRectilinearMesh,
+)
+
+from plaid_ops.mesh.operators import (
+    OperatorCache,
+    apply_transfer_operator,
+    compute_grid_interpolation_operator,
+    compute_grid_transfer_operator,
+    compute_transfer_operator,
+)
+
+
+class Test_Operators:
+    def test_compute_transfer_operator(self, mesh, nodes):
+        op = compute_transfer_operator(mesh, nodes)
+        assert np.allclose(op.dot(mesh.nodeFields["test"]), np.arange(5))
+
+    def test_compute_transfer_operator_float32(self, mesh, nodes):
+        op = compute_transfer_operator(mesh, nodes[::-1])
+        op_32 = compute_transfer_operator(mesh, nodes[::-1], dtype=np.float32)
+        assert op_32.dtype == np.float32
+        assert op_32.indices.dtype == np.int32 and op_32.indptr.dtype == np.int32
+        field = np.random.rand(5, 3)
+        projected_32 = apply_transfer_operator(op_32, {"a": field})["a"]
+        assert projected_32.dtype == np.float32
+        # float32 coefficients and fields: relative error of the order of 1e-7
+        assert np.allclose(projected_32, op.dot(field), rtol=1e-6, atol=0.0)
+
+    def test_apply_transfer_operator(self, mesh, nodes):
+        op = compute_transfer_operator(mesh, nodes[::-1])
+        fields = {"a": np.arange(5), "b": np.random.rand(5, 2)}
+        projected = apply_transfer_operator(op, fields)
+        assert projected["a"].shape == (5,)
+        assert projected["b"].shape == (5, 2)
+        for name, field in fields.items():
+            assert np.allclose(projected[name], op.dot(field))
+        assert apply_transfer_operator(op, {}) == {}
+
+    def test_compute_grid_transfer_operator(self, mesh):
+        dimensions, origin, spacing = (9, 11), np.array([-0.25, 0.0]), np.full(2, 0.2)
+        grid_nodes = CreateConstantRectilinearMesh(
+            dimensions=dimensions, origin=origin, spacing=spacing
+        ).nodes
+        op = compute_grid_transfer_operator(mesh, dimensions, origin, spacing)
+        expected_op = compute_transfer_operator(mesh, grid_nodes)
+        assert op.shape == expected_op.shape
+        assert np.allclose(
+            op.dot(mesh.nodeFields["test"]), expected_op.dot(mesh.nodeFields["test"])
+        )
+        assert np.allclose(
+            compute_grid_transfer_operator(
+                mesh, dimensions, origin, spacing, batch_size=7
+            ).toarray(),
+            op.toarray(),
+        )
+
+    def test_compute_grid_transfer_operator_linear_precision(self):
+        mesh = MCT.CreateCube(dimensions=[4, 4, 4], ofTetras=True)
+        dimensions, origin, spacing = (6, 6, 6), np.full(3, -1.0), np.full(3, 0.6)
+        grid_nodes = CreateConstantRectilinearMesh(
+            dimensions=dimensions, origin=origin, spacing=spacing
+        ).nodes
+        op = compute_grid_transfer_operator(mesh, dimensions, origin, spacing)
+        assert np.allclose(op.dot(mesh.nodes), grid_nodes)
+
+    def test_compute_grid_transfer_operator_fallback(self, mesh):
+        dimensions, origin, spacing = (4, 4), np.zeros(2), np.full(2, 0.5)
+        grid_nodes = CreateConstantRectilinearMesh(
+            dimensions=dimensions, origin=origin, spacing=spacing
+        ).nodes
+        op = compute_grid_transfer_operator(
+            mesh, dimensions, origin, spacing, method="Nearest/Nearest"
+        )
+        expected_op = compute_transfer_operator(
+            mesh, grid_nodes, method="Nearest/Nearest"
+        )
+        assert np.allclose(op.toarray(), expected_op.toarray())
+
+    def test_compute_grid_interpolation_operator(self):
+        dimensions, origin, spacing = (4, 3, 5), np.array([0.0, -1.0, 2.0]), np.ones(3)
+        grid_nodes = CreateConstantRectilinearMesh(
+            dimensions=dimensions, origin=origin, spacing=spacing
+        ).nodes
+        points = origin + np.random.rand(20, 3) * (np.array(dimensions) - 1)
+        op = compute_grid_interpolation_operator(points, dimensions, origin, spacing)
+        assert op.shape == (20, 60)
+        # multilinear interpolation reproduces products of affine functions
+        field = (grid_nodes[:, 0] + 1.0) * grid_nodes[:, 1] * grid_nodes[:, 2]
+        assert np.allclose(
+            op.dot(field), (points[:, 0] + 1.0) * points[:, 1] * points[:, 2]
+        )
+        outside = np.array([[-1.0, -1.0, 2.0], [10.0, 0.5, 2.0]])
+        op = compute_grid_interpolation_operator(outside, dimensions, origin, spacing)
+        assert np.allclose(op.dot(grid_nodes), [[0.0, -1.0, 2.0], [3.0, 0.5, 2.0]])
+
+    def test_operator_cache(self, mesh, nodes):
+        cache = OperatorCache(maxsize=1)
+        op_1 = cache.get_or_compute("a", lambda: compute_transfer_operator(mesh, nodes))
+        op_2 = cache.get_or_compute("a", lambda: compute_transfer_operator(mesh, nodes))
+        assert op_1 is op_2
+        assert cache.hits == 1 and cache.misses == 1
+        cache.get_or_compute("b", lambda: compute_transfer_operator(mesh, nodes))
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_operator_cache_on_disk(self, mesh, nodes, tmp_path):
+        op = OperatorCache(cache_dir=tmp_path).get_or_compute(
+            "a", lambda: compute_transfer_operator(mesh, nodes)
+        )
+
+        def fail():
+            raise AssertionError("operator should be loaded from disk")
+
+        cache = OperatorCache(cache_dir=tmp_path)
+        loaded_op = cache.get_or_compute("a", fail)
+        assert np.array_equal(loaded_op.toarray(), op.toarray())
+        assert (cache.hits, cache.disk_hits, cache.misses) == (1, 1, 0)
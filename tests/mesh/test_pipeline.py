@@ -0,0 +1,96 @@
+import pickle
+
+import numpy as np
+import pytest
+from plaid.containers.dataset import Dataset
+
+from plaid_ops.common.conversion import get_mesh_conversion_cache
+from plaid_ops.mesh.feature_engineering import (
+    compute_geometric_features,
+    compute_sdf,
+    update_dataset_with_sdf,
+)
+from plaid_ops.mesh.pipeline import (
+    GeometricFeaturesStage,
+    Pipeline,
+    ReferenceSampleStage,
+    RegularGridStage,
+    SDFStage,
+    Stage,
+)
+from plaid_ops.mesh.transformations import (
+    compute_bounding_box,
+    project_on_other_dataset,
+    project_on_regular_grid,
+)
+
+
+class Test_Pipeline:
+    def test_stage(self):
+        with pytest.raises(TypeError):
+            Stage()
+
+    def test_sdf_stage(self, dataset):
+        updated_dataset = Pipeline([SDFStage()]).run(dataset)
+        expected_dataset = update_dataset_with_sdf(dataset)
+        for id in dataset.get_sample_ids():
+            assert "sdf" not in dataset[id].get_field_names()
+            assert np.allclose(
+                updated_dataset[id].get_field("sdf"),
+                expected_dataset[id].get_field("sdf"),
+            )
+
+    def test_geometric_features_stage(self, dataset):
+        pipeline = Pipeline([GeometricFeaturesStage(), SDFStage(bandwidth=0.2)])
+        updated_dataset = pipeline.run(dataset)
+        for id in dataset.get_sample_ids():
+            expected_fields = compute_geometric_features(dataset[id])
+            expected_fields["sdf"] = compute_sdf(dataset[id], bandwidth=0.2)
+            for fn, field in expected_fields.items():
+                assert np.allclose(updated_dataset[id].get_field(fn), field)
+
+    def test_regular_grid_stage(self, sample_with_tree):
+        dataset = Dataset(samples=[sample_with_tree.copy(), sample_with_tree.copy()])
+        conversion_cache = get_mesh_conversion_cache()
+        conversion_cache.clear()
+        pipeline = Pipeline().add(SDFStage()).add(RegularGridStage((3, 3)))
+        projected_dataset = pipeline.run(dataset)
+        assert conversion_cache.misses == 2
+
+        expected_dataset = project_on_regular_grid(
+            update_dataset_with_sdf(dataset), (3, 3), compute_bounding_box(dataset)
+        )
+        for id in dataset.get_sample_ids():
+            for fn in ("sdf", "test"):
+                assert np.allclose(
+                    projected_dataset[id].get_field(fn),
+                    expected_dataset[id].get_field(fn),
+                )
+
+    def test_reference_sample_stage(self, dataset, sample_with_tree):
+        reference = Dataset(samples=[sample_with_tree])
+        stage = ReferenceSampleStage(sample_with_tree, method="Nearest/Nearest")
+        projected_dataset = Pipeline([stage]).run(dataset)
+        assert len(stage._fingerprinters) == 1
+        assert pickle.loads(pickle.dumps(stage))._fingerprinters == {}
+        expected_dataset = project_on_other_dataset(
+            dataset, reference, method="Nearest/Nearest", join="broadcast"
+        )
+        for id in dataset.get_sample_ids():
+            assert np.allclose(
+                projected_dataset[id].get_field("test"),
+                expected_dataset[id].get_field("test"),
+            )
+
+    def test_run_parallel_in_place(self, sample_with_tree):
+        dataset = Dataset(samples=[sample_with_tree.copy(), sample_with_tree.copy()])
+        pipeline = Pipeline([SDFStage(), RegularGridStage((3, 3))])
+        projected_dataset = pipeline.run(dataset)
+        parallel_projected_dataset = pipeline.run(
+            dataset, in_place=True, n_workers=2, chunksize=1
+        )
+        assert parallel_projected_dataset is dataset
+        for id in dataset.get_sample_ids():
+            assert np.allclose(
+                dataset[id].get_field("sdf"), projected_dataset[id].get_field("sdf")
+            )
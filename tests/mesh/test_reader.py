@@ -0,0 +1,80 @@
+import Muscat.MeshContainers.ElementsDescription as ED
+import numpy as np
+import pytest
+from Muscat.Bridges.CGNSBridge import CGNSToMesh, MeshToCGNS
+from Muscat.MeshContainers.Filters.FilterObjects import ElementFilter
+from Muscat.MeshTools import MeshCreationTools as MCT
+from Muscat.MeshTools.MeshFieldOperations import GetFieldTransferOp
+
+from plaid_ops.common.visualization import _generate_pyvista_mesh
+from plaid_ops.mesh.operators import compute_transfer_operator, prepare_transfer_field
+from plaid_ops.mesh.reader import MeshView, iter_zone_views
+
+
+def _find(node, label):
+    if node[3] == label:
+        return node
+    for child in node[2]:
+        found = _find(child, label)
+        if found is not None:
+            return found
+    return None
+
+
+class Test_Reader:
+    def test_iter_zone_views(self, tree, nodes):
+        (zone,) = iter_zone_views(tree)
+        coordinates = _find(tree, "GridCoordinates_t")
+        assert np.shares_memory(zone.coordinates[0], coordinates[2][0][1])
+        assert np.allclose(np.stack(zone.coordinates, axis=-1), nodes)
+        assert list(zone.node_fields) == ["test"]
+        assert list(iter_zone_views(tree, zone_names=["missing"])) == []
+
+    def test_mesh_view(self, tree, triangles):
+        mesh = CGNSToMesh(tree)
+        mesh_view = MeshView(tree)
+        assert np.allclose(mesh_view.nodes, mesh.nodes)
+        assert np.allclose(mesh_view.nodeFields["test"], mesh.nodeFields["test"])
+        assert np.array_equal(mesh_view.cells()["TRI_3"], triangles)
+
+    def test_mixed_section(self, tree, triangles):
+        elements = _find(tree, "Elements_t")
+        connectivity = elements[2][1][1].reshape(-1, 3)
+        mixed = np.concatenate(
+            [np.full((len(connectivity), 1), 5), connectivity], axis=1
+        ).ravel()
+        elements[1] = np.array([20, 0], dtype=elements[1].dtype)
+        elements[2][1][1] = mixed.astype(connectivity.dtype)
+        assert np.array_equal(MeshView(tree).cells()["TRI_3"], triangles)
+
+        elements[1] = np.array([22, 0], dtype=elements[1].dtype)
+        with pytest.raises(ValueError):
+            MeshView(tree)
+
+    def test_nearest_operator(self, tree):
+        rng = np.random.default_rng(0)
+        grid_nodes = np.concatenate([rng.uniform(0.0, 1.5, size=(20, 2)), [[5.0, 4.0]]])
+        expected, _, _ = GetFieldTransferOp(
+            prepare_transfer_field(CGNSToMesh(tree)),
+            grid_nodes,
+            method="Nearest/Nearest",
+            verbose=False,
+            elementFilter=ElementFilter(),
+        )
+        op = compute_transfer_operator(
+            MeshView(tree), grid_nodes, method="Nearest/Nearest"
+        )
+        assert np.allclose(op.toarray(), expected.toarray())
+
+    def test_generate_pyvista_mesh(self, sample_with_tree):
+        pv_mesh = _generate_pyvista_mesh(sample_with_tree)
+        assert (pv_mesh.n_points, pv_mesh.n_cells) == (5, 3)
+        assert len(pv_mesh.point_data) == 0
+
+    def test_generate_pyvista_mesh_fallback(self, sample):
+        points = np.random.default_rng(0).uniform(size=(20, 3))
+        mesh = MCT.CreateMeshOf(points, np.arange(20)[None], ED.Hexahedron_20)
+        sample.add_tree(MeshToCGNS(mesh))
+        pv_mesh = _generate_pyvista_mesh(sample)
+        assert (pv_mesh.n_points, pv_mesh.n_cells) == (20, 1)
+        assert len(pv_mesh.point_data) == 0
@@ -1,17 +1,323 @@
+import numpy as np
+import pytest
+from Muscat.Bridges.CGNSBridge import MeshToCGNS
+from Muscat.MeshTools import MeshCreationTools as MCT
+from plaid.containers.dataset import Dataset
+from plaid.containers.sample import Sample
+
+from plaid_ops.common.conversion import get_mesh_conversion_cache
+from plaid_ops.mesh.operators import OperatorCache
 from plaid_ops.mesh.transformations import (
+    RegularGridProjector,
     compute_bounding_box,
+    iter_project_on_regular_grid,
+    load_regular_grid_projection,
     project_on_other_dataset,
     project_on_regular_grid,
+    project_on_regular_grid_to_array,
 )
 
 
 class Test_Transformations:
-    def test_compute_bounding_box(self, dataset):
-        compute_bounding_box(dataset)
+    def test_compute_bounding_box(self, dataset, nodes):
+        mins, maxs = compute_bounding_box(dataset)
+        assert np.allclose(mins, nodes.min(axis=0))
+        assert np.allclose(maxs, nodes.max(axis=0))
+        base_name = dataset[0].get_base_names()[0]
+        parallel_bbox = compute_bounding_box(
+            dataset, base_names=[base_name], n_workers=2, chunksize=1
+        )
+        assert np.allclose(parallel_bbox, (mins, maxs))
 
     def test_project_on_regular_grid(self, dataset):
         bbox = compute_bounding_box(dataset)
         project_on_regular_grid(dataset, (3, 3), bbox)
 
+    def test_project_on_regular_grid_structured(self, dataset):
+        bbox = compute_bounding_box(dataset)
+        projected_dataset = project_on_regular_grid(dataset, (5, 7), bbox)
+        structured_projected_dataset = project_on_regular_grid(
+            dataset, (5, 7), bbox, engine="structured"
+        )
+        for id in dataset.get_sample_ids():
+            assert np.allclose(
+                structured_projected_dataset[id].get_field("test"),
+                projected_dataset[id].get_field("test"),
+            )
+
+    def test_project_on_regular_grid_static_mesh(self, sample_with_tree):
+        sample = sample_with_tree.copy()
+        sample.add_tree(sample_with_tree.copy().get_mesh(), time=1.0)
+        sample.add_field("test", 2.0 * np.arange(5), time=1.0)
+        dataset = Dataset(samples=[sample])
+        bbox = compute_bounding_box(dataset)
+        cache = OperatorCache()
+        projected_sample = project_on_regular_grid(
+            dataset, (3, 3), bbox, operator_cache=cache
+        )[0]
+        assert cache.misses == 1 and cache.hits == 1
+        assert projected_sample.get_all_mesh_times() == [0.0, 1.0]
+        assert np.allclose(
+            projected_sample.get_field("test", time=1.0),
+            2.0 * projected_sample.get_field("test", time=0.0),
+        )
+
+    def test_project_on_regular_grid_operator_cache(self, dataset):
+        bbox = compute_bounding_box(dataset)
+        cache = OperatorCache()
+        project_on_regular_grid(dataset, (3, 3), bbox, operator_cache=cache)
+        assert cache.misses == 1 and cache.hits == 1
+        project_on_regular_grid(dataset, (3, 3), bbox, operator_cache=cache)
+        assert cache.misses == 1 and cache.hits == 3
+
+    def test_iter_project_on_regular_grid(self, dataset):
+        bbox = compute_bounding_box(dataset)
+        projected_dataset = project_on_regular_grid(dataset, (3, 3), bbox)
+        iterator = iter_project_on_regular_grid(dataset, (3, 3), bbox)
+        for (id, projected_sample), expected_id in zip(
+            iterator, dataset.get_sample_ids(), strict=True
+        ):
+            assert id == expected_id
+            assert np.allclose(
+                projected_sample.get_field("test"),
+                projected_dataset[id].get_field("test"),
+            )
+
+    def test_project_on_regular_grid_parallel(self, dataset):
+        bbox = compute_bounding_box(dataset)
+        projected_dataset = project_on_regular_grid(dataset, (3, 3), bbox)
+        parallel_projected_dataset = project_on_regular_grid(
+            dataset, (3, 3), bbox, n_workers=2, chunksize=1
+        )
+        assert (
+            parallel_projected_dataset.get_sample_ids()
+            == projected_dataset.get_sample_ids()
+        )
+        for id in dataset.get_sample_ids():
+            assert np.allclose(
+                parallel_projected_dataset[id].get_field("test"),
+                projected_dataset[id].get_field("test"),
+            )
+
+    def test_project_on_regular_grid_to_array(self, dataset, tmp_path):
+        bbox = compute_bounding_box(dataset)
+        projected_dataset = project_on_regular_grid(dataset, (3, 4), bbox)
+        tensor, index = project_on_regular_grid_to_array(
+            dataset, (3, 4), bbox, field_names=["test", "missing"]
+        )
+        assert tensor.shape == (2, 1, 2, 3, 4)
+        assert index["sample_ids"] == dataset.get_sample_ids()
+        assert index["field_names"] == ["test", "missing"]
+        assert index["times"] == [[0.0], [0.0]]
+        for i, id in enumerate(index["sample_ids"]):
+            assert np.allclose(
+                tensor[i, 0, 0].ravel(), projected_dataset[id].get_field("test")
+            )
+        assert np.all(np.isnan(tensor[:, :, 1]))
+
+        path = tmp_path / "projection.npy"
+        project_on_regular_grid_to_array(dataset, (3, 4), bbox, path=path)
+        loaded_tensor, loaded_index = load_regular_grid_projection(path)
+        assert isinstance(loaded_tensor, np.memmap)
+        assert loaded_index["field_names"] == ["OriginalIds", "test"]
+        assert np.allclose(loaded_tensor[:, :, 1], tensor[:, :, 0])
+
+    def test_project_on_regular_grid_to_array_float32(self, dataset):
+        bbox = compute_bounding_box(dataset)
+        tensor, _ = project_on_regular_grid_to_array(dataset, (5, 7), bbox)
+        for engine in ("muscat", "structured"):
+            tensor_32, _ = project_on_regular_grid_to_array(
+                dataset, (5, 7), bbox, engine=engine, dtype=np.float32
+            )
+            assert tensor_32.dtype == np.float32
+            assert np.allclose(tensor_32, tensor, rtol=1e-6, atol=1e-6)
+
+    def test_project_on_regular_grid_to_array_tiled(self, dataset, tmp_path):
+        bbox = compute_bounding_box(dataset)
+        tensor, _ = project_on_regular_grid_to_array(dataset, (5, 7), bbox)
+        conversion_cache = get_mesh_conversion_cache()
+        for engine in ("muscat", "structured"):
+            cache = OperatorCache()
+            conversion_cache.clear()
+            tiled_tensor, _ = project_on_regular_grid_to_array(
+                dataset,
+                (5, 7),
+                bbox,
+                engine=engine,
+                tile_shape=(2, 3),
+                operator_cache=cache,
+            )
+            assert np.allclose(tiled_tensor, tensor)
+            assert cache.misses == 9 and cache.hits == 9
+            assert conversion_cache.misses == 1
+        parallel_tiled_tensor, _ = project_on_regular_grid_to_array(
+            dataset, (5, 7), bbox, tile_shape=(4, 4), n_workers=2, chunksize=1
+        )
+        assert np.allclose(parallel_tiled_tensor, tensor)
+        path = tmp_path / "projection.npy"
+        project_on_regular_grid_to_array(
+            dataset, (5, 7), bbox, path=path, tile_shape=(4, 4), n_workers=2
+        )
+        assert np.allclose(load_regular_grid_projection(path)[0], tensor)
+
     def test_project_on_other_dataset(self, dataset):
         project_on_other_dataset(dataset, dataset)
+
+    def test_project_on_other_dataset_inner_join(self, sample_with_tree):
+        dataset_source = Dataset()
+        dataset_target = Dataset()
+        for id in (0, 1, 2):
+            dataset_source.add_sample(sample_with_tree.copy(), id)
+        for id in (2, 1, 5):
+            dataset_target.add_sample(sample_with_tree.copy(), id)
+        projected_dataset = project_on_other_dataset(
+            dataset_source, dataset_target, join="inner"
+        )
+        assert projected_dataset.get_sample_ids() == [1, 2]
+        project_on_other_dataset(
+            dataset_source, dataset_target, join="inner", in_place=True
+        )
+        assert sorted(dataset_target.get_sample_ids()) == [1, 2, 5]
+
+    def test_project_on_other_dataset_broadcast(self, sample_with_tree):
+        dataset_source = Dataset()
+        for id in (3, 4, 7):
+            sample = sample_with_tree.copy()
+            sample.add_field("test", id * np.arange(5), warning_overwrite=False)
+            dataset_source.add_sample(sample, id)
+        reference = sample_with_tree.copy()
+        dataset_target = Dataset(samples=[reference])
+        reference_field = reference.get_field("test").copy()
+        conversion_cache = get_mesh_conversion_cache()
+        for keep_trees in (False, True):
+            cache = OperatorCache()
+            conversion_cache.clear()
+            projected_dataset = project_on_other_dataset(
+                dataset_source,
+                dataset_target,
+                join="broadcast",
+                operator_cache=cache,
+                keep_trees=keep_trees,
+            )
+            assert cache.misses == 1 and cache.hits == 2
+            assert conversion_cache.misses == (3 if keep_trees else 4)
+            assert projected_dataset.get_sample_ids() == [3, 4, 7]
+            for id in (3, 4, 7):
+                assert np.allclose(
+                    projected_dataset[id].get_field("test"), id * np.arange(5)
+                )
+            assert np.allclose(reference.get_field("test"), reference_field)
+        with pytest.raises(AssertionError):
+            project_on_other_dataset(
+                dataset_source, dataset_target, join="broadcast", in_place=True
+            )
+
+    def test_project_on_other_dataset_parallel(self, sample_with_tree):
+        dataset = Dataset(samples=[sample_with_tree.copy(), sample_with_tree.copy()])
+        projected_dataset = project_on_other_dataset(dataset, dataset)
+        for keep_trees in (False, True):
+            target_dataset = dataset.copy()
+            for sample in target_dataset:
+                sample.add_field("test", np.zeros(5), warning_overwrite=False)
+            parallel_projected_dataset = project_on_other_dataset(
+                dataset,
+                target_dataset,
+                in_place=True,
+                keep_trees=keep_trees,
+                n_workers=2,
+                chunksize=1,
+            )
+            assert parallel_projected_dataset is target_dataset
+            for id in dataset.get_sample_ids():
+                assert np.allclose(
+                    target_dataset[id].get_field("test"),
+                    projected_dataset[id].get_field("test"),
+                )
+
+    def test_project_on_other_dataset_keep_trees(self, sample_with_tree):
+        dataset = Dataset(samples=[sample_with_tree.copy(), sample_with_tree.copy()])
+        projected_dataset = project_on_other_dataset(dataset, dataset)
+        target_dataset = Dataset(
+            samples=[sample_with_tree.copy(), sample_with_tree.copy()]
+        )
+        for sample in target_dataset:
+            sample.add_field("stale", np.ones(5))
+        trees = [sample.get_mesh() for sample in target_dataset]
+        project_on_other_dataset(
+            dataset, target_dataset, in_place=True, keep_trees=True
+        )
+        for i, id in enumerate(dataset.get_sample_ids()):
+            sample = target_dataset[id]
+            assert sample.get_mesh() is trees[i]
+            assert "stale" not in sample.get_field_names()
+            assert np.allclose(
+                sample.get_field("test"), projected_dataset[id].get_field("test")
+            )
+
+    def test_project_on_other_dataset_float32(self, dataset):
+        projected_dataset = project_on_other_dataset(dataset, dataset)
+        projected_dataset_32 = project_on_other_dataset(
+            dataset, dataset, dtype=np.float32
+        )
+        for id in dataset.get_sample_ids():
+            field_32 = projected_dataset_32[id].get_field("test")
+            assert field_32.dtype == np.float32
+            assert np.allclose(
+                field_32, projected_dataset[id].get_field("test"), rtol=1e-6
+            )
+
+    def test_project_on_other_dataset_static_mesh(self, sample_with_tree):
+        sample = sample_with_tree.copy()
+        for time in (1.0, 2.0):
+            sample.add_tree(sample_with_tree.copy().get_mesh(), time=time)
+            sample.add_field("test", np.arange(5) + time, time=time)
+        dataset = Dataset(samples=[sample])
+        cache = OperatorCache()
+        projected_dataset = project_on_other_dataset(
+            dataset, dataset, operator_cache=cache
+        )
+        assert cache.misses == 1 and cache.hits == 2
+        projected_sample = projected_dataset[0]
+        assert projected_sample.get_all_mesh_times() == [0.0, 1.0, 2.0]
+        for time in (0.0, 1.0, 2.0):
+            assert np.allclose(
+                projected_sample.get_field("test", time=time), np.arange(5) + time
+            )
+
+    def test_project_on_other_dataset_operator_cache(self, sample_with_tree, tmp_path):
+        dataset = Dataset(samples=[sample_with_tree.copy(), sample_with_tree.copy()])
+        cache = OperatorCache(cache_dir=tmp_path)
+        project_on_other_dataset(dataset, dataset, operator_cache=cache)
+        assert cache.misses == 1 and cache.hits == 1
+
+    def test_regular_grid_projector(self, dataset):
+        bbox = compute_bounding_box(dataset)
+        projected_dataset = project_on_regular_grid(dataset, (5, 7), bbox)
+        id = dataset.get_sample_ids()[0]
+        cache = OperatorCache()
+        projector = RegularGridProjector(
+            dataset[id], (5, 7), bbox, operator_cache=cache
+        )
+        field = dataset[id].get_field("test")
+        grid_field = projector.forward(field)
+        assert np.allclose(grid_field, projected_dataset[id].get_field("test"))
+        assert np.allclose(projector.forward({"test": field})["test"], grid_field)
+        assert projector.backward(grid_field).shape == field.shape
+        assert np.allclose(
+            projector.backward(grid_field.reshape(5, 7)),
+            projector.backward({"test": grid_field})["test"],
+        )
+        RegularGridProjector(dataset[id], (5, 7), bbox, operator_cache=cache)
+        assert cache.misses == 1 and cache.hits == 1
+
+    def test_regular_grid_projector_round_trip(self):
+        mesh = MCT.CreateSquare(dimensions=[6, 6], ofTriangles=True)
+        sample = Sample()
+        sample.add_tree(MeshToCGNS(mesh))
+        bbox = (mesh.nodes.min(axis=0), mesh.nodes.max(axis=0))
+        projector = RegularGridProjector(sample, (9, 9), bbox, engine="structured")
+        fields = np.column_stack(
+            (mesh.nodes[:, 0] + 2.0 * mesh.nodes[:, 1], np.ones(len(mesh.nodes)))
+        )
+        # both directions are exact for affine fields
+        assert np.allclose(projector.backward(projector.forward(fields)), fields)